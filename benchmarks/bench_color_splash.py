@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+API calls made by /color_splash/ before and after resolving target views once
+
+Builds a synthetic model on the fake Revit API (benchmarks/fake_revit.py)
+and colors one category by a parameter in two ways:
+
+- legacy: the override loop color_elements_by_parameter had before, i.e.
+  doc.ActiveView and a FilteredElementCollector over every view for each
+  element
+- current: the real color_elements_by_parameter from revit_mcp/colors.py
+  with apply_to="same_view_type"
+
+It reports collector passes, elements scanned, ActiveView reads,
+OverrideGraphicSettings built and SetElementOverrides calls for each, and
+checks that both override the same number of (view, element) pairs.
+
+Run from the repository root:
+
+    python benchmarks/bench_color_splash.py --elements 5000 --views 200
+
+The legacy loop scans the whole model once per element, so its run time
+grows with elements x (elements + views); keep the sizes moderate.
+"""
+
+import argparse
+import itertools
+import time
+
+import fake_revit
+
+fake_revit.install()
+
+from pyrevit import DB  # noqa: E402
+from revit_mcp import colors  # noqa: E402
+from cache import result_cache  # noqa: E402
+
+VIEW_TYPES = ("FloorPlan", "CeilingPlan", "Elevation", "Section")
+
+
+def build_model(elements, views, values=12):
+    doc = fake_revit.FakeDocument()
+    walls = doc.category("OST_Walls", "Walls")
+    for i in range(elements):
+        wall = fake_revit.FamilyInstance(doc, walls)
+        wall.set_parameter("Comments", DB.StorageType.String, "Group {}".format(i % values))
+        doc.add(wall)
+
+    doc.add(fake_revit.FillPatternElement(doc, None, "<Solid fill>"))
+
+    view_category = doc.category("OST_Views", "Views")
+    view_types = itertools.cycle(VIEW_TYPES)
+    for i in range(views):
+        view = doc.add(
+            fake_revit.View(
+                doc, view_category, "View {}".format(i),
+                getattr(DB.ViewType, next(view_types)),
+                is_template=(i % 25 == 1),
+            )
+        )
+        if i == 0:
+            doc.set_active_view(view)
+    return doc
+
+
+def _group_by_parameter(doc, parameter_name):
+    elements = (
+        DB.FilteredElementCollector(doc)
+        .OfCategory(DB.BuiltInCategory.OST_Walls)
+        .WhereElementIsNotElementType()
+        .ToElements()
+    )
+    resolver = colors.ParameterResolver(parameter_name)
+    groups = {}
+    for element in elements:
+        groups.setdefault(resolver.value_for(element)[1], []).append(element)
+    return groups
+
+
+def legacy_color_splash(doc, parameter_name):
+    """Override loop of color_elements_by_parameter before views were resolved once"""
+    groups = _group_by_parameter(doc, parameter_name)
+    palette = colors.generate_distinct_colors(len(groups))
+    solid_fill_id = colors.solid_fill_pattern_id(doc)
+    elements_colored = 0
+
+    for color, value in zip(palette, sorted(groups)):
+        override_settings = DB.OverrideGraphicSettings()
+        override_settings.SetProjectionLineColor(color)
+        if solid_fill_id is not None:
+            override_settings.SetSurfaceForegroundPatternId(solid_fill_id)
+
+        for element in groups[value]:
+            active_view = doc.ActiveView
+            active_view.SetElementOverrides(element.Id, override_settings)
+            elements_colored += 1
+
+            view_type = active_view.ViewType
+            other_views = (
+                DB.FilteredElementCollector(doc)
+                .OfClass(DB.View)
+                .WhereElementIsNotElementType()
+            )
+            for view in other_views:
+                if (
+                    not view.IsTemplate
+                    and view.ViewType == view_type
+                    and view.Id != active_view.Id
+                ):
+                    view.SetElementOverrides(element.Id, override_settings)
+
+    return elements_colored
+
+
+def current_color_splash(doc, parameter_name):
+    result_cache.invalidate()
+    result = colors.color_elements_by_parameter(
+        doc, "Walls", parameter_name, apply_to="same_view_type"
+    )
+    if result["status"] != "success":
+        raise RuntimeError(result["message"])
+    return result["statistics"]["elements_colored"]
+
+
+def measure(func, doc):
+    fake_revit.reset_stats()
+    start = time.perf_counter()
+    elements_colored = func(doc, "Comments")
+    elapsed = time.perf_counter() - start
+    return elements_colored, {
+        "collector_passes": fake_revit.stats["collector_passes"],
+        "elements_scanned": fake_revit.stats["elements_scanned"],
+        "ActiveView": fake_revit.stats["ActiveView"],
+        "OverrideGraphicSettings": fake_revit.stats["OverrideGraphicSettings"],
+        "SetElementOverrides": fake_revit.stats["SetElementOverrides"],
+        "ms": elapsed * 1000.0,
+    }
+
+
+def run(elements, views):
+    doc = build_model(elements, views)
+    legacy_colored, legacy = measure(legacy_color_splash, doc)
+    current_colored, current = measure(current_color_splash, doc)
+    if legacy_colored != current_colored:
+        raise AssertionError(
+            "Colored element counts differ: legacy {}, current {}".format(
+                legacy_colored, current_colored
+            )
+        )
+    if legacy["SetElementOverrides"] != current["SetElementOverrides"]:
+        raise AssertionError(
+            "Override counts differ: legacy {}, current {}".format(
+                legacy["SetElementOverrides"], current["SetElementOverrides"]
+            )
+        )
+
+    print(
+        "/color_splash/ on {} walls and {} views (same_view_type)".format(
+            elements, views
+        )
+    )
+    print("  {:<9} {:>16} {:>16} {:>11} {:>14} {:>19} {:>10}".format(
+        "", "collector passes", "elements scanned", "ActiveView",
+        "override sets", "SetElementOverrides", "fake ms",
+    ))
+    for name, result in (("legacy", legacy), ("current", current)):
+        print(
+            "  {:<9} {:>16} {:>16} {:>11} {:>14} {:>19} {:>10.1f}".format(
+                name,
+                result["collector_passes"],
+                result["elements_scanned"],
+                result["ActiveView"],
+                result["OverrideGraphicSettings"],
+                result["SetElementOverrides"],
+                result["ms"],
+            )
+        )
+    print("  overrides identical: yes")
+    return legacy, current
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--elements", type=int, default=5000)
+    parser.add_argument("--views", type=int, default=200)
+    args = parser.parse_args()
+    run(args.elements, args.views)
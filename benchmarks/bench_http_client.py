@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Per-call latency of a client per call versus the shared pooled client
+
+Starts a stub HTTP/1.1 server on localhost that answers like /list_levels/,
+then times sequential GETs two ways:
+
+- per_call: a new httpx.AsyncClient for every request, as _revit_call did
+  before the shared client
+- pooled: main.revit_get, which reuses the keep-alive client from
+  _get_client()
+
+Run from the repository root:
+
+    python benchmarks/bench_http_client.py --calls 300
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+STUB_BODY = json.dumps(
+    {"levels": [{"name": "Level {}".format(i), "elevation": i * 3.0} for i in range(8)]}
+).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a small JSON body over a keep-alive connection"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this, delayed ACKs
+    # add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STUB_BODY)))
+        self.end_headers()
+        self.wfile.write(STUB_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+async def per_call(base_url, endpoint, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+            response = await client.get(endpoint)
+            response.json()
+    return time.perf_counter() - start
+
+
+async def pooled(endpoint, calls):
+    # Warm up the pool so connection setup is not counted, as in a long session
+    await main.revit_get(endpoint)
+    start = time.perf_counter()
+    for _ in range(calls):
+        result = await main.revit_get(endpoint)
+        if isinstance(result, str):
+            raise RuntimeError(result)
+    elapsed = time.perf_counter() - start
+    await main._get_client().aclose()
+    return elapsed
+
+
+def run(calls):
+    # main configures INFO logging, which would log every request
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    server = start_stub_server()
+    base_url = "http://127.0.0.1:{}/revit_mcp".format(server.server_address[1])
+    main.BASE_URL = base_url
+    main._http_client = None
+    endpoint = "/list_levels/"
+    try:
+        results = {
+            "per_call": asyncio.run(per_call(base_url, endpoint, calls)),
+            "pooled": asyncio.run(pooled(endpoint, calls)),
+        }
+    finally:
+        server.shutdown()
+
+    print("{} sequential GET {} against a local stub server".format(calls, endpoint))
+    for name, elapsed in results.items():
+        print("  {:<9} {:8.3f} ms/call".format(name, elapsed * 1000.0 / calls))
+    print("  speedup   {:8.1f}x".format(results["per_call"] / results["pooled"]))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=300)
+    run(parser.parse_args().calls)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Passes over the model made by /model_info/ before and after single-pass counting
+
+Builds a synthetic model on the fake Revit API (benchmarks/fake_revit.py)
+and runs two things against it:
+
+- legacy: the access pattern get_model_info had before, i.e. one collector
+  per counted category, separate collectors for levels, rooms, sheets and
+  views, and five sum() passes over the view list
+- current: the real /model_info/ route handler from revit_mcp/model_info.py
+
+It reports collector passes, elements scanned and list passes for each, and
+checks that both produce the same counts.
+
+Run from the repository root:
+
+    python benchmarks/bench_model_info.py --per-category 2000 --views 400
+"""
+
+import argparse
+import itertools
+import time
+
+import fake_revit
+
+fake_revit.install()
+
+from pyrevit import DB, revit  # noqa: E402
+from model_info import register_model_info_routes  # noqa: E402
+from cache import result_cache  # noqa: E402
+
+COUNTED_CATEGORIES = {
+    "Walls": "OST_Walls",
+    "Floors": "OST_Floors",
+    "Ceilings": "OST_Ceilings",
+    "Roofs": "OST_Roofs",
+    "Doors": "OST_Doors",
+    "Windows": "OST_Windows",
+    "Stairs": "OST_Stairs",
+    "Railings": "OST_Railings",
+    "Columns": "OST_Columns",
+    "Structural_Framing": "OST_StructuralFraming",
+    "Furniture": "OST_Furniture",
+    "Lighting_Fixtures": "OST_LightingFixtures",
+    "Plumbing_Fixtures": "OST_PlumbingFixtures",
+}
+
+VIEW_TYPES = ("FloorPlan", "CeilingPlan", "Elevation", "Section", "ThreeD", "Schedule")
+
+
+def build_model(per_category, views, levels=10, rooms=200, sheets=60, other=5000):
+    doc = fake_revit.FakeDocument()
+    for index, builtin_name in enumerate(sorted(COUNTED_CATEGORIES.values())):
+        category = doc.category(builtin_name)
+        # Vary the counts so a mix-up between categories would show
+        for _ in range(per_category + index):
+            doc.add(fake_revit.FamilyInstance(doc, category))
+
+    generic = doc.category("OST_GenericModel")
+    for _ in range(other):
+        doc.add(fake_revit.FamilyInstance(doc, generic))
+
+    level_category = doc.category("OST_Levels")
+    level_ids = []
+    for i in range(levels):
+        level = doc.add(
+            fake_revit.Level(doc, level_category, "Level {}".format(i), i * 3.5)
+        )
+        level_ids.append(level.Id)
+
+    room_category = doc.category("OST_Rooms")
+    for i in range(rooms):
+        room = fake_revit.Room(
+            doc, room_category, "Room {}".format(i), 0.0 if i % 20 == 0 else 25.0,
+            level_id=level_ids[i % levels],
+        )
+        room.set_parameter("Name", DB.StorageType.String, "Room {}".format(i))
+        room.set_parameter("Number", DB.StorageType.String, str(i))
+        doc.add(room)
+
+    view_category = doc.category("OST_Views")
+    view_types = itertools.cycle(VIEW_TYPES)
+    for i in range(views):
+        doc.add(
+            fake_revit.View(
+                doc, view_category, "View {}".format(i), getattr(DB.ViewType, next(view_types)),
+                is_template=(i % 25 == 0),
+            )
+        )
+
+    sheet_category = doc.category("OST_Sheets")
+    for i in range(sheets):
+        doc.add(
+            fake_revit.ViewSheet(
+                doc, sheet_category, "Sheet {}".format(i), DB.ViewType.DrawingSheet
+            )
+        )
+    return doc
+
+
+def legacy_model_info(doc):
+    """Counting pattern of get_model_info before single-pass counting"""
+    list_passes = 0
+
+    element_counts = {}
+    for name, builtin_name in COUNTED_CATEGORIES.items():
+        element_counts[name] = (
+            DB.FilteredElementCollector(doc)
+            .OfCategory(getattr(DB.BuiltInCategory, builtin_name))
+            .WhereElementIsNotElementType()
+            .GetElementCount()
+        )
+
+    levels = (
+        DB.FilteredElementCollector(doc)
+        .OfCategory(DB.BuiltInCategory.OST_Levels)
+        .WhereElementIsNotElementType()
+        .ToElements()
+    )
+    rooms = (
+        DB.FilteredElementCollector(doc)
+        .OfCategory(DB.BuiltInCategory.OST_Rooms)
+        .WhereElementIsNotElementType()
+        .ToElements()
+    )
+    sheets_count = (
+        DB.FilteredElementCollector(doc)
+        .OfCategory(DB.BuiltInCategory.OST_Sheets)
+        .WhereElementIsNotElementType()
+        .GetElementCount()
+    )
+    all_views = DB.FilteredElementCollector(doc).OfClass(DB.View).ToElements()
+
+    list_passes += 1
+    valid_views = [
+        v
+        for v in all_views
+        if not v.IsTemplate
+        and v.ViewType != DB.ViewType.Internal
+        and v.ViewType != DB.ViewType.ProjectBrowser
+    ]
+    breakdown = {}
+    for key, view_type in (
+        ("floor_plans", DB.ViewType.FloorPlan),
+        ("elevations", DB.ViewType.Elevation),
+        ("sections", DB.ViewType.Section),
+        ("3d_views", DB.ViewType.ThreeD),
+        ("schedules", DB.ViewType.Schedule),
+    ):
+        list_passes += 1
+        breakdown[key] = sum(1 for v in valid_views if v.ViewType == view_type)
+
+    summary = {
+        "by_category": element_counts,
+        "levels": len(levels),
+        "rooms": len(rooms),
+        "total_views": len(valid_views),
+        "view_breakdown": breakdown,
+        "sheets_count": sheets_count,
+    }
+    return summary, list_passes
+
+
+def current_model_info(doc):
+    api = fake_revit.FakeAPI()
+    register_model_info_routes(api)
+    revit.doc = doc
+    result_cache.invalidate()
+    data = api.handlers["/model_info/"]().data
+    summary = {
+        "by_category": data["element_summary"]["by_category"],
+        "levels": len(data["spatial_organization"]["levels"]),
+        "rooms": data["spatial_organization"]["room_count"],
+        "total_views": data["documentation"]["total_views"],
+        "view_breakdown": data["documentation"]["view_breakdown"],
+        "sheets_count": data["documentation"]["sheets_count"],
+    }
+    # The route has no passes over intermediate lists
+    return summary, 0
+
+
+def measure(func, doc):
+    fake_revit.reset_stats()
+    start = time.perf_counter()
+    summary, list_passes = func(doc)
+    elapsed = time.perf_counter() - start
+    return summary, {
+        "collector_passes": fake_revit.stats["collector_passes"],
+        "elements_scanned": fake_revit.stats["elements_scanned"],
+        "list_passes": list_passes,
+        "ms": elapsed * 1000.0,
+    }
+
+
+def run(per_category, views):
+    doc = build_model(per_category, views)
+    legacy_summary, legacy = measure(legacy_model_info, doc)
+    current_summary, current = measure(current_model_info, doc)
+    if legacy_summary != current_summary:
+        raise AssertionError(
+            "Counts differ:\n  legacy  {}\n  current {}".format(legacy_summary, current_summary)
+        )
+
+    print(
+        "/model_info/ on a synthetic model of {} elements ({} views)".format(
+            len(doc.elements), views
+        )
+    )
+    print("  {:<9} {:>16} {:>16} {:>11} {:>10}".format(
+        "", "collector passes", "elements scanned", "list passes", "fake ms"
+    ))
+    for name, result in (("legacy", legacy), ("current", current)):
+        print(
+            "  {:<9} {:>16} {:>16} {:>11} {:>10.1f}".format(
+                name,
+                result["collector_passes"],
+                result["elements_scanned"],
+                result["list_passes"],
+                result["ms"],
+            )
+        )
+    print("  counts identical: yes")
+    return legacy, current
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--per-category", type=int, default=2000)
+    parser.add_argument("--views", type=int, default=400)
+    args = parser.parse_args()
+    run(args.per_category, args.views)
@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+"""
+Fake Revit API used by the benchmarks
+
+install() registers stand-ins for pyrevit, System and the Revit DB
+namespace in sys.modules, so the IronPython route modules in revit_mcp/
+import on plain CPython. FakeDocument holds a synthetic model. Collector
+evaluations, elements scanned and the API calls the benchmarks care about
+(SetElementOverrides, ActiveView, GetElement, ...) are counted in `stats`.
+
+Only the parts of the API the benchmarked code paths touch are modelled.
+"""
+
+import collections
+import itertools
+import os
+import sys
+import types
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+stats = collections.Counter()
+
+
+def reset_stats():
+    stats.clear()
+
+
+# ============ ENUMS ============
+
+_enum_values = itertools.count(-2000000, -1)
+
+
+class EnumValue(int):
+    """Enum member; an int so ElementId(BuiltInCategory.X) works"""
+
+    def __new__(cls, enum_name, name):
+        value = int.__new__(cls, next(_enum_values))
+        value.enum_name = enum_name
+        value.name = name
+        return value
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return "{}.{}".format(self.enum_name, self.name)
+
+
+class Enum(object):
+    """Enum namespace whose members are created on first access"""
+
+    def __init__(self, name):
+        self._name = name
+        self._members = {}
+
+    def __getattr__(self, member):
+        if member.startswith("_"):
+            raise AttributeError(member)
+        if member not in self._members:
+            self._members[member] = EnumValue(self._name, member)
+        return self._members[member]
+
+
+BuiltInCategory = Enum("BuiltInCategory")
+BuiltInParameter = Enum("BuiltInParameter")
+ViewType = Enum("ViewType")
+WarningType = Enum("WarningType")
+StorageType = Enum("StorageType")
+
+
+# ============ IDS, CATEGORIES, PARAMETERS ============
+
+
+class ElementId(object):
+    def __init__(self, value):
+        self.IntegerValue = int(value)
+
+    def __eq__(self, other):
+        return isinstance(other, ElementId) and other.IntegerValue == self.IntegerValue
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.IntegerValue)
+
+    def __repr__(self):
+        return "ElementId({})".format(self.IntegerValue)
+
+
+ElementId.InvalidElementId = ElementId(-1)
+
+
+class Category(object):
+    def __init__(self, name, builtin):
+        self.Name = name
+        self.BuiltInCategory = builtin
+        self.Id = ElementId(builtin)
+
+
+class Definition(object):
+    def __init__(self, name):
+        self.Name = name
+
+
+class Parameter(object):
+    def __init__(self, name, storage_type, value):
+        self.Definition = Definition(name)
+        self.StorageType = storage_type
+        self.value = value
+        self.HasValue = value is not None
+
+    def AsString(self):
+        return self.value
+
+    def AsInteger(self):
+        return int(self.value)
+
+    def AsDouble(self):
+        return float(self.value)
+
+    def AsElementId(self):
+        return self.value
+
+    def AsValueString(self):
+        return None if self.value is None else str(self.value)
+
+
+# ============ ELEMENTS ============
+
+
+class Element(object):
+    is_type = False
+
+    def __init__(self, doc, category=None, name="", type_id=None, level_id=None):
+        self.Document = doc
+        self.Id = doc.new_id()
+        self.Category = category
+        self.Name = name
+        self.LevelId = level_id or ElementId.InvalidElementId
+        self._type_id = type_id or ElementId.InvalidElementId
+        self.parameters = {}
+
+    def GetTypeId(self):
+        return self._type_id
+
+    def LookupParameter(self, name):
+        stats["LookupParameter"] += 1
+        return self.parameters.get(name)
+
+    def get_Parameter(self, key):
+        stats["get_Parameter"] += 1
+        if isinstance(key, Definition):
+            return self.parameters.get(key.Name)
+        return None
+
+    def set_parameter(self, name, storage_type, value):
+        self.parameters[name] = Parameter(name, storage_type, value)
+
+
+class ElementType(Element):
+    is_type = True
+
+
+class FamilyInstance(Element):
+    pass
+
+
+class Level(Element):
+    def __init__(self, doc, category, name, elevation):
+        Element.__init__(self, doc, category, name)
+        self.Elevation = elevation
+
+
+class Room(Element):
+    def __init__(self, doc, category, name, area, level_id=None):
+        Element.__init__(self, doc, category, name, level_id=level_id)
+        self.Area = area
+
+
+class View(Element):
+    def __init__(self, doc, category, name, view_type, is_template=False):
+        Element.__init__(self, doc, category, name)
+        self.ViewType = view_type
+        self.IsTemplate = is_template
+
+    def AreGraphicsOverridesAllowed(self):
+        return True
+
+    def SetElementOverrides(self, element_id, settings):
+        stats["SetElementOverrides"] += 1
+
+
+class ViewSheet(View):
+    pass
+
+
+class _FillPattern(object):
+    IsSolidFill = True
+
+
+class FillPatternElement(Element):
+    def GetFillPattern(self):
+        return _FillPattern()
+
+
+# ============ FILTERS AND COLLECTORS ============
+
+
+class ElementFilter(object):
+    def passes(self, element):
+        raise NotImplementedError
+
+
+class ElementCategoryFilter(ElementFilter):
+    def __init__(self, category):
+        self.category_id = category if isinstance(category, ElementId) else ElementId(category)
+
+    def passes(self, element):
+        return element.Category is not None and element.Category.Id == self.category_id
+
+
+class ElementClassFilter(ElementFilter):
+    def __init__(self, cls):
+        self.cls = cls
+
+    def passes(self, element):
+        return isinstance(element, self.cls)
+
+
+class LogicalOrFilter(ElementFilter):
+    def __init__(self, *filters):
+        self.filters = list(filters[0]) if len(filters) == 1 else list(filters)
+
+    def passes(self, element):
+        return any(f.passes(element) for f in self.filters)
+
+
+class LogicalAndFilter(LogicalOrFilter):
+    def passes(self, element):
+        return all(f.passes(element) for f in self.filters)
+
+
+class FilteredElementCollector(object):
+    """
+    Collector evaluated lazily, like Revit's
+
+    Every evaluation (iteration, ToElements, GetElementCount, ...) counts
+    one pass over the model in stats["collector_passes"] and the elements
+    it had to test in stats["elements_scanned"].
+    """
+
+    def __init__(self, doc, view_id=None):
+        stats["collectors"] += 1
+        self._doc = doc
+        self._tests = []
+
+    def _add(self, test):
+        self._tests.append(test)
+        return self
+
+    def WherePasses(self, element_filter):
+        return self._add(element_filter.passes)
+
+    def OfCategory(self, builtin):
+        return self.WherePasses(ElementCategoryFilter(builtin))
+
+    def OfCategoryId(self, category_id):
+        return self.WherePasses(ElementCategoryFilter(category_id))
+
+    def OfClass(self, cls):
+        return self.WherePasses(ElementClassFilter(cls))
+
+    def WhereElementIsNotElementType(self):
+        return self._add(lambda element: not element.is_type)
+
+    def WhereElementIsElementType(self):
+        return self._add(lambda element: element.is_type)
+
+    def _evaluate(self):
+        stats["collector_passes"] += 1
+        stats["elements_scanned"] += len(self._doc.elements)
+        return [
+            element
+            for element in self._doc.elements
+            if all(test(element) for test in self._tests)
+        ]
+
+    def ToElements(self):
+        return self._evaluate()
+
+    def ToElementIds(self):
+        return [element.Id for element in self._evaluate()]
+
+    def GetElementCount(self):
+        return len(self._evaluate())
+
+    def FirstElement(self):
+        elements = self._evaluate()
+        return elements[0] if elements else None
+
+    def __iter__(self):
+        return iter(self._evaluate())
+
+
+# ============ GRAPHICS AND TRANSACTIONS ============
+
+
+class Color(object):
+    def __init__(self, red, green, blue):
+        self.Red = red
+        self.Green = green
+        self.Blue = blue
+
+
+class OverrideGraphicSettings(object):
+    def __init__(self):
+        stats["OverrideGraphicSettings"] += 1
+
+    def __getattr__(self, name):
+        if name.startswith("Set"):
+            return lambda *args: None
+        raise AttributeError(name)
+
+
+class Transaction(object):
+    def __init__(self, doc, name=None):
+        self.name = name
+        self._state = None
+
+    def Start(self):
+        self._state = "started"
+
+    def Commit(self):
+        self._state = "committed"
+
+    def RollBack(self):
+        self._state = "rolled_back"
+
+    def HasStarted(self):
+        return self._state is not None
+
+    def HasEnded(self):
+        return self._state in ("committed", "rolled_back")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+# ============ DOCUMENT ============
+
+
+class _Settings(object):
+    def __init__(self, doc):
+        self._doc = doc
+
+    @property
+    def Categories(self):
+        return list(self._doc.categories.values())
+
+
+class FakeDocument(object):
+    """Synthetic model; add elements with add() after creating them"""
+
+    def __init__(self, title="Synthetic model"):
+        self.Title = title
+        self.IsReadOnly = False
+        self.elements = []
+        self.categories = {}
+        self.Settings = _Settings(self)
+        self._by_id = {}
+        self._ids = itertools.count(100000)
+        self._active_view = None
+
+    def new_id(self):
+        return ElementId(next(self._ids))
+
+    def category(self, builtin_name, display_name=None):
+        """Get or create the category for a BuiltInCategory name like "OST_Walls" """
+        if builtin_name not in self.categories:
+            self.categories[builtin_name] = Category(
+                display_name or builtin_name[4:], getattr(BuiltInCategory, builtin_name)
+            )
+        return self.categories[builtin_name]
+
+    def add(self, element):
+        self.elements.append(element)
+        self._by_id[element.Id.IntegerValue] = element
+        return element
+
+    def set_active_view(self, view):
+        self._active_view = view
+
+    @property
+    def ActiveView(self):
+        stats["ActiveView"] += 1
+        return self._active_view
+
+    def GetElement(self, element_id):
+        stats["GetElement"] += 1
+        return self._by_id.get(element_id.IntegerValue)
+
+    def GetWarnings(self):
+        return []
+
+    def GetHashCode(self):
+        return id(self)
+
+
+# ============ MODULE REGISTRATION ============
+
+
+class Response(object):
+    def __init__(self, data=None, status=200, headers=None):
+        self.data = data
+        self.status = status
+        self.headers = headers or {}
+
+
+def make_response(data=None, status=200, headers=None):
+    return Response(data, status, headers)
+
+
+class FakeAPI(object):
+    """Collects route handlers the way routes.API.route registers them"""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def route(self, pattern, methods=None):
+        def register(func):
+            self.handlers[pattern] = func
+            return func
+
+        return register
+
+
+class _ListFactory(object):
+    """System.Collections.Generic.List[T]: a Python list with Add"""
+
+    class _List(list):
+        def Add(self, item):
+            self.append(item)
+
+        @property
+        def Count(self):
+            return len(self)
+
+    def __getitem__(self, item_type):
+        return self._List
+
+
+class _ProjectInfo(object):
+    def __init__(self, doc):
+        self.name = doc.Title
+        self.number = "0001"
+        self.client_name = "Benchmark"
+
+
+class _NoLinks(object):
+    def ToElements(self):
+        return []
+
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+    return module
+
+
+def install():
+    """Register the fake modules and put revit_mcp/ on sys.path"""
+    if getattr(sys.modules.get("pyrevit"), "FAKE", False):
+        return sys.modules["pyrevit"]
+
+    db_names = dict(
+        (name, value)
+        for name, value in globals().items()
+        if isinstance(value, (type, Enum)) and not name.startswith("_")
+    )
+    DB = _module("Autodesk.Revit.DB", **db_names)
+    _module("Autodesk", Revit=_module("Autodesk.Revit", DB=DB))
+
+    routes = _module("pyrevit.routes", make_response=make_response, Response=Response)
+    query = _module("pyrevit.revit.db.query", get_linked_model_instances=lambda doc: _NoLinks())
+    db = _module("pyrevit.revit.db", ProjectInfo=_ProjectInfo, query=query)
+    revit = _module("pyrevit.revit", doc=None, db=db)
+    pyrevit = _module("pyrevit", FAKE=True, DB=DB, routes=routes, revit=revit)
+
+    generic = _module("System.Collections.Generic", List=_ListFactory())
+    system_enum = types.SimpleNamespace(ToObject=lambda enum, value: value)
+    _module(
+        "System",
+        Enum=system_enum,
+        Collections=_module("System.Collections", Generic=generic),
+    )
+
+    for path in (REPO_ROOT, os.path.join(REPO_ROOT, "revit_mcp")):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    return pyrevit
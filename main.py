@@ -1,17 +1,89 @@
 # -*- coding: utf-8 -*-
 import httpx
 from mcp.server.fastmcp import FastMCP, Image, Context
+import asyncio
 import base64
-from typing import Optional, Dict, Any, Union
-
-# Create a generic MCP server for interacting with Revit
-mcp = FastMCP("Revit MCP Server")
+import json
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple, Union
+from urllib.parse import unquote, urlencode
 
 # Configuration
 REVIT_HOST = "localhost"
 REVIT_PORT = 48884  # Default pyRevit Routes port
 BASE_URL = f"http://{REVIT_HOST}:{REVIT_PORT}/revit_mcp"
 
+# Connection pool shared by every tool call (keep-alive avoids a TCP setup per call)
+POOL_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0
+)
+
+# Timeouts in seconds, matched by endpoint prefix; anything else uses DEFAULT_TIMEOUT
+DEFAULT_TIMEOUT = 30.0
+ENDPOINT_TIMEOUTS = {
+    "/status/": 10.0,
+    "/get_view/": 60.0,
+    "/get_views/": 300.0,
+    "/batch/": 120.0,
+    "/place_families/": 120.0,
+    "/place_family_array/": 120.0,
+    "/jobs/": 10.0,
+    "/query/": 60.0,
+}
+
+# Background jobs (?async=1) are polled with exponential backoff until done
+JOB_POLL_INITIAL = 0.25
+JOB_POLL_MAX = 2.0
+JOB_TIMEOUT = 1800.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Recently fetched view images by request, with the ETag Revit sent for them
+IMAGE_MEMO_SIZE = 16
+_image_memo: "OrderedDict[str, Tuple[str, Image, Dict]]" = OrderedDict()
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=BASE_URL, limits=POOL_LIMITS, timeout=DEFAULT_TIMEOUT
+    )
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it if the lifespan hook has not run"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_client()
+    return _http_client
+
+
+def _timeout_for(endpoint: str, timeout: Optional[float] = None) -> float:
+    """Resolve the timeout for an endpoint, an explicit value always wins"""
+    if timeout is not None:
+        return timeout
+    for prefix, endpoint_timeout in ENDPOINT_TIMEOUTS.items():
+        if endpoint.startswith(prefix):
+            return endpoint_timeout
+    return DEFAULT_TIMEOUT
+
+
+@asynccontextmanager
+async def revit_lifespan(server: FastMCP):
+    """Open the pooled HTTP client on startup and close it on shutdown"""
+    global _http_client
+    _http_client = _create_client()
+    try:
+        yield {}
+    finally:
+        client, _http_client = _http_client, None
+        await client.aclose()
+
+
+# Create a generic MCP server for interacting with Revit
+mcp = FastMCP("Revit MCP Server", lifespan=revit_lifespan)
+
 
 async def revit_get(endpoint: str, ctx: Context = None, **kwargs) -> Union[Dict, str]:
     """Simple GET request to Revit API"""
@@ -23,43 +95,224 @@ async def revit_post(endpoint: str, data: Dict[str, Any], ctx: Context = None, *
     return await _revit_call("POST", endpoint, data=data, ctx=ctx, **kwargs)
 
 
-async def revit_image(endpoint: str, ctx: Context = None) -> Union[Image, str]:
-    """GET request that returns an Image object"""
+async def revit_batch(requests: List[Dict[str, Any]], ctx: Context = None, transaction_group: bool = False,
+                      stop_on_error: bool = False, **kwargs) -> Union[Dict, str]:
+    """Run several {endpoint, method, payload} calls in a single Revit round-trip"""
+    data = {
+        "requests": requests,
+        "transaction_group": transaction_group,
+        "stop_on_error": stop_on_error,
+    }
+    return await _revit_call("POST", "/batch/", data=data, ctx=ctx, **kwargs)
+
+
+async def revit_stream(endpoint: str, ctx: Context = None, params: Dict = None,
+                       timeout: float = None) -> AsyncIterator[Dict]:
+    """
+    GET an endpoint in ?format=ndjson mode and yield one object per line
+
+    The route answers one page per request and names the next page's offset
+    in the X-Next-Offset header; pages are requested only as the caller
+    keeps reading, so stopping early skips the remaining requests. Each
+    page is built in full by Revit before it is sent. Raises RuntimeError
+    on a non-200 response.
+    """
+    stream_params = dict(params or {})
+    stream_params["format"] = "ndjson"
+    client = _get_client()
+    while True:
+        async with client.stream("GET", endpoint, params=stream_params,
+                                 timeout=_timeout_for(endpoint, timeout)) as response:
+            if response.status_code != 200:
+                body = (await response.aread()).decode("utf-8", errors="replace")
+                raise RuntimeError(f"Error: {response.status_code} - {body}")
+
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                yield json.loads(line)
+            next_offset = response.headers.get("X-Next-Offset")
+
+        if next_offset is None:
+            return
+        stream_params["offset"] = next_offset
+
+
+def _image_info_from_headers(headers: httpx.Headers) -> Dict[str, str]:
+    """Collect the X-Image-* metadata headers of a binary image response"""
+    info = {}
+    for name, value in headers.items():
+        if name.lower().startswith("x-image-"):
+            info[name[8:].lower().replace("-", "_")] = unquote(value)
+    if headers.get("etag"):
+        info["etag"] = headers["etag"]
+    return info
+
+
+def _image_from_response(response: httpx.Response) -> Tuple[Union[Image, str], Dict]:
+    """
+    Build an Image from a raw image/* body, or from the legacy base64 JSON
+
+    Returns (Image or error string, metadata including the ETag if any).
+    """
+    if response.status_code != 200:
+        return f"Error: {response.status_code} - {response.text}", {}
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith("image/"):
+        image = Image(data=response.content, format=content_type.split(";")[0][6:])
+        return image, _image_info_from_headers(response.headers)
+    return _image_from_json(response.json())
+
+
+def _image_from_json(data: Dict) -> Tuple[Image, Dict]:
+    """Decode the base64 JSON image transport into (Image, metadata)"""
+    content_type = data.get("content_type") or "image/png"
+    image = Image(data=base64.b64decode(data["image_data"]), format=content_type[6:])
+    return image, {key: value for key, value in data.items() if key != "image_data"}
+
+
+def _remember_image(key: str, image: Union[Image, str], info: Dict) -> None:
+    """Keep the latest images with their ETags so unchanged views skip the transfer"""
+    if not info.get("etag") or not isinstance(image, Image):
+        return
+    _image_memo.pop(key, None)
+    _image_memo[key] = (info["etag"], image, info)
+    while len(_image_memo) > IMAGE_MEMO_SIZE:
+        _image_memo.popitem(last=False)
+
+
+async def revit_image(endpoint: str, ctx: Context = None, timeout: float = None,
+                      background: bool = False, params: Dict = None,
+                      info: Dict = None) -> Union[Image, str]:
+    """
+    GET request that returns an Image object
+
+    Asks for the raw image bytes (?transport=binary) and hands them to Image
+    as they are; routes that only speak base64 JSON are still understood.
+    An image seen before is revalidated with If-None-Match, and a 304 reuses
+    it without transferring it again. Pass a dict as info to receive the
+    image metadata (view name, size, preview flags, ...).
+    """
+    info = info if info is not None else {}
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(f"{BASE_URL}{endpoint}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                image_bytes = base64.b64decode(data["image_data"])
-                return Image(data=image_bytes, format="png")
+        client = _get_client()
+        memo_key = endpoint + "?" + urlencode(sorted((params or {}).items()))
+        headers = {"Accept": "image/png, application/json"}
+        remembered = _image_memo.get(memo_key)
+        if remembered:
+            headers["If-None-Match"] = remembered[0]
+
+        params = dict(params or {}, transport="binary")
+        if background:
+            params["async"] = "1"
+        response = await client.get(endpoint, params=params, headers=headers,
+                                    timeout=_timeout_for(endpoint, timeout))
+
+        if response.status_code == 304 and remembered:
+            _image_memo.move_to_end(memo_key)
+            info.update(remembered[2])
+            return remembered[1]
+
+        if background and response.status_code == 202:
+            job_id = response.json()["job_id"]
+            job = await _wait_for_job(job_id, ctx)
+            if isinstance(job, str):
+                return job
+            result = job.get("result") or {}
+            if result.get("status", 500) >= 400:
+                return f"Error: {result.get('status')} - {json.dumps(result.get('data'))}"
+            if result.get("binary"):
+                result_endpoint = f"/jobs/{job_id}/result"
+                response = await client.get(result_endpoint, timeout=_timeout_for(result_endpoint))
+                image, image_info = _image_from_response(response)
             else:
-                return f"Error: {response.status_code} - {response.text}"
+                image, image_info = _image_from_json(result["data"])
+        else:
+            image, image_info = _image_from_response(response)
+
+        _remember_image(memo_key, image, image_info)
+        info.update(image_info)
+        return image
     except Exception as e:
         return f"Error: {e}"
 
 
-async def _revit_call(method: str, endpoint: str, data: Dict = None, ctx: Context = None, 
-                     timeout: float = 30.0, params: Dict = None) -> Union[Dict, str]:
-    """Internal function handling all HTTP calls"""
+async def _wait_for_job(job_id: str, ctx: Context = None) -> Union[Dict, str]:
+    """
+    Poll /jobs/<job_id> until the job finishes, reporting its progress
+
+    New job log chunks (e.g. streamed execute_code output) are relayed as
+    info messages. Returns the final job status (its "result" holds the
+    route's status and data), or an error string.
+    """
+    client = _get_client()
+    endpoint = f"/jobs/{job_id}"
+    deadline = time.monotonic() + JOB_TIMEOUT
+    delay = JOB_POLL_INITIAL
+    log_next = 0
+    while True:
+        await asyncio.sleep(delay)
+        response = await client.get(endpoint, params={"since": log_next},
+                                    timeout=_timeout_for(endpoint))
+        if response.status_code != 200:
+            return f"Error: {response.status_code} - {response.text}"
+
+        job = response.json()
+        log_next = job.get("log_next", log_next)
+        if ctx:
+            for chunk in job.get("log") or []:
+                await ctx.info(chunk)
+            await ctx.report_progress(job.get("progress", 0.0), 1.0, job.get("message"))
+
+        if job.get("status") in ("succeeded", "failed"):
+            return job
+
+        if time.monotonic() > deadline:
+            return f"Error: job {job_id} still {job.get('status')} after {JOB_TIMEOUT:.0f}s"
+        delay = min(delay * 1.5, JOB_POLL_MAX)
+
+
+async def _revit_call(method: str, endpoint: str, data: Dict = None, ctx: Context = None,
+                      timeout: float = None, params: Dict = None,
+                      background: bool = False) -> Union[Dict, str]:
+    """
+    Internal function handling all HTTP calls
+
+    With background=True the route is asked to queue the work as a job
+    (?async=1) and the job is polled until it finishes, so slow operations
+    are not bound by the request timeout.
+    """
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            url = f"{BASE_URL}{endpoint}"
-            
-            if method == "GET":
-                response = await client.get(url, params=params)
-            else:  # POST
-                response = await client.post(url, json=data, headers={"Content-Type": "application/json"})
-            
-            return response.json() if response.status_code == 200 else f"Error: {response.status_code} - {response.text}"
+        client = _get_client()
+        request_timeout = _timeout_for(endpoint, timeout)
+        if background:
+            params = dict(params or {}, **{"async": "1"})
+
+        if method == "GET":
+            response = await client.get(endpoint, params=params, timeout=request_timeout)
+        else:  # POST
+            response = await client.post(endpoint, json=data, params=params,
+                                         headers={"Content-Type": "application/json"},
+                                         timeout=request_timeout)
+
+        if background and response.status_code == 202:
+            job = await _wait_for_job(response.json()["job_id"], ctx)
+            if isinstance(job, str):
+                return job
+            result = job.get("result") or {}
+            status = result.get("status", 500)
+            if status < 400:
+                return result.get("data")
+            return f"Error: {status} - {json.dumps(result.get('data'))}"
+        return response.json() if response.status_code == 200 else f"Error: {response.status_code} - {response.text}"
     except Exception as e:
         return f"Error: {e}"
 
 
 # Register all tools BEFORE the main block
 from tools import register_tools
-register_tools(mcp, revit_get, revit_post, revit_image)
+register_tools(mcp, revit_get, revit_post, revit_image, revit_batch, revit_stream)
 
 
 if __name__ == "__main__":
-    mcp.run(transport="stdio")
\ No newline at end of file
+    mcp.run(transport="stdio")
@@ -0,0 +1,248 @@
+# -*- coding: UTF-8 -*-
+"""
+Batch Module for Revit MCP
+Runs several route calls back to back inside a single Revit dispatch
+"""
+
+from pyrevit import routes, DB
+import json
+import logging
+import re
+import traceback
+
+try:
+    from urllib import unquote
+    from urlparse import parse_qsl
+except ImportError:
+    from urllib.parse import unquote, parse_qsl
+
+from utils import unpack_response
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on sub-requests per batch so one call cannot pin the UI thread forever
+MAX_BATCH_SIZE = 50
+
+_PARAM_PATTERN = re.compile(r"<(?:[^:<>]+:)?([^<>]+)>")
+
+
+def _compile_pattern(pattern):
+    """Turn a route pattern like /get_view/<view_name> into a regex"""
+    pattern = pattern.rstrip("/")
+    regex = ""
+    last = 0
+    for match in _PARAM_PATTERN.finditer(pattern):
+        regex += re.escape(pattern[last : match.start()])
+        regex += "(?P<{}>[^/]+)".format(match.group(1))
+        last = match.end()
+    regex += re.escape(pattern[last:])
+    return re.compile("^{}/?$".format(regex))
+
+
+class BatchRequest(object):
+    """Minimal stand-in for the pyRevit request object handed to route handlers"""
+
+    def __init__(self, path, method="GET", data=None, params=None):
+        self.path = path
+        self.method = method
+        self.data = data
+        self.params = params or {}
+        self.headers = {}
+
+
+class RouteRegistry(object):
+    """
+    Wrapper around routes.API that remembers every registered handler
+
+    Route modules register through it exactly as they would through the API
+    itself; the recorded handlers let the batch route call them in-process.
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self._routes = []
+
+    def route(self, pattern, methods=None):
+        methods = methods or ["GET"]
+        register = self.api.route(pattern, methods=methods)
+
+        def decorator(func):
+            self._routes.append(
+                (_compile_pattern(pattern), [m.upper() for m in methods], func)
+            )
+            return register(func)
+
+        return decorator
+
+    def resolve(self, path, method):
+        """Find the handler and path arguments for a path, or (None, None)"""
+        for regex, methods, func in self._routes:
+            match = regex.match(path)
+            if match and method in methods:
+                return func, dict(
+                    (key, unquote(value)) for key, value in match.groupdict().items()
+                )
+        return None, None
+
+    def dispatch(self, endpoint, method, payload, doc, uidoc):
+        """
+        Call a registered handler directly and return (status, data)
+
+        Handler arguments are injected by name the same way pyRevit does:
+        doc, uidoc, request and any path parameters.
+        """
+        method = (method or "GET").upper()
+        path, _, query = endpoint.partition("?")
+        func, path_args = self.resolve(path, method)
+        if func is None:
+            return 404, {"error": "No route for {} {}".format(method, path)}
+
+        params = dict(parse_qsl(query))
+        data = None
+        if method == "GET":
+            if isinstance(payload, dict):
+                params.update(payload)
+        else:
+            data = payload if payload is not None else {}
+
+        request = BatchRequest(path, method, data, params)
+        available = {"doc": doc, "uidoc": uidoc, "request": request}
+        available.update(path_args)
+
+        code = func.__code__
+        arg_names = code.co_varnames[: code.co_argcount]
+        kwargs = dict((name, available.get(name)) for name in arg_names)
+        return unpack_response(func(**kwargs))
+
+
+def register_batch_routes(api):
+    """Register the batch route; api must be a RouteRegistry"""
+
+    @api.route("/batch/", methods=["POST"])
+    def run_batch(doc, uidoc, request):
+        """
+        Run several route calls in one Revit dispatch
+
+        Expected payload:
+        {
+            "requests": [
+                {"endpoint": "/status/", "method": "GET"},
+                {"endpoint": "/color_splash/", "method": "POST",
+                 "payload": {"category_name": "Walls", "parameter_name": "Mark"}}
+            ],
+            "transaction_group": false,  // wrap everything in one TransactionGroup
+            "stop_on_error": false       // stop (and roll back the group) on first failure
+        }
+        """
+        try:
+            data = (
+                json.loads(request.data)
+                if isinstance(request.data, str)
+                else request.data
+            ) or {}
+
+            sub_requests = data.get("requests")
+            if not isinstance(sub_requests, list) or not sub_requests:
+                return routes.make_response(
+                    data={"error": "requests must be a non-empty list"}, status=400
+                )
+            if len(sub_requests) > MAX_BATCH_SIZE:
+                return routes.make_response(
+                    data={
+                        "error": "Too many requests in batch: {} (max {})".format(
+                            len(sub_requests), MAX_BATCH_SIZE
+                        )
+                    },
+                    status=400,
+                )
+
+            use_group = bool(data.get("transaction_group", False))
+            stop_on_error = bool(data.get("stop_on_error", False))
+
+            if use_group and not doc:
+                return routes.make_response(
+                    data={"error": "No active Revit document"}, status=503
+                )
+
+            group = None
+            if use_group:
+                group = DB.TransactionGroup(
+                    doc, data.get("transaction_name") or "MCP Batch"
+                )
+                group.Start()
+
+            results = []
+            failed_count = 0
+            try:
+                for index, sub_request in enumerate(sub_requests):
+                    sub_request = sub_request or {}
+                    endpoint = sub_request.get("endpoint", "")
+                    method = sub_request.get("method", "GET").upper()
+
+                    if endpoint.partition("?")[0].rstrip("/") == "/batch":
+                        status, result = 400, {"error": "Nested batches are not allowed"}
+                    else:
+                        try:
+                            status, result = api.dispatch(
+                                endpoint,
+                                method,
+                                sub_request.get("payload"),
+                                doc,
+                                uidoc,
+                            )
+                        except Exception as sub_error:
+                            logger.error(
+                                "Batch item {} failed: {}".format(index, str(sub_error))
+                            )
+                            status, result = 500, {
+                                "error": str(sub_error),
+                                "traceback": traceback.format_exc(),
+                            }
+
+                    results.append(
+                        {
+                            "index": index,
+                            "endpoint": endpoint,
+                            "method": method,
+                            "status": status,
+                            "data": result,
+                        }
+                    )
+
+                    if status >= 400:
+                        failed_count += 1
+                        if stop_on_error:
+                            break
+
+                group_outcome = None
+                if group:
+                    if failed_count and stop_on_error:
+                        group.RollBack()
+                        group_outcome = "rolled_back"
+                    else:
+                        group.Assimilate()
+                        group_outcome = "assimilated"
+
+            except Exception:
+                if group and group.HasStarted() and not group.HasEnded():
+                    group.RollBack()
+                raise
+
+            return routes.make_response(
+                data={
+                    "status": "success",
+                    "results": results,
+                    "completed": len(results),
+                    "failed": failed_count,
+                    "transaction_group": group_outcome,
+                }
+            )
+
+        except Exception as e:
+            logger.error("Batch request failed: {}".format(str(e)))
+            return routes.make_response(
+                data={"error": str(e), "traceback": traceback.format_exc()},
+                status=500,
+            )
+
+    logger.info("Batch routes registered successfully")
@@ -0,0 +1,209 @@
+# -*- coding: UTF-8 -*-
+"""
+Cache Module for Revit MCP
+Document-scoped LRU cache for read-only route results
+
+Entries are keyed by document, route and route arguments and are dropped
+whenever Revit raises DocumentChanged (or DocumentClosing) for that
+document. The module has no Revit imports so the invalidation logic can be
+exercised on plain CPython with a fake event source.
+"""
+
+from collections import OrderedDict
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 128
+
+# Routes that opt in to caching by default
+CACHED_ROUTES = (
+    "/model_info/",
+    "/list_views/",
+    "/list_levels/",
+    "/list_families/",
+    "/list_family_categories/",
+    "/query/",
+)
+
+# Lookup indexes built by revit_mcp.utils, cached and invalidated the same way
+CACHED_INDEXES = ("category_index", "family_symbol_index")
+
+
+def document_key(doc):
+    """Key that identifies a document across separate API wrapper objects"""
+    try:
+        return doc.GetHashCode()
+    except AttributeError:
+        return id(doc)
+
+
+def _event_document(args):
+    """Get the document from DocumentChanged or DocumentClosing event args"""
+    try:
+        return args.GetDocument()
+    except AttributeError:
+        return getattr(args, "Document", None)
+
+
+def _freeze_args(args):
+    if not args:
+        return ""
+    return json.dumps(args, sort_keys=True, default=str)
+
+
+class ResultCache(object):
+    """
+    LRU cache of route results with per-route opt-in
+
+    get() and put() are no-ops for routes that have not opted in, so
+    handlers can call them unconditionally.
+    """
+
+    def __init__(
+        self, max_entries=DEFAULT_MAX_ENTRIES, routes=CACHED_ROUTES + CACHED_INDEXES
+    ):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._routes = set(routes)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bound = []
+        self._change_filters = {}
+        self._versions = {}
+
+    @property
+    def bound(self):
+        """True while document events are being received"""
+        return bool(self._bound)
+
+    def document_version(self, doc):
+        """
+        Number of DocumentChanged (and DocumentClosing) events seen for a document
+
+        Only meaningful while bound; keys that must change with the model
+        (like the image cache's) include it.
+        """
+        return self._versions.get(document_key(doc), 0)
+
+    def set_change_filter(self, route, predicate):
+        """
+        Only drop a route's entries for changes the predicate cares about
+
+        predicate(change_args, cached_value) returns True when the entry is
+        stale. Routes without a filter are dropped on every change.
+        """
+        self._change_filters[route] = predicate
+
+    def enable(self, route):
+        self._routes.add(route)
+
+    def disable(self, route):
+        self._routes.discard(route)
+        with self._lock:
+            for key in [k for k in self._entries if k[1] == route]:
+                del self._entries[key]
+
+    def disable_all(self):
+        for route in list(self._routes):
+            self.disable(route)
+
+    def is_enabled(self, route):
+        return route in self._routes
+
+    def get(self, doc, route, args=None):
+        """Return the cached value or None on a miss"""
+        if not self.is_enabled(route):
+            return None
+        key = (document_key(doc), route, _freeze_args(args))
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is None:
+                self.misses += 1
+                return None
+            # Re-insert to mark as most recently used
+            self._entries[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, doc, route, value, args=None):
+        if not self.is_enabled(route) or value is None:
+            return
+        key = (document_key(doc), route, _freeze_args(args))
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, doc=None, change=None):
+        """
+        Drop entries for a document, or everything when doc is None
+
+        When the DocumentChanged args are passed as change, routes with a
+        change filter keep their entries unless the filter says otherwise.
+        """
+        with self._lock:
+            if doc is None:
+                self._entries.clear()
+                return
+            doc_key = document_key(doc)
+            for key in [k for k in self._entries if k[0] == doc_key]:
+                predicate = self._change_filters.get(key[1])
+                if change is not None and predicate is not None:
+                    try:
+                        if not predicate(change, self._entries[key]):
+                            continue
+                    except Exception as e:
+                        logger.debug("Change filter for %s failed: %s", key[1], e)
+                del self._entries[key]
+
+    def on_document_changed(self, sender, args):
+        """DocumentChanged handler"""
+        try:
+            doc = _event_document(args)
+            doc_key = document_key(doc)
+            self._versions[doc_key] = self._versions.get(doc_key, 0) + 1
+            self.invalidate(doc, change=args)
+        except Exception as e:
+            logger.warning("Cache invalidation failed, clearing all: %s", e)
+            self.invalidate()
+
+    def on_document_closing(self, sender, args):
+        """DocumentClosing handler"""
+        try:
+            doc = _event_document(args)
+            doc_key = document_key(doc)
+            self._versions[doc_key] = self._versions.get(doc_key, 0) + 1
+            self.invalidate(doc)
+        except Exception as e:
+            logger.warning("Cache invalidation failed, clearing all: %s", e)
+            self.invalidate()
+
+    def bind(self, app):
+        """Subscribe to the document events of a Revit Application"""
+        app.DocumentChanged += self.on_document_changed
+        app.DocumentClosing += self.on_document_closing
+        self._bound.append(app)
+
+    def unbind(self):
+        for app in self._bound:
+            app.DocumentChanged -= self.on_document_changed
+            app.DocumentClosing -= self.on_document_closing
+        self._bound = []
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "routes": sorted(self._routes),
+        }
+
+
+# Shared instance used by the route modules
+result_cache = ResultCache()
@@ -8,11 +8,668 @@ import json
 import logging
 import sys
 import traceback
-from StringIO import StringIO
+from collections import OrderedDict
+import hashlib
+import itertools
+import threading
+import time
+
+from Autodesk.Revit.Exceptions import InvalidOperationException
+from cache import document_key
+from jobs import run_or_submit, append_log
 
 # Standard logger setup
 logger = logging.getLogger(__name__)
 
+# Names provided to every execution; refreshed on each run of a session
+BASE_NAMES = (
+    "doc",
+    "DB",
+    "revit",
+    "__builtins__",
+    "print",
+    "iterate",
+    "check_budget",
+)
+
+
+# Compiled code objects kept, keyed by source hash
+MAX_COMPILED_CODE = 64
+
+# Named session limits: idle lifetime and number of sessions
+SESSION_TTL_SECONDS = 1800
+MAX_SESSIONS = 8
+
+# Cap on the number of user names in a session namespace
+MAX_NAMES_PER_SESSION = 500
+
+# Cap on the approximate size of a session namespace after a run, in bytes.
+# Measured with sys.getsizeof over the values and the items of containers
+# (two levels deep, sampled), so objects Revit holds behind an element
+# wrapper are not counted.
+MAX_SESSION_BYTES = 64 * 1024 * 1024
+
+# Items measured per container; the rest are assumed to be of the same size
+SIZE_SAMPLE_ITEMS = 100
+
+# Size assumed for objects sys.getsizeof cannot measure (.NET objects)
+UNMEASURED_OBJECT_BYTES = 64
+
+
+# Printed output kept per run (characters), by default and at most
+DEFAULT_MAX_OUTPUT = 200000
+MAX_OUTPUT_LIMIT = 5000000
+
+# Streamed output is sent to the job log in chunks of about this size, or
+# sooner once a line ends this long after the previous chunk
+STREAM_CHUNK_CHARS = 4096
+STREAM_FLUSH_SECONDS = 0.5
+
+
+# Execution budget: wall-clock seconds and iterate() items, by default and
+# at most; None means no limit
+DEFAULT_MAX_SECONDS = 300
+MAX_SECONDS_LIMIT = 1800
+DEFAULT_MAX_ITERATIONS = 1000000
+MAX_ITERATIONS_LIMIT = 100000000
+
+
+# How execute_code wraps the script: always in a transaction, never
+# (read_only), or in a transaction kept only if the model changed (auto)
+TRANSACTION_MODES = ("always", "auto", "read_only")
+
+
+class TransactionScope(object):
+    """
+    Transaction handling for one execute_code run
+
+    In auto mode the transaction runs inside a TransactionGroup while a
+    temporary DocumentChanged handler watches for added, modified or deleted
+    elements. The group is assimilated when something changed and rolled
+    back otherwise, so pure queries leave no undo entry.
+    """
+
+    def __init__(self, doc, mode, name):
+        self.doc = doc
+        self.mode = mode
+        self.name = name
+        self.outcome = None
+        self.changed = False
+        self._group = None
+        self._transaction = None
+        self._app = None
+
+    def _on_document_changed(self, sender, args):
+        try:
+            if not args.GetDocument().Equals(self.doc):
+                return
+            if (
+                args.GetAddedElementIds().Count
+                or args.GetModifiedElementIds().Count
+                or args.GetDeletedElementIds().Count
+            ):
+                self.changed = True
+        except Exception as e:
+            logger.debug("Change detection failed, assuming changes: %s", e)
+            self.changed = True
+
+    def start(self):
+        if self.mode == "read_only":
+            return
+        if self.mode == "auto":
+            self._group = DB.TransactionGroup(self.doc, self.name)
+            self._group.Start()
+            self._app = self.doc.Application
+            self._app.DocumentChanged += self._on_document_changed
+        self._transaction = DB.Transaction(self.doc, self.name)
+        self._transaction.Start()
+
+    def commit(self):
+        if self.mode == "read_only":
+            self.outcome = "none"
+            return
+        try:
+            self._transaction.Commit()
+        finally:
+            self._unsubscribe()
+        if self._group is None:
+            self.outcome = "committed"
+        elif self.changed:
+            self._group.Assimilate()
+            self.outcome = "committed"
+        else:
+            self._group.RollBack()
+            self.outcome = "discarded"
+
+    def rollback(self):
+        self._unsubscribe()
+        if self.mode == "read_only":
+            self.outcome = "none"
+            return
+        for scope in (self._transaction, self._group):
+            if scope is not None and scope.HasStarted() and not scope.HasEnded():
+                scope.RollBack()
+        self.outcome = "rolled_back"
+
+    def _unsubscribe(self):
+        if self._app is not None:
+            self._app.DocumentChanged -= self._on_document_changed
+            self._app = None
+
+    def to_dict(self):
+        return {"mode": self.mode, "outcome": self.outcome}
+
+
+class BudgetExceeded(BaseException):
+    """
+    Raised when a run exceeds its execution budget
+
+    Derives from BaseException so that a script's own "except Exception"
+    cannot swallow it and keep running.
+    """
+
+    def __init__(self, limit, message):
+        BaseException.__init__(self, message)
+        self.limit = limit
+
+
+class ExecutionBudget(object):
+    """
+    Limits on one execute_code run, checked cooperatively
+
+    Revit runs the script on its UI thread, which cannot be interrupted
+    from outside, so the limits are enforced by the injected helpers:
+    print (and any write to stdout), iterate() and check_budget(). Once a
+    limit is hit every later check raises again.
+    """
+
+    def __init__(
+        self,
+        max_seconds=DEFAULT_MAX_SECONDS,
+        max_iterations=DEFAULT_MAX_ITERATIONS,
+        output_limit=None,
+    ):
+        self.max_seconds = max_seconds
+        self.max_iterations = max_iterations
+        self.output_limit = output_limit
+        self.started = time.time()
+        self.iterations = 0
+        self.exceeded = None
+        self._message = None
+
+    def start(self):
+        """Restart the clock, e.g. once a queued run actually begins"""
+        self.started = time.time()
+
+    @property
+    def elapsed(self):
+        return time.time() - self.started
+
+    def _exceed(self, limit, message):
+        self.exceeded = limit
+        self._message = message
+        raise BudgetExceeded(limit, message)
+
+    def check(self):
+        """Raise BudgetExceeded if the run is over its time budget"""
+        if self.exceeded:
+            raise BudgetExceeded(self.exceeded, self._message)
+        if self.max_seconds and self.elapsed > self.max_seconds:
+            self._exceed(
+                "time",
+                "Execution exceeded its time budget of {} seconds".format(
+                    self.max_seconds
+                ),
+            )
+
+    def check_output(self, chars):
+        if self.output_limit and chars > self.output_limit:
+            self._exceed(
+                "output",
+                "Output exceeded its budget of {} characters".format(
+                    self.output_limit
+                ),
+            )
+        self.check()
+
+    def iterate(self, items):
+        """Yield items, counting each one against the iteration budget"""
+        for item in items:
+            self.iterations += 1
+            if self.max_iterations and self.iterations > self.max_iterations:
+                self._exceed(
+                    "iterations",
+                    "Execution exceeded its budget of {} iterations".format(
+                        self.max_iterations
+                    ),
+                )
+            self.check()
+            yield item
+
+    def to_dict(self, output_chars):
+        return {
+            "elapsed_seconds": round(self.elapsed, 3),
+            "iterations": self.iterations,
+            "peak_output_chars": output_chars,
+            "limits": {
+                "seconds": self.max_seconds,
+                "iterations": self.max_iterations,
+                "output_chars": self.output_limit,
+            },
+            "exceeded": self.exceeded,
+        }
+
+
+class OutputCapture(object):
+    """
+    File-like target for print output with a size cap
+
+    Output past max_chars is dropped (and counted) instead of held in
+    memory. With stream=True the kept output is also appended to the
+    running job's log as it is written, so /jobs/<job_id>?since=N shows
+    it before the script finishes. Every write is checked against the
+    budget, if one is given.
+    """
+
+    def __init__(self, max_chars=DEFAULT_MAX_OUTPUT, stream=False, budget=None):
+        self.max_chars = max_chars
+        self.stream = stream
+        self.budget = budget
+        self.written = 0
+        self.truncated = False
+        self._parts = []
+        self._kept = 0
+        self._pending = []
+        self._pending_chars = 0
+        self._last_flush = time.time()
+
+    def write(self, text):
+        if not text:
+            return
+        text = text if isinstance(text, basestring) else str(text)
+        self.written += len(text)
+        if self.budget is not None:
+            self.budget.check_output(self.written)
+        if self.truncated:
+            return
+        room = self.max_chars - self._kept
+        if len(text) > room:
+            text = text[:room]
+            self.truncated = True
+        self._parts.append(text)
+        self._kept += len(text)
+
+        if not self.stream:
+            return
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if self.truncated:
+            self._pending.append(self.truncation_note())
+            self.flush()
+        elif self._pending_chars >= STREAM_CHUNK_CHARS or (
+            text.endswith("\n")
+            and time.time() - self._last_flush >= STREAM_FLUSH_SECONDS
+        ):
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            append_log("".join(self._pending))
+            self._pending = []
+            self._pending_chars = 0
+        self._last_flush = time.time()
+
+    def truncation_note(self):
+        return "\n[output truncated at {} characters]\n".format(self.max_chars)
+
+    def getvalue(self):
+        output = "".join(self._parts)
+        if self.truncated:
+            output += self.truncation_note()
+        return output
+
+    def close(self):
+        self.flush()
+        self._parts = []
+
+
+class CompiledCodeCache(object):
+    """LRU of code objects keyed by the SHA-1 of their source"""
+
+    def __init__(self, max_entries=MAX_COMPILED_CODE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def compile(self, source):
+        """Return (code object, True if it came from the cache)"""
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        code = self._entries.pop(digest, None)
+        hit = code is not None
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+            code = compile(source, "<mcp-code-{}>".format(digest[:8]), "exec")
+        self._entries[digest] = code
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return code, hit
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def approximate_size(value, depth=0):
+    """
+    Rough size of a value in bytes
+
+    Containers add the size of their items, measured on at most
+    SIZE_SAMPLE_ITEMS of them and scaled to their length, down to two
+    levels. .NET collections count UNMEASURED_OBJECT_BYTES per item.
+    """
+    try:
+        size = sys.getsizeof(value)
+    except Exception:
+        size = UNMEASURED_OBJECT_BYTES
+    if depth >= 2 or isinstance(value, (str, bytes)):
+        return size
+
+    if isinstance(value, dict):
+        items = list(itertools.islice(value.items(), SIZE_SAMPLE_ITEMS))
+        sampled = sum(
+            approximate_size(key, depth + 1) + approximate_size(item, depth + 1)
+            for key, item in items
+        )
+        count = len(value)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = list(itertools.islice(value, SIZE_SAMPLE_ITEMS))
+        sampled = sum(approximate_size(item, depth + 1) for item in items)
+        count = len(value)
+    else:
+        count = getattr(value, "Count", None)
+        if isinstance(count, int):
+            return size + count * UNMEASURED_OBJECT_BYTES
+        return size
+
+    if not items:
+        return size
+    return size + sampled * count // len(items)
+
+
+class CodeSession(object):
+    """A namespace that persists across execute_code calls"""
+
+    def __init__(self, name, doc_key):
+        self.name = name
+        self.doc_key = doc_key
+        self.namespace = {}
+        self.created = time.time()
+        self.last_used = self.created
+        self.runs = 0
+
+    def user_names(self):
+        return [name for name in self.namespace if name not in BASE_NAMES]
+
+    def approximate_bytes(self):
+        return sum(
+            approximate_size(self.namespace[name]) for name in self.user_names()
+        )
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "runs": self.runs,
+            "names": len(self.user_names()),
+            "idle_seconds": round(time.time() - self.last_used, 1),
+            "expires_in_seconds": round(
+                max(0.0, self.last_used + SESSION_TTL_SECONDS - time.time()), 1
+            ),
+        }
+
+
+class SessionStore(object):
+    """
+    Named sessions with an idle lifetime and count limits
+
+    A session is dropped after SESSION_TTL_SECONDS without use, when it is
+    reset, or when its document is no longer the active one. When
+    MAX_SESSIONS are open, the least recently used one is dropped.
+    """
+
+    def __init__(self, max_sessions=MAX_SESSIONS, ttl=SESSION_TTL_SECONDS):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        # /code_sessions/ is served off the UI thread
+        self._lock = threading.RLock()
+
+    def prune(self):
+        now = time.time()
+        with self._lock:
+            for name in [
+                name
+                for name, session in self._sessions.items()
+                if now - session.last_used > self.ttl
+            ]:
+                logger.info("Code session '{}' expired".format(name))
+                del self._sessions[name]
+
+    def get(self, name, doc, reset=False):
+        """Return the named session, creating (or recreating) it as needed"""
+        doc_key = document_key(doc)
+        with self._lock:
+            self.prune()
+            session = self._sessions.pop(name, None)
+            if session is not None and (reset or session.doc_key != doc_key):
+                session = None
+            if session is None:
+                session = CodeSession(name, doc_key)
+            self._sessions[name] = session
+            while len(self._sessions) > self.max_sessions:
+                dropped, _ = self._sessions.popitem(last=False)
+                logger.info(
+                    "Code session '{}' dropped (session limit)".format(dropped)
+                )
+            return session
+
+    def discard(self, name):
+        with self._lock:
+            return self._sessions.pop(name, None) is not None
+
+    def list(self):
+        with self._lock:
+            self.prune()
+            return [session.to_dict() for session in self._sessions.values()]
+
+
+compiled_code = CompiledCodeCache()
+code_sessions = SessionStore()
+
+
+def run_code(
+    doc,
+    code_to_execute,
+    description,
+    session_name=None,
+    reset_session=False,
+    transaction_mode="always",
+    stream=False,
+    max_output=DEFAULT_MAX_OUTPUT,
+    budget=None,
+):
+    """
+    Execute code inside a transaction and build the route response
+
+    The transaction is committed when the code succeeds and rolled back
+    when it raises; see TransactionScope for the read_only and auto modes.
+    Compiled code is reused for identical source. With a session name the
+    namespace (imports, helpers, variables) is kept for the next call using
+    the same name. Printed output is capped at max_output characters and,
+    with stream, sent to the job log while the code runs. Exceeding the
+    budget raises BudgetExceeded inside the script and rolls back.
+    """
+    session = None
+    if session_name:
+        session = code_sessions.get(session_name, doc, reset=reset_session)
+
+    # Documents that cannot be edited (e.g. links) can only be queried
+    if transaction_mode == "auto" and doc.IsReadOnly:
+        transaction_mode = "read_only"
+
+    # Create a transaction for any model modifications
+    t = TransactionScope(
+        doc, transaction_mode, "MCP Code Execution: {}".format(description)
+    )
+
+    # Capture stdout to return any print statements
+    budget = budget or ExecutionBudget()
+    budget.start()
+    old_stdout = sys.stdout
+    captured_output = OutputCapture(max_output, stream=stream, budget=budget)
+
+    try:
+        t.start()
+        sys.stdout = captured_output
+
+        # Create a namespace with common Revit objects available
+        namespace = session.namespace if session else {}
+        namespace.update(
+            {
+                "doc": doc,
+                "DB": DB,
+                "revit": revit,
+                "__builtins__": __builtins__,
+                "print": lambda *args: captured_output.write(
+                    " ".join(str(arg) for arg in args) + "\n"
+                ),
+                "iterate": budget.iterate,
+                "check_budget": budget.check,
+            }
+        )
+
+        # Execute the code, reusing the compiled form of identical source
+        code_object, compiled_from_cache = compiled_code.compile(code_to_execute)
+        exec(code_object, namespace)
+
+        # Restore stdout
+        sys.stdout = old_stdout
+
+        # Get any printed output
+        output = captured_output.getvalue()
+        output_info = _output_info(captured_output)
+        captured_output.close()
+
+        # Commit the transaction
+        t.commit()
+
+        result = {
+            "status": "success",
+            "description": description,
+            "output": (
+                output
+                if output
+                else "Code executed successfully (no output)"
+            ),
+            "code_executed": code_to_execute,
+            "compiled_from_cache": compiled_from_cache,
+            "transaction": t.to_dict(),
+            "output_info": output_info,
+            "budget": budget.to_dict(captured_output.written),
+        }
+        if session:
+            result["session"] = _finish_session_run(session)
+
+        return routes.make_response(data=result)
+
+    except (Exception, BudgetExceeded) as exec_error:
+        # Restore stdout if something went wrong
+        sys.stdout = old_stdout
+        output = captured_output.getvalue()
+        captured_output.close()
+
+        # Rollback transaction if it's still active
+        t.rollback()
+
+        # Get the full traceback
+        error_traceback = traceback.format_exc()
+
+        logger.error("Code execution failed: {}".format(str(exec_error)))
+        logger.error("Traceback: {}".format(error_traceback))
+
+        result = {
+            "status": "error",
+            "error": str(exec_error),
+            "traceback": error_traceback,
+            "code_attempted": code_to_execute,
+            "transaction": t.to_dict(),
+            "output": output,
+            "budget": budget.to_dict(captured_output.written),
+        }
+        if transaction_mode == "read_only" and isinstance(
+            exec_error, InvalidOperationException
+        ):
+            result["hint"] = (
+                "read_only mode runs without a transaction, so the model "
+                "cannot be modified; use transaction_mode 'auto' or 'always'"
+            )
+        if session:
+            result["session"] = _finish_session_run(session)
+
+        return routes.make_response(data=result, status=500)
+
+
+def _output_info(captured_output):
+    return {
+        "chars": captured_output.written,
+        "max_chars": captured_output.max_chars,
+        "truncated": captured_output.truncated,
+        "streamed": captured_output.stream,
+    }
+
+
+def _budget_limit(data, name, default, limit):
+    """A budget value from the payload; zero or less asks for the maximum"""
+    value = data.get(name)
+    if value is None:
+        return default
+    value = float(value) if name == "max_seconds" else int(value)
+    if value <= 0:
+        return limit
+    return min(value, limit)
+
+
+def _finish_session_run(session):
+    """
+    Record a run and enforce the name count and size caps on its namespace
+
+    A session over either cap is dropped after the run.
+    """
+    session.runs += 1
+    session.last_used = time.time()
+    info = session.to_dict()
+    info["approx_bytes"] = session.approximate_bytes()
+    if info["names"] > MAX_NAMES_PER_SESSION:
+        code_sessions.discard(session.name)
+        info["reset"] = "Session held {} names (max {}) and was cleared".format(
+            info["names"], MAX_NAMES_PER_SESSION
+        )
+    elif info["approx_bytes"] > MAX_SESSION_BYTES:
+        code_sessions.discard(session.name)
+        info["reset"] = (
+            "Session held about {} MB (max {} MB) and was cleared; keep large "
+            "results out of session variables".format(
+                info["approx_bytes"] // (1024 * 1024), MAX_SESSION_BYTES // (1024 * 1024)
+            )
+        )
+    return info
+
 
 def register_code_execution_routes(api):
     """Register code execution routes with the API."""
@@ -25,8 +682,23 @@ def register_code_execution_routes(api):
         Expected payload:
         {
             "code": "python code as string",
-            "description": "optional description of what the code does"
+            "description": "optional description of what the code does",
+            "session": "optional name of a namespace kept between calls",
+            "reset_session": false,  // start the named session afresh
+            "transaction_mode": "always",  // or "auto" (keep only if the model
+                                           // changed) or "read_only" (no transaction)
+            "stream": false,  // send printed output to the job log as it is written
+            "max_output": 200000,  // characters of printed output kept
+            "abort_on_output_limit": false,  // roll back instead of truncating
+            "max_seconds": 300,  // wall-clock budget
+            "max_iterations": 1000000  // items yielded by iterate()
         }
+
+        Budgets are checked cooperatively by print, iterate(items) and
+        check_budget(); a script that hits one is stopped and rolled back.
+
+        Pass ?async=1 to queue the execution as a job and poll /jobs/<job_id>;
+        with "stream" the output so far is read from /jobs/<job_id>?since=N.
         """
         try:
             # Parse the request data
@@ -43,81 +715,78 @@ def register_code_execution_routes(api):
                     data={"error": "No code provided"}, status=400
                 )
 
-            logger.info("Executing code: {}".format(description))
+            transaction_mode = data.get("transaction_mode") or (
+                "read_only" if data.get("read_only") else "always"
+            )
+            if transaction_mode not in TRANSACTION_MODES:
+                return routes.make_response(
+                    data={
+                        "error": "transaction_mode must be one of {}".format(
+                            ", ".join(TRANSACTION_MODES)
+                        )
+                    },
+                    status=400,
+                )
 
-            # Create a transaction for any model modifications
-            t = DB.Transaction(doc, "MCP Code Execution: {}".format(description))
-            t.Start()
+            try:
+                max_output = int(data.get("max_output") or DEFAULT_MAX_OUTPUT)
+            except (TypeError, ValueError):
+                return routes.make_response(
+                    data={"error": "max_output must be an integer"}, status=400
+                )
+            max_output = max(1, min(max_output, MAX_OUTPUT_LIMIT))
 
             try:
-                # Capture stdout to return any print statements
-                old_stdout = sys.stdout
-                captured_output = StringIO()
-                sys.stdout = captured_output
-
-                # Create a namespace with common Revit objects available
-                namespace = {
-                    "doc": doc,
-                    "DB": DB,
-                    "revit": revit,
-                    "__builtins__": __builtins__,
-                    "print": lambda *args: captured_output.write(
-                        " ".join(str(arg) for arg in args) + "\n"
+                budget = ExecutionBudget(
+                    max_seconds=_budget_limit(
+                        data, "max_seconds", DEFAULT_MAX_SECONDS, MAX_SECONDS_LIMIT
                     ),
-                }
-
-                # Execute the code
-                exec(code_to_execute, namespace)
-
-                # Restore stdout
-                sys.stdout = old_stdout
-
-                # Get any printed output
-                output = captured_output.getvalue()
-                captured_output.close()
-
-                # Commit the transaction
-                t.Commit()
-
+                    max_iterations=_budget_limit(
+                        data,
+                        "max_iterations",
+                        DEFAULT_MAX_ITERATIONS,
+                        MAX_ITERATIONS_LIMIT,
+                    ),
+                    output_limit=(
+                        max_output if data.get("abort_on_output_limit") else None
+                    ),
+                )
+            except (TypeError, ValueError):
                 return routes.make_response(
-                    data={
-                        "status": "success",
-                        "description": description,
-                        "output": (
-                            output
-                            if output
-                            else "Code executed successfully (no output)"
-                        ),
-                        "code_executed": code_to_execute,
-                    }
+                    data={"error": "max_seconds and max_iterations must be numbers"},
+                    status=400,
                 )
 
-            except Exception as exec_error:
-                # Restore stdout if something went wrong
-                sys.stdout = old_stdout
-
-                # Rollback transaction if it's still active
-                if t.HasStarted() and not t.HasEnded():
-                    t.RollBack()
-
-                # Get the full traceback
-                error_traceback = traceback.format_exc()
-
-                logger.error("Code execution failed: {}".format(str(exec_error)))
-                logger.error("Traceback: {}".format(error_traceback))
+            logger.info("Executing code: {}".format(description))
 
-                return routes.make_response(
-                    data={
-                        "status": "error",
-                        "error": str(exec_error),
-                        "traceback": error_traceback,
-                        "code_attempted": code_to_execute,
-                    },
-                    status=500,
-                )
+            return run_or_submit(
+                request,
+                "execute_code",
+                lambda: run_code(
+                    doc,
+                    code_to_execute,
+                    description,
+                    session_name=data.get("session"),
+                    reset_session=bool(data.get("reset_session", False)),
+                    transaction_mode=transaction_mode,
+                    stream=bool(data.get("stream", False)),
+                    max_output=max_output,
+                    budget=budget,
+                ),
+            )
 
         except Exception as e:
             logger.error("Execute code request failed: {}".format(str(e)))
             return routes.make_response(data={"error": str(e)}, status=500)
 
+    @api.route("/code_sessions/", methods=["GET"])
+    def list_code_sessions():
+        """List open code sessions and compiled code cache statistics."""
+        return routes.make_response(
+            data={
+                "sessions": code_sessions.list(),
+                "compiled_code": compiled_code.stats(),
+            }
+        )
+
     logger.info("Code execution routes registered successfully.")
@@ -9,7 +9,8 @@ import json
 import logging
 import random
 from collections import defaultdict
-from .utils import normalize_string
+from .utils import normalize_string, resolve_category_id
+from .jobs import run_or_submit, report_progress
 
 logger = logging.getLogger(__name__)
 
@@ -229,6 +230,39 @@ def get_parameter_value_safe(element, parameter_name):
         return "No Value"
 
 
+def _is_yes_no(param):
+    """Check whether an integer parameter is a Yes/No parameter"""
+    if hasattr(param.Definition, "GetDataType"):
+        if hasattr(DB, "SpecTypeId") and hasattr(DB.SpecTypeId, "Boolean"):
+            return param.Definition.GetDataType() == DB.SpecTypeId.Boolean.YesNo
+    elif hasattr(param.Definition, "ParameterType"):
+        return param.Definition.ParameterType == DB.ParameterType.YesNo
+    return False
+
+
+def lookup_parameter(element, parameter_name):
+    """
+    Find a parameter by name on the element, falling back to its type
+
+    Args:
+        element: Revit element
+        parameter_name (str): Name of the parameter
+
+    Returns:
+        DB.Parameter or None
+    """
+    param = element.LookupParameter(parameter_name)
+    if param is not None:
+        return param
+    try:
+        element_type = element.Document.GetElement(element.GetTypeId())
+        if element_type:
+            return element_type.LookupParameter(parameter_name)
+    except Exception:
+        pass
+    return None
+
+
 def get_parameter_value_improved(element, parameter_name):
     """
     Improved parameter value extraction based on the baseline code
@@ -241,77 +275,34 @@ def get_parameter_value_improved(element, parameter_name):
         str: Parameter value as string, or "None" if not found
     """
     try:
-        # Try to get parameter by name from element
-        for param in element.Parameters:
-            if param.Definition.Name == parameter_name:
-                if not param.HasValue:
-                    return "None"
-
-                if param.StorageType == DB.StorageType.Double:
-                    return param.AsValueString() or "None"
-                elif param.StorageType == DB.StorageType.ElementId:
-                    id_val = param.AsElementId()
-                    if id_val and id_val != DB.ElementId.InvalidElementId:
-                        try:
-                            elem = element.Document.GetElement(id_val)
-                            if elem and hasattr(elem, "Name"):
-                                return elem.Name or "None"
-                        except:
-                            pass
-                    return "None"
-                elif param.StorageType == DB.StorageType.Integer:
-                    # Handle Yes/No parameters
-                    try:
-                        if hasattr(param.Definition, "GetDataType"):
-                            param_type = param.Definition.GetDataType()
-                            if hasattr(DB, "SpecTypeId") and hasattr(
-                                DB.SpecTypeId, "Boolean"
-                            ):
-                                if param_type == DB.SpecTypeId.Boolean.YesNo:
-                                    return "True" if param.AsInteger() == 1 else "False"
-                        elif hasattr(param.Definition, "ParameterType"):
-                            param_type = param.Definition.ParameterType
-                            if param_type == DB.ParameterType.YesNo:
-                                return "True" if param.AsInteger() == 1 else "False"
-
-                        return param.AsValueString() or str(param.AsInteger())
-                    except:
-                        return str(param.AsInteger())
-                elif param.StorageType == DB.StorageType.String:
-                    return param.AsString() or "None"
-                else:
-                    return param.AsValueString() or "None"
-
-        # Try type parameters if not found in instance
-        try:
-            element_type = element.Document.GetElement(element.GetTypeId())
-            if element_type:
-                for param in element_type.Parameters:
-                    if param.Definition.Name == parameter_name:
-                        if not param.HasValue:
-                            return "None"
-
-                        if param.StorageType == DB.StorageType.Double:
-                            return param.AsValueString() or "None"
-                        elif param.StorageType == DB.StorageType.ElementId:
-                            id_val = param.AsElementId()
-                            if id_val and id_val != DB.ElementId.InvalidElementId:
-                                try:
-                                    elem = element.Document.GetElement(id_val)
-                                    if elem and hasattr(elem, "Name"):
-                                        return elem.Name or "None"
-                                except:
-                                    pass
-                        elif param.StorageType == DB.StorageType.Integer:
-                            return param.AsValueString() or str(param.AsInteger())
-                        elif param.StorageType == DB.StorageType.String:
-                            return param.AsString() or "None"
-                        else:
-                            return param.AsValueString() or "None"
-        except:
-            pass
+        param = lookup_parameter(element, parameter_name)
+        if param is None or not param.HasValue:
+            return "None"
 
-        return "None"
+        if param.StorageType == DB.StorageType.Double:
+            return param.AsValueString() or "None"
+        elif param.StorageType == DB.StorageType.ElementId:
+            id_val = param.AsElementId()
+            if id_val and id_val != DB.ElementId.InvalidElementId:
+                try:
+                    elem = element.Document.GetElement(id_val)
+                    if elem and hasattr(elem, "Name"):
+                        return elem.Name or "None"
+                except:
+                    pass
+            return "None"
+        elif param.StorageType == DB.StorageType.Integer:
+            # Handle Yes/No parameters
+            try:
+                if _is_yes_no(param):
+                    return "True" if param.AsInteger() == 1 else "False"
+                return param.AsValueString() or str(param.AsInteger())
+            except:
+                return str(param.AsInteger())
+        elif param.StorageType == DB.StorageType.String:
+            return param.AsString() or "None"
+        else:
+            return param.AsValueString() or "None"
 
     except Exception as e:
         logger.debug("Error getting parameter %s from element: %s", parameter_name, e)
@@ -406,6 +397,99 @@ def solid_fill_pattern_id(doc):
         return None
 
 
+def resolve_target_views(doc, apply_to="same_view_type"):
+    """
+    Resolve the views that color overrides should be applied to
+
+    Args:
+        doc: Revit document
+        apply_to: "active_view", "same_view_type" (active view plus every other
+            non-template view of the same type) or a list of view ids
+
+    Returns:
+        tuple: (list of DB.View, error message or None)
+    """
+    active_view = doc.ActiveView
+
+    if isinstance(apply_to, (list, tuple)):
+        views = []
+        invalid = []
+        for view_id in apply_to:
+            try:
+                view = doc.GetElement(DB.ElementId(int(view_id)))
+            except (ValueError, TypeError):
+                view = None
+            if isinstance(view, DB.View) and not view.IsTemplate:
+                views.append(view)
+            else:
+                invalid.append(str(view_id))
+        if invalid:
+            return [], "Not a valid view id: {}".format(", ".join(invalid))
+
+    elif apply_to == "active_view":
+        views = [active_view]
+
+    elif apply_to == "same_view_type":
+        views = [active_view]
+        # One collector pass for the whole request instead of one per element
+        for view in DB.FilteredElementCollector(doc).OfClass(DB.View):
+            if (
+                not view.IsTemplate
+                and view.ViewType == active_view.ViewType
+                and view.Id != active_view.Id
+            ):
+                views.append(view)
+
+    else:
+        return [], (
+            "Invalid apply_to '{}': use 'active_view', 'same_view_type' "
+            "or a list of view ids".format(apply_to)
+        )
+
+    target_views = []
+    for view in views:
+        try:
+            if view.AreGraphicsOverridesAllowed():
+                target_views.append(view)
+        except Exception:
+            continue
+
+    if not target_views:
+        return [], "None of the target views allow graphic overrides"
+
+    return target_views, None
+
+
+def apply_overrides(views, element_ids, override_settings):
+    """
+    Apply one OverrideGraphicSettings to many elements, view by view
+
+    Args:
+        views (list): Target views from resolve_target_views
+        element_ids (list): DB.ElementId of the elements to override
+        override_settings: Shared DB.OverrideGraphicSettings instance
+
+    Returns:
+        set: Integer ids of elements overridden in at least one view
+    """
+    overridden = set()
+    for view in views:
+        failures = 0
+        for element_id in element_ids:
+            try:
+                view.SetElementOverrides(element_id, override_settings)
+                overridden.add(element_id.IntegerValue)
+            except Exception:
+                failures += 1
+        if failures:
+            logger.warning(
+                "Could not override %d elements in view %s",
+                failures,
+                view.Id.IntegerValue,
+            )
+    return overridden
+
+
 def generate_random_color():
     """
     Generate a random RGB color
@@ -451,150 +535,161 @@ def safe_float_conversion(value_str):
         return float("inf")  # Non-numeric values go to end
 
 
-def get_parameter_value_for_sorting(element, parameter_name):
+def read_parameter_for_sorting(param, doc):
     """
-    Get parameter value optimized for numeric sorting, following script.py pattern
+    Read a parameter as a (raw_value, display_value) pair for sorting
 
     Args:
-        element: Revit element
-        parameter_name (str): Name of the parameter
+        param: Revit parameter
+        doc: Document owning the parameter, used to name ElementId values
 
     Returns:
         tuple: (raw_value, display_value) for sorting and display
     """
-    try:
-        # Try instance parameters first
-        for param in element.Parameters:
-            if param.Definition.Name == parameter_name:
-                if not param.HasValue:
-                    return ("None", "None")
+    if not param.HasValue:
+        return ("None", "None")
 
-                if param.StorageType == DB.StorageType.Double:
-                    # Get both raw and display values
-                    raw_value = param.AsDouble()
-                    display_value = param.AsValueString() or str(raw_value)
-                    return (raw_value, display_value)
-
-                elif param.StorageType == DB.StorageType.Integer:
-                    # Handle Yes/No and regular integers
-                    try:
-                        if hasattr(param.Definition, "GetDataType"):
-                            param_type = param.Definition.GetDataType()
-                            if hasattr(DB, "SpecTypeId") and hasattr(
-                                DB.SpecTypeId, "Boolean"
-                            ):
-                                if param_type == DB.SpecTypeId.Boolean.YesNo:
-                                    bool_val = (
-                                        "True" if param.AsInteger() == 1 else "False"
-                                    )
-                                    return (bool_val, bool_val)
-                        elif hasattr(param.Definition, "ParameterType"):
-                            param_type = param.Definition.ParameterType
-                            if param_type == DB.ParameterType.YesNo:
-                                bool_val = "True" if param.AsInteger() == 1 else "False"
-                                return (bool_val, bool_val)
-
-                        int_value = param.AsInteger()
-                        display_value = param.AsValueString() or str(int_value)
-                        return (int_value, display_value)
-                    except:
-                        int_value = param.AsInteger()
-                        return (int_value, str(int_value))
-
-                elif param.StorageType == DB.StorageType.String:
-                    string_value = param.AsString() or "None"
-                    return (string_value, string_value)
-
-                elif param.StorageType == DB.StorageType.ElementId:
-                    id_val = param.AsElementId()
-                    if id_val and id_val != DB.ElementId.InvalidElementId:
-                        try:
-                            elem = element.Document.GetElement(id_val)
-                            if elem and hasattr(elem, "Name"):
-                                elem_name = elem.Name or "None"
-                                return (elem_name, elem_name)
-                        except:
-                            pass
-                    return ("None", "None")
-                else:
-                    value_str = param.AsValueString() or "None"
-                    return (value_str, value_str)
+    if param.StorageType == DB.StorageType.Double:
+        # Get both raw and display values
+        raw_value = param.AsDouble()
+        display_value = param.AsValueString() or str(raw_value)
+        return (raw_value, display_value)
 
-        # Try type parameters if not found in instance
+    elif param.StorageType == DB.StorageType.Integer:
+        # Handle Yes/No and regular integers
+        try:
+            if _is_yes_no(param):
+                bool_val = "True" if param.AsInteger() == 1 else "False"
+                return (bool_val, bool_val)
+
+            int_value = param.AsInteger()
+            display_value = param.AsValueString() or str(int_value)
+            return (int_value, display_value)
+        except:
+            int_value = param.AsInteger()
+            return (int_value, str(int_value))
+
+    elif param.StorageType == DB.StorageType.String:
+        string_value = param.AsString() or "None"
+        return (string_value, string_value)
+
+    elif param.StorageType == DB.StorageType.ElementId:
+        id_val = param.AsElementId()
+        if id_val and id_val != DB.ElementId.InvalidElementId:
+            try:
+                elem = doc.GetElement(id_val)
+                if elem and hasattr(elem, "Name"):
+                    elem_name = elem.Name or "None"
+                    return (elem_name, elem_name)
+            except:
+                pass
+        return ("None", "None")
+    else:
+        value_str = param.AsValueString() or "None"
+        return (value_str, value_str)
+
+
+class ParameterResolver(object):
+    """
+    Per-request lookup of one parameter across many elements
+
+    Decides once per element type whether the parameter lives on the
+    instance or on the type, and memoizes type-level values by type id so
+    elements sharing a type do not rescan the type's parameters.
+    """
+
+    _INSTANCE = "instance"
+    _TYPE = "type"
+
+    def __init__(self, parameter_name):
+        self.parameter_name = parameter_name
+        self._definition = None
+        self._location_by_type = {}
+        self._type_values = {}
+
+    def _instance_parameter(self, element):
+        # get_Parameter(Definition) skips the name lookup once the definition is known
+        if self._definition is not None:
+            try:
+                param = element.get_Parameter(self._definition)
+                if param is not None:
+                    return param
+            except Exception:
+                pass
+        param = element.LookupParameter(self.parameter_name)
+        if param is not None and self._definition is None:
+            self._definition = param.Definition
+        return param
+
+    def _type_value(self, element, type_id):
+        if type_id in self._type_values:
+            return self._type_values[type_id]
+        value = ("None", "None")
         try:
             element_type = element.Document.GetElement(element.GetTypeId())
             if element_type:
-                for param in element_type.Parameters:
-                    if param.Definition.Name == parameter_name:
-                        if not param.HasValue:
-                            return ("None", "None")
-
-                        if param.StorageType == DB.StorageType.Double:
-                            raw_value = param.AsDouble()
-                            display_value = param.AsValueString() or str(raw_value)
-                            return (raw_value, display_value)
-
-                        elif param.StorageType == DB.StorageType.Integer:
-                            try:
-                                if hasattr(param.Definition, "GetDataType"):
-                                    param_type = param.Definition.GetDataType()
-                                    if hasattr(DB, "SpecTypeId") and hasattr(
-                                        DB.SpecTypeId, "Boolean"
-                                    ):
-                                        if param_type == DB.SpecTypeId.Boolean.YesNo:
-                                            bool_val = (
-                                                "True"
-                                                if param.AsInteger() == 1
-                                                else "False"
-                                            )
-                                            return (bool_val, bool_val)
-                                elif hasattr(param.Definition, "ParameterType"):
-                                    param_type = param.Definition.ParameterType
-                                    if param_type == DB.ParameterType.YesNo:
-                                        bool_val = (
-                                            "True"
-                                            if param.AsInteger() == 1
-                                            else "False"
-                                        )
-                                        return (bool_val, bool_val)
-
-                                int_value = param.AsInteger()
-                                display_value = param.AsValueString() or str(int_value)
-                                return (int_value, display_value)
-                            except:
-                                int_value = param.AsInteger()
-                                return (int_value, str(int_value))
-
-                        elif param.StorageType == DB.StorageType.String:
-                            string_value = param.AsString() or "None"
-                            return (string_value, string_value)
-
-                        elif param.StorageType == DB.StorageType.ElementId:
-                            id_val = param.AsElementId()
-                            if id_val and id_val != DB.ElementId.InvalidElementId:
-                                try:
-                                    elem = element.Document.GetElement(id_val)
-                                    if elem and hasattr(elem, "Name"):
-                                        elem_name = elem.Name or "None"
-                                        return (elem_name, elem_name)
-                                except:
-                                    pass
-                            return ("None", "None")
-                        else:
-                            value_str = param.AsValueString() or "None"
-                            return (value_str, value_str)
-        except:
+                param = element_type.LookupParameter(self.parameter_name)
+                if param is not None:
+                    value = read_parameter_for_sorting(param, element.Document)
+        except Exception:
             pass
+        self._type_values[type_id] = value
+        return value
 
-        return ("None", "None")
+    def value_for(self, element):
+        """
+        Get the (raw_value, display_value) pair for an element
 
-    except Exception as e:
-        logger.debug("Error getting parameter %s from element: %s", parameter_name, e)
-        return ("None", "None")
+        Returns:
+            tuple: (raw_value, display_value), ("None", "None") if not found
+        """
+        try:
+            type_id = element.GetTypeId().IntegerValue
+            has_type = type_id != DB.ElementId.InvalidElementId.IntegerValue
+            location = self._location_by_type.get(type_id) if has_type else None
+
+            if location != self._TYPE:
+                param = self._instance_parameter(element)
+                if param is not None:
+                    if has_type:
+                        self._location_by_type[type_id] = self._INSTANCE
+                    return read_parameter_for_sorting(param, element.Document)
+                if not has_type:
+                    return ("None", "None")
+
+            self._location_by_type[type_id] = self._TYPE
+            return self._type_value(element, type_id)
+
+        except Exception as e:
+            logger.debug(
+                "Error getting parameter %s from element: %s", self.parameter_name, e
+            )
+            return ("None", "None")
+
+
+def get_parameter_value_for_sorting(element, parameter_name):
+    """
+    Get parameter value optimized for numeric sorting, following script.py pattern
+
+    For many elements, reuse a ParameterResolver instead of calling this.
+
+    Args:
+        element: Revit element
+        parameter_name (str): Name of the parameter
+
+    Returns:
+        tuple: (raw_value, display_value) for sorting and display
+    """
+    return ParameterResolver(parameter_name).value_for(element)
 
 
 def color_elements_by_parameter(
-    doc, category_name, parameter_name, use_gradient=False, custom_colors=None
+    doc,
+    category_name,
+    parameter_name,
+    use_gradient=False,
+    custom_colors=None,
+    apply_to="same_view_type",
 ):
     """
     Color elements in a category based on parameter values with proper gradient support
@@ -605,21 +700,16 @@ def color_elements_by_parameter(
         parameter_name (str): Name of the parameter to use for coloring
         use_gradient (bool): Whether to use gradient coloring
         custom_colors (list): Optional list of custom hex colors
+        apply_to: Target views, see resolve_target_views
 
     Returns:
         dict: Results of the coloring operation
     """
     try:
         # Find the category
-        categories = doc.Settings.Categories
-        target_category = None
-
-        for cat in categories:
-            if cat.Name == category_name:
-                target_category = cat
-                break
+        target_category_id = resolve_category_id(doc, category_name)
 
-        if not target_category:
+        if target_category_id is None:
             return {
                 "status": "error",
                 "message": "Category '{}' not found".format(category_name),
@@ -628,7 +718,7 @@ def color_elements_by_parameter(
         # Get elements from the category
         collector = (
             DB.FilteredElementCollector(doc)
-            .OfCategoryId(target_category.Id)
+            .OfCategoryId(target_category_id)
             .WhereElementIsNotElementType()
         )
         elements = collector.ToElements()
@@ -643,10 +733,10 @@ def color_elements_by_parameter(
         parameter_groups = defaultdict(list)
         value_data = {}  # Store both raw and display values
 
+        report_progress(0.1, "Reading {} values".format(parameter_name))
+        resolver = ParameterResolver(parameter_name)
         for element in elements:
-            raw_value, display_value = get_parameter_value_for_sorting(
-                element, parameter_name
-            )
+            raw_value, display_value = resolver.value_for(element)
 
             # Use display value as key for grouping
             parameter_groups[display_value].append(element)
@@ -767,9 +857,13 @@ def color_elements_by_parameter(
             # Use distinct colors
             colors = generate_distinct_colors(value_count)
 
+        target_views, view_error = resolve_target_views(doc, apply_to)
+        if view_error:
+            return {"status": "error", "message": view_error}
+
         # Apply colors to elements
         color_assignments = {}
-        elements_colored = 0
+        colored_ids = set()
         solid_fill_id = solid_fill_pattern_id(doc)
 
         with DB.Transaction(doc, "Color Elements by Parameter") as t:
@@ -788,6 +882,10 @@ def color_elements_by_parameter(
 
             for i, param_value in enumerate(unique_values):
                 group_elements = parameter_groups[param_value]
+                report_progress(
+                    0.3 + 0.7 * i / value_count,
+                    "Coloring value {} of {}".format(i + 1, value_count),
+                )
 
                 # Get color for this group
                 if i < len(colors):
@@ -819,44 +917,18 @@ def color_elements_by_parameter(
                     override_settings.SetSurfaceForegroundPatternId(solid_fill_id)
                     override_settings.SetCutForegroundPatternId(solid_fill_id)
 
-                for element in group_elements:
-                    try:
-                        # Apply to active view first (CRITICAL FIX!)
-                        active_view = doc.ActiveView
-                        active_view.SetElementOverrides(element.Id, override_settings)
-                        elements_colored += 1
-
-                        # Optionally apply to other views of same type
-                        try:
-                            if hasattr(active_view, "ViewType"):
-                                view_type = active_view.ViewType
-                                other_views = (
-                                    DB.FilteredElementCollector(doc)
-                                    .OfClass(DB.View)
-                                    .WhereElementIsNotElementType()
-                                )
-                                for view in other_views:
-                                    if (
-                                        not view.IsTemplate
-                                        and hasattr(view, "ViewType")
-                                        and view.ViewType == view_type
-                                        and view.Id != active_view.Id
-                                    ):
-                                        view.SetElementOverrides(
-                                            element.Id, override_settings
-                                        )
-                        except Exception:
-                            pass  # Don't fail if we can't apply to other views
-
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to color element %s: %s",
-                            element.Id.IntegerValue,
-                            e,
-                        )
+                colored_ids.update(
+                    apply_overrides(
+                        target_views,
+                        [element.Id for element in group_elements],
+                        override_settings,
+                    )
+                )
 
             t.Commit()
 
+        elements_colored = len(colored_ids)
+
         result = {
             "status": "success",
             "message": "Successfully colored {} elements in {} color groups".format(
@@ -871,6 +943,7 @@ def color_elements_by_parameter(
                 "unique_parameter_values": value_count,
                 "use_gradient": use_gradient,
                 "sorted_values": unique_values,  # Include sorted values for debugging
+                "views_updated": len(target_views),
             },
         }
 
@@ -889,28 +962,23 @@ def color_elements_by_parameter(
         }
 
 
-def clear_element_colors(doc, category_name):
+def clear_element_colors(doc, category_name, apply_to="same_view_type"):
     """
     Clear color overrides for elements in a category
 
     Args:
         doc: Revit document
         category_name (str): Name of the category to clear colors from
+        apply_to: Target views, see resolve_target_views
 
     Returns:
         dict: Results of the clear operation
     """
     try:
         # Find the category
-        categories = doc.Settings.Categories
-        target_category = None
+        target_category_id = resolve_category_id(doc, category_name)
 
-        for cat in categories:
-            if cat.Name == category_name:
-                target_category = cat
-                break
-
-        if not target_category:
+        if target_category_id is None:
             return {
                 "status": "error",
                 "message": "Category '{}' not found".format(category_name),
@@ -919,7 +987,7 @@ def clear_element_colors(doc, category_name):
         # Get elements from the category
         collector = (
             DB.FilteredElementCollector(doc)
-            .OfCategoryId(target_category.Id)
+            .OfCategoryId(target_category_id)
             .WhereElementIsNotElementType()
         )
         elements = collector.ToElements()
@@ -930,50 +998,24 @@ def clear_element_colors(doc, category_name):
                 "message": "No elements found in category '{}'".format(category_name),
             }
 
-        elements_cleared = 0
-
-        # Get active view for clearing overrides
-        active_view = doc.ActiveView
+        target_views, view_error = resolve_target_views(doc, apply_to)
+        if view_error:
+            return {"status": "error", "message": view_error}
 
         with DB.Transaction(doc, "Clear Element Colors") as t:
             t.Start()
 
-            # Clear overrides for each element in active view
-            for element in elements:
-                try:
-                    empty_override = DB.OverrideGraphicSettings()
-                    active_view.SetElementOverrides(element.Id, empty_override)
-                    elements_cleared += 1
-
-                    # Optionally clear from other views of same type
-                    try:
-                        if hasattr(active_view, "ViewType"):
-                            view_type = active_view.ViewType
-                            other_views = (
-                                DB.FilteredElementCollector(doc)
-                                .OfClass(DB.View)
-                                .WhereElementIsNotElementType()
-                            )
-                            for view in other_views:
-                                if (
-                                    not view.IsTemplate
-                                    and hasattr(view, "ViewType")
-                                    and view.ViewType == view_type
-                                    and view.Id != active_view.Id
-                                ):
-                                    view.SetElementOverrides(element.Id, empty_override)
-                    except Exception:
-                        pass  # Don't fail if we can't clear from other views
-
-                except Exception as e:
-                    logger.warning(
-                        "Failed to clear colors for element %s: %s",
-                        element.Id.IntegerValue,
-                        e,
-                    )
+            # A single empty override clears every element in every target view
+            cleared_ids = apply_overrides(
+                target_views,
+                [element.Id for element in elements],
+                DB.OverrideGraphicSettings(),
+            )
 
             t.Commit()
 
+        elements_cleared = len(cleared_ids)
+
         return {
             "status": "success",
             "message": "Successfully cleared color overrides for {} elements".format(
@@ -981,6 +1023,7 @@ def clear_element_colors(doc, category_name):
             ),
             "category": category_name,
             "elements_processed": elements_cleared,
+            "views_updated": len(target_views),
         }
 
     except Exception as e:
@@ -1004,15 +1047,9 @@ def list_category_parameters(doc, category_name):
     """
     try:
         # Find the category
-        categories = doc.Settings.Categories
-        target_category = None
+        target_category_id = resolve_category_id(doc, category_name)
 
-        for cat in categories:
-            if cat.Name == category_name:
-                target_category = cat
-                break
-
-        if not target_category:
+        if target_category_id is None:
             return {
                 "status": "error",
                 "message": "Category '{}' not found".format(category_name),
@@ -1021,7 +1058,7 @@ def list_category_parameters(doc, category_name):
         # Get a sample element from the category to check parameters
         collector = (
             DB.FilteredElementCollector(doc)
-            .OfCategoryId(target_category.Id)
+            .OfCategoryId(target_category_id)
             .WhereElementIsNotElementType()
         )
         elements = collector.ToElements()
@@ -1043,11 +1080,12 @@ def list_category_parameters(doc, category_name):
                 storage_type = str(param.StorageType)
                 has_value = param.HasValue
 
-                # Get a sample value if available (JSON-safe)
+                # Get a sample value if available (JSON-safe), reading the
+                # parameter we already hold instead of looking it up by name
                 sample_value = "N/A"
                 if has_value:
-                    sample_value = get_parameter_value_json_safe(
-                        sample_element, param_name
+                    sample_value = clean_parameter_value_for_json(
+                        read_parameter_for_sorting(param, doc)[1]
                     )
 
                 parameters.append(
@@ -1094,8 +1132,11 @@ def register_color_routes(api):
             "category_name": "Walls",
             "parameter_name": "Mark",
             "use_gradient": false,
-            "custom_colors": ["#FF0000", "#00FF00", "#0000FF"]  // optional
+            "custom_colors": ["#FF0000", "#00FF00", "#0000FF"],  // optional
+            "apply_to": "same_view_type"  // optional: "active_view" or a list of view ids
         }
+
+        Pass ?async=1 to queue the work as a job and poll /jobs/<job_id>.
         """
         try:
             data = (
@@ -1108,6 +1149,7 @@ def register_color_routes(api):
             parameter_name = data.get("parameter_name")
             use_gradient = data.get("use_gradient", False)
             custom_colors = data.get("custom_colors", None)
+            apply_to = data.get("apply_to") or "same_view_type"
 
             if not category_name or not parameter_name:
                 return routes.make_response(
@@ -1115,12 +1157,21 @@ def register_color_routes(api):
                     status=400,
                 )
 
-            result = color_elements_by_parameter(
-                doc, category_name, parameter_name, use_gradient, custom_colors
+            return run_or_submit(
+                request,
+                "color_splash",
+                lambda: routes.make_response(
+                    data=color_elements_by_parameter(
+                        doc,
+                        category_name,
+                        parameter_name,
+                        use_gradient,
+                        custom_colors,
+                        apply_to,
+                    )
+                ),
             )
 
-            return routes.make_response(data=result)
-
         except Exception as e:
             logger.error("Error in color_splash route: %s", e)
             return routes.make_response(data={"error": str(e)}, status=500)
@@ -1132,8 +1183,11 @@ def register_color_routes(api):
 
         Expected JSON payload:
         {
-            "category_name": "Walls"
+            "category_name": "Walls",
+            "apply_to": "same_view_type"  // optional: "active_view" or a list of view ids
         }
+
+        Pass ?async=1 to queue the work as a job and poll /jobs/<job_id>.
         """
         try:
             data = (
@@ -1149,9 +1203,14 @@ def register_color_routes(api):
                     data={"error": "category_name is required"}, status=400
                 )
 
-            result = clear_element_colors(doc, category_name)
-
-            return routes.make_response(data=result)
+            apply_to = data.get("apply_to") or "same_view_type"
+            return run_or_submit(
+                request,
+                "clear_colors",
+                lambda: routes.make_response(
+                    data=clear_element_colors(doc, category_name, apply_to)
+                ),
+            )
 
         except Exception as e:
             logger.error("Error in clear_colors route: %s", e)
@@ -0,0 +1,175 @@
+# -*- coding: UTF-8 -*-
+"""
+Image Cache Module for Revit MCP
+Size-bounded on-disk cache of exported view images
+
+Entries are keyed by document, view id, export options and the document's
+change counter (see ResultCache.document_version), plus a token unique to
+this Revit session, since the counters restart at zero on every launch.
+An edit bumps the counter, so stale images are never served; they simply
+age out of the LRU. The key doubles as the ETag of the image. Like cache.py,
+the module has no Revit imports.
+"""
+
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import uuid
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "RevitMCPExports", "cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Distinguishes this Revit session's entries from leftovers of earlier ones
+SESSION_TOKEN = uuid.uuid4().hex
+
+_DATA_SUFFIX = ".bin"
+_META_SUFFIX = ".json"
+
+
+class ImageCache(object):
+    """
+    LRU cache of image bytes and their metadata, stored as file pairs
+
+    The in-memory index is rebuilt from the directory on first use, ordered
+    by modification time, so leftovers from earlier sessions are evicted
+    first.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._index = None
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def key(self, doc_key, view_id, options, version):
+        """Cache key and ETag for one export of one view"""
+        raw = json.dumps(
+            [SESSION_TOKEN, doc_key, view_id, options, version],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + _DATA_SUFFIX, base + _META_SUFFIX
+
+    def _load_index(self):
+        """Build the key -> size index from the files on disk"""
+        self._index = OrderedDict()
+        self._total = 0
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+            return
+
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(_DATA_SUFFIX):
+                continue
+            key = name[: -len(_DATA_SUFFIX)]
+            data_path, meta_path = self._paths(key)
+            try:
+                size = os.path.getsize(data_path) + os.path.getsize(meta_path)
+                entries.append((os.path.getmtime(data_path), key, size))
+            except OSError:
+                self._remove_files(key)
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total += size
+
+    def _ensure_index(self):
+        if self._index is None:
+            self._load_index()
+
+    def _remove_files(self, key):
+        for path in self._paths(key):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                logger.warning("Could not remove cached image %s: %s", path, e)
+
+    def _evict(self):
+        while self._total > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total -= size
+            self._remove_files(key)
+
+    def get(self, key):
+        """Return (image bytes, metadata) or None on a miss"""
+        with self._lock:
+            self._ensure_index()
+            if key not in self._index:
+                self.misses += 1
+                return None
+            data_path, meta_path = self._paths(key)
+            try:
+                with open(meta_path, "r") as meta_file:
+                    metadata = json.load(meta_file)
+                with open(data_path, "rb") as data_file:
+                    data = data_file.read()
+                os.utime(data_path, None)
+            except (IOError, OSError, ValueError) as e:
+                logger.warning("Dropping unreadable cached image %s: %s", key, e)
+                self._total -= self._index.pop(key)
+                self._remove_files(key)
+                self.misses += 1
+                return None
+
+            # Re-insert to mark as most recently used
+            self._index[key] = self._index.pop(key)
+            self.hits += 1
+            return data, metadata
+
+    def put(self, key, data, metadata):
+        """Store image bytes with JSON-serializable metadata"""
+        with self._lock:
+            self._ensure_index()
+            data_path, meta_path = self._paths(key)
+            try:
+                with open(meta_path, "w") as meta_file:
+                    json.dump(metadata, meta_file)
+                with open(data_path, "wb") as data_file:
+                    data_file.write(data)
+                size = os.path.getsize(data_path) + os.path.getsize(meta_path)
+            except (IOError, OSError) as e:
+                logger.warning("Could not cache image %s: %s", key, e)
+                self._remove_files(key)
+                return
+
+            self._total -= self._index.pop(key, 0)
+            self._index[key] = size
+            self._total += size
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._ensure_index()
+            for key in list(self._index):
+                self._remove_files(key)
+            self._index.clear()
+            self._total = 0
+
+    def stats(self):
+        with self._lock:
+            self._ensure_index()
+            return {
+                "entries": len(self._index),
+                "bytes": self._total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Shared instance used by the views module
+image_cache = ImageCache()
@@ -0,0 +1,366 @@
+# -*- coding: UTF-8 -*-
+"""
+Jobs Module for Revit MCP
+Runs long operations in the background and lets clients poll for the result
+
+A route called with ?async=1 queues its work as a job and answers 202 with a
+job id right away. The queued work runs on Revit's UI thread through an
+ExternalEvent, so the HTTP request never waits on it. /jobs/<job_id> takes
+no document argument, which lets pyRevit answer it while a job is running.
+Jobs can also append text to a log that clients read incrementally with
+/jobs/<job_id>?since=N.
+
+Binary results (exported images) are handed out once: /jobs/<job_id>/result
+releases them, and only the newest MAX_RETAINED_BINARY_RESULTS unfetched
+ones are kept.
+"""
+
+from pyrevit import routes
+from collections import OrderedDict
+import logging
+import threading
+import time
+import traceback
+import uuid
+
+from utils import get_request_params, unpack_response
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept around for polling; the oldest are dropped first
+MAX_RETAINED_JOBS = 100
+
+# Unfetched binary results kept; older ones are released, keeping the job
+MAX_RETAINED_BINARY_RESULTS = 10
+
+# Log chunks kept per job; older chunks are dropped but still counted
+MAX_LOG_CHUNKS = 1000
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+def wants_async(request):
+    """True when the caller asked for ?async=1"""
+    value = str(get_request_params(request).get("async", "")).lower()
+    return value in ("1", "true", "yes")
+
+
+def binary_content_type(response):
+    """Content type of a route response carrying raw bytes, else None"""
+    headers = getattr(response, "headers", None) or {}
+    content_type = headers.get("Content-Type", "")
+    if content_type.startswith("image/"):
+        return content_type
+    return None
+
+
+class Job(object):
+    """A unit of queued work and its outcome"""
+
+    def __init__(self, name, func):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.func = func
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = "Queued"
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.result_status = None
+        self.result = None
+        self.response = None
+        self.content_type = None
+        self.log = []
+        self.log_dropped = 0
+
+    @property
+    def done(self):
+        return self.status in (SUCCEEDED, FAILED)
+
+    def report(self, progress=None, message=None):
+        if progress is not None:
+            self.progress = max(0.0, min(1.0, float(progress)))
+        if message is not None:
+            self.message = message
+
+    def append_log(self, text):
+        if not text:
+            return
+        self.log.append(text)
+        if len(self.log) > MAX_LOG_CHUNKS:
+            del self.log[0]
+            self.log_dropped += 1
+
+    def log_since(self, since):
+        """Log chunks from index since on, and the index to ask for next"""
+        total = self.log_dropped + len(self.log)
+        start = max(0, min(since, total) - self.log_dropped)
+        return self.log[start:], total
+
+    def release_response(self):
+        """Drop a binary result; its status and content type stay reported"""
+        self.response = None
+
+    def run(self):
+        self.status = RUNNING
+        self.started = time.time()
+        self.message = "Running"
+        try:
+            response = self.func()
+            status, data = unpack_response(response)
+        except Exception as e:
+            logger.error("Job {} ({}) failed: {}".format(self.job_id, self.name, e))
+            response = None
+            status, data = 500, {"error": str(e), "traceback": traceback.format_exc()}
+
+        self.result_status = status
+        if binary_content_type(response):
+            # Raw bytes are not JSON; keep the response for /jobs/<job_id>/result
+            self.response = response
+            self.content_type = binary_content_type(response)
+            self.result = None
+        else:
+            self.result = data
+        self.status = SUCCEEDED if status < 400 else FAILED
+        self.progress = 1.0
+        self.message = "Completed" if status < 400 else "Failed"
+        self.finished = time.time()
+        # Release the closure (and the document it holds)
+        self.func = None
+
+    def to_dict(self, include_result=True, log_since=None):
+        end = self.finished or time.time()
+        info = {
+            "job_id": self.job_id,
+            "name": self.name,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "elapsed_seconds": round(end - (self.started or end), 3),
+            "queued_seconds": round((self.started or end) - self.created, 3),
+        }
+        if log_since is not None:
+            info["log"], info["log_next"] = self.log_since(log_since)
+        if include_result and self.done:
+            info["result"] = {"status": self.result_status, "data": self.result}
+            if self.content_type is not None:
+                info["result"].update(
+                    binary=True,
+                    content_type=self.content_type,
+                    url="/jobs/{}/result".format(self.job_id),
+                    released=self.response is None,
+                )
+        return info
+
+
+class JobManager(object):
+    """
+    Queue of jobs drained by a Revit ExternalEvent
+
+    Until attach() has created the ExternalEvent, is_attached is False and
+    routes should run their work synchronously instead of submitting it.
+    """
+
+    def __init__(
+        self,
+        max_retained=MAX_RETAINED_JOBS,
+        max_binary_results=MAX_RETAINED_BINARY_RESULTS,
+    ):
+        self.max_retained = max_retained
+        self.max_binary_results = max_binary_results
+        self._jobs = OrderedDict()
+        self._pending = []
+        self._lock = threading.Lock()
+        self._event = None
+        self._handler = None
+        self._current = None
+
+    @property
+    def is_attached(self):
+        return self._event is not None
+
+    def attach(self):
+        """Create the ExternalEvent; must be called from a Revit API context"""
+        from Autodesk.Revit.UI import ExternalEvent, IExternalEventHandler
+
+        manager = self
+
+        class JobEventHandler(IExternalEventHandler):
+            def Execute(self, uiapp):
+                manager.run_pending()
+
+            def GetName(self):
+                return "Revit MCP Jobs"
+
+        self._handler = JobEventHandler()
+        self._event = ExternalEvent.Create(self._handler)
+
+    def submit(self, name, func):
+        """Queue func (called with no arguments) and return its Job"""
+        job = Job(name, func)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._pending.append(job)
+            self._prune()
+        self._event.Raise()
+        logger.info("Queued job {} ({})".format(job.job_id, name))
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def run_pending(self):
+        """Run every queued job; called by the ExternalEvent on the UI thread"""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                job = self._pending.pop(0)
+            self._current = job
+            try:
+                job.run()
+            finally:
+                self._current = None
+            with self._lock:
+                self._release_binary_results()
+
+    def report_progress(self, progress=None, message=None):
+        """Update the running job, if any; a no-op for synchronous calls"""
+        job = self._current
+        if job is not None:
+            job.report(progress, message)
+
+    def append_log(self, text):
+        """Append to the running job's log; a no-op for synchronous calls"""
+        job = self._current
+        if job is not None:
+            job.append_log(text)
+
+    @property
+    def in_job(self):
+        """True while a job is running on this manager"""
+        return self._current is not None
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        excess = len(self._jobs) - self.max_retained
+        for job_id in finished[: max(0, excess)]:
+            del self._jobs[job_id]
+
+    def _release_binary_results(self):
+        retained = [job for job in self._jobs.values() if job.response is not None]
+        excess = len(retained) - self.max_binary_results
+        for job in retained[: max(0, excess)]:
+            logger.info("Releasing unfetched binary result of job {}".format(job.job_id))
+            job.release_response()
+
+
+# Shared instance used by the route modules
+job_manager = JobManager()
+
+
+def report_progress(progress=None, message=None):
+    """Report progress from inside a route's work function"""
+    job_manager.report_progress(progress, message)
+
+
+def append_log(text):
+    """Append text to the running job's log from inside its work function"""
+    job_manager.append_log(text)
+
+
+def run_or_submit(request, name, func):
+    """
+    Run func now, or queue it as a job when the caller asked for ?async=1
+
+    func takes no arguments and returns a route response. Queued calls
+    answer 202 with the job id to poll at /jobs/<job_id>.
+    """
+    if not wants_async(request) or not job_manager.is_attached:
+        return func()
+
+    job = job_manager.submit(name, func)
+    return routes.make_response(
+        data={
+            "status": "accepted",
+            "job_id": job.job_id,
+            "poll": "/jobs/{}".format(job.job_id),
+        },
+        status=202,
+    )
+
+
+def register_job_routes(api):
+    """Register job status routes with the API"""
+
+    @api.route("/jobs/", methods=["GET"])
+    def list_jobs():
+        """List known jobs without their results"""
+        jobs = [job.to_dict(include_result=False) for job in job_manager.list()]
+        return routes.make_response(
+            data={"jobs": jobs, "count": len(jobs), "attached": job_manager.is_attached}
+        )
+
+    @api.route("/jobs/<job_id>", methods=["GET"])
+    def get_job(job_id, request):
+        """
+        Report a job's progress, and its result once finished
+
+        With ?since=N the response also carries the log chunks from index N
+        on ("log") and the index to pass next time ("log_next").
+        """
+        job = job_manager.get(job_id)
+        if job is None:
+            return routes.make_response(
+                data={"error": "Job not found: {}".format(job_id)}, status=404
+            )
+        since = get_request_params(request).get("since")
+        try:
+            since = int(since) if since not in (None, "") else None
+        except (TypeError, ValueError):
+            return routes.make_response(
+                data={"error": "since must be an integer"}, status=400
+            )
+        return routes.make_response(data=job.to_dict(log_since=since))
+
+    @api.route("/jobs/<job_id>/result", methods=["GET"])
+    def get_job_result(job_id):
+        """
+        Return a finished job's response as the route produced it
+
+        A binary result is released once returned, so it can be fetched once.
+        """
+        job = job_manager.get(job_id)
+        if job is None:
+            return routes.make_response(
+                data={"error": "Job not found: {}".format(job_id)}, status=404
+            )
+        if not job.done:
+            return routes.make_response(
+                data={"error": "Job {} is still {}".format(job_id, job.status)},
+                status=409,
+            )
+        if job.content_type is not None:
+            response = job.response
+            if response is None:
+                return routes.make_response(
+                    data={
+                        "error": "Binary result of job {} was already fetched "
+                        "or released".format(job_id)
+                    },
+                    status=410,
+                )
+            job.release_response()
+            return response
+        return routes.make_response(data=job.result, status=job.result_status)
+
+    logger.info("Job routes registered successfully")
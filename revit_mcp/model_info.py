@@ -8,8 +8,10 @@ from pyrevit import routes, revit, DB
 from pyrevit.revit.db import ProjectInfo as RevitProjectInfo
 import pyrevit.revit.db.query as q
 import logging
+from System.Collections.Generic import List
 
 from utils import normalize_string, get_element_name
+from cache import result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,10 @@ def register_model_info_routes(api):
                     data={"error": "No active Revit document"}, status=503
                 )
 
+            cached = result_cache.get(doc, "/model_info/")
+            if cached is not None:
+                return routes.make_response(data=cached)
+
             # ============ PROJECT INFORMATION ============
             try:
                 revit_project_info = RevitProjectInfo(doc)
@@ -72,21 +78,49 @@ def register_model_info_routes(api):
                 "Plumbing_Fixtures": DB.BuiltInCategory.OST_PlumbingFixtures,
             }
 
-            element_counts = {}
-            total_elements = 0
+            # One collector pass over all categories, bucketed by category id.
+            # Levels and rooms ride along so they need no collector of their own.
+            category_names = dict(
+                (DB.ElementId(category).IntegerValue, name)
+                for name, category in element_categories.items()
+            )
+            level_category_id = DB.ElementId(DB.BuiltInCategory.OST_Levels).IntegerValue
+            room_category_id = DB.ElementId(DB.BuiltInCategory.OST_Rooms).IntegerValue
 
-            for name, category in element_categories.items():
-                try:
-                    count = (
-                        DB.FilteredElementCollector(doc)
-                        .OfCategory(category)
-                        .WhereElementIsNotElementType()
-                        .GetElementCount()
-                    )
-                    element_counts[name] = count
-                    total_elements += count
-                except:
-                    element_counts[name] = 0
+            element_counts = dict((name, 0) for name in element_categories)
+            level_elements = []
+            room_elements = []
+
+            try:
+                category_filters = List[DB.ElementFilter]()
+                for category in list(element_categories.values()) + [
+                    DB.BuiltInCategory.OST_Levels,
+                    DB.BuiltInCategory.OST_Rooms,
+                ]:
+                    category_filters.Add(DB.ElementCategoryFilter(category))
+
+                collector = (
+                    DB.FilteredElementCollector(doc)
+                    .WherePasses(DB.LogicalOrFilter(category_filters))
+                    .WhereElementIsNotElementType()
+                )
+
+                for element in collector:
+                    category = element.Category
+                    if category is None:
+                        continue
+                    category_id = category.Id.IntegerValue
+                    name = category_names.get(category_id)
+                    if name is not None:
+                        element_counts[name] += 1
+                    elif category_id == level_category_id:
+                        level_elements.append(element)
+                    elif category_id == room_category_id:
+                        room_elements.append(element)
+            except Exception as e:
+                logger.warning("Could not count elements: {}".format(str(e)))
+
+            total_elements = sum(element_counts.values())
 
             # ============ WARNINGS ============
             try:
@@ -102,15 +136,8 @@ def register_model_info_routes(api):
 
             # ============ LEVELS ============
             try:
-                levels_collector = (
-                    DB.FilteredElementCollector(doc)
-                    .OfCategory(DB.BuiltInCategory.OST_Levels)
-                    .WhereElementIsNotElementType()
-                    .ToElements()
-                )
-
                 levels_info = []
-                for level in levels_collector:
+                for level in level_elements:
                     level_name = get_element_name(level)
                     try:
                         elevation = level.Elevation
@@ -146,17 +173,10 @@ def register_model_info_routes(api):
 
             # ============ ROOMS ============
             try:
-                rooms_collector = (
-                    DB.FilteredElementCollector(doc)
-                    .OfCategory(DB.BuiltInCategory.OST_Rooms)
-                    .WhereElementIsNotElementType()
-                    .ToElements()
-                )
-
                 rooms_info = []
                 unplaced_rooms = 0
 
-                for room in rooms_collector:
+                for room in room_elements:
                     try:
                         # Get room name safely
                         name_param = room.LookupParameter("Name")
@@ -218,53 +238,44 @@ def register_model_info_routes(api):
                 unplaced_rooms = 0
 
             # ============ VIEWS AND SHEETS ============
-            try:
-                # Get sheets
-                sheets_count = (
-                    DB.FilteredElementCollector(doc)
-                    .OfCategory(DB.BuiltInCategory.OST_Sheets)
-                    .WhereElementIsNotElementType()
-                    .GetElementCount()
-                )
+            view_breakdown_keys = {
+                DB.ViewType.FloorPlan: "floor_plans",
+                DB.ViewType.Elevation: "elevations",
+                DB.ViewType.Section: "sections",
+                DB.ViewType.ThreeD: "3d_views",
+                DB.ViewType.Schedule: "schedules",
+            }
+            view_breakdown = dict((key, 0) for key in view_breakdown_keys.values())
 
-                # Get views (excluding templates and invalid types)
-                all_views = (
-                    DB.FilteredElementCollector(doc).OfClass(DB.View).ToElements()
-                )
+            try:
+                # Single pass over views fills the sheet, view and view type counts
+                sheets_count = 0
+                views_count = 0
 
-                valid_views = [
-                    v
-                    for v in all_views
-                    if hasattr(v, "IsTemplate")
-                    and not v.IsTemplate
-                    and v.ViewType != DB.ViewType.Internal
-                    and v.ViewType != DB.ViewType.ProjectBrowser
-                ]
+                for view in DB.FilteredElementCollector(doc).OfClass(DB.View):
+                    if isinstance(view, DB.ViewSheet):
+                        sheets_count += 1
 
-                views_count = len(valid_views)
+                    # Skip templates and invalid types
+                    if not hasattr(view, "IsTemplate") or view.IsTemplate:
+                        continue
+                    view_type = view.ViewType
+                    if (
+                        view_type == DB.ViewType.Internal
+                        or view_type == DB.ViewType.ProjectBrowser
+                    ):
+                        continue
 
-                # Count major view types
-                floor_plans = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.FloorPlan
-                )
-                elevations = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.Elevation
-                )
-                sections = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.Section
-                )
-                threed_views = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.ThreeD
-                )
-                schedules = sum(
-                    1 for v in valid_views if v.ViewType == DB.ViewType.Schedule
-                )
+                    views_count += 1
+                    breakdown_key = view_breakdown_keys.get(view_type)
+                    if breakdown_key is not None:
+                        view_breakdown[breakdown_key] += 1
 
             except Exception as e:
                 logger.warning("Could not get views/sheets: {}".format(str(e)))
                 sheets_count = 0
                 views_count = 0
-                floor_plans = elevations = sections = threed_views = schedules = 0
+                view_breakdown = dict((key, 0) for key in view_breakdown_keys.values())
 
             # ============ LINKED MODELS ============
             try:
@@ -329,18 +340,13 @@ def register_model_info_routes(api):
                 },
                 "documentation": {
                     "total_views": views_count,
-                    "view_breakdown": {
-                        "floor_plans": floor_plans,
-                        "elevations": elevations,
-                        "sections": sections,
-                        "3d_views": threed_views,
-                        "schedules": schedules,
-                    },
+                    "view_breakdown": view_breakdown,
                     "sheets_count": sheets_count,
                 },
                 "linked_models": {"count": len(linked_models), "models": linked_models},
             }
 
+            result_cache.put(doc, "/model_info/", model_data)
             return routes.make_response(data=model_data)
 
         except Exception as e:
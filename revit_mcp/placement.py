@@ -4,15 +4,626 @@ Placement Module for Revit MCP
 Handles family placement and element creation functionality
 """
 
-from utils import get_element_name, find_family_symbol_safely
+from utils import (
+    get_element_name,
+    find_family_symbol_safely,
+    get_family_symbol_index,
+    get_request_params,
+    wants_ndjson,
+    ndjson_paging,
+    ndjson_page,
+)
+from cache import result_cache
 from pyrevit import routes, revit, DB
+from Autodesk.Revit.Creation import FamilyInstanceCreationData
+from System.Collections.Generic import List
+import itertools
 import json
+import math
 import traceback
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on instances per /place_families/ request
+MAX_BULK_PLACEMENTS = 5000
+
+# Shortest run of identical placements worth sending through NewFamilyInstances2
+MIN_BATCH_RUN = 2
+
+
+def levels_by_name(doc):
+    """Map level names to levels with a single collector pass"""
+    levels = {}
+    collector = (
+        DB.FilteredElementCollector(doc)
+        .OfCategory(DB.BuiltInCategory.OST_Levels)
+        .WhereElementIsNotElementType()
+    )
+    for level in collector:
+        try:
+            levels.setdefault(get_element_name(level), level)
+        except:
+            continue
+    return levels
+
+
+def parse_point(location):
+    """Build a DB.XYZ from a {"x", "y", "z"} dict, raising ValueError if invalid"""
+    if not location or not all(k in location for k in ["x", "y", "z"]):
+        raise ValueError("location must include x, y, z coordinates")
+    return DB.XYZ(float(location["x"]), float(location["y"]), float(location["z"]))
+
+
+def create_family_instance(doc, point, symbol, level=None):
+    """Create a non-structural family instance, on a level when given"""
+    if level:
+        return doc.Create.NewFamilyInstance(
+            point, symbol, level, DB.Structure.StructuralType.NonStructural
+        )
+    return doc.Create.NewFamilyInstance(
+        point, symbol, DB.Structure.StructuralType.NonStructural
+    )
+
+
+def rotate_instance(instance, point, rotation):
+    """Rotate an instance about the vertical axis through point, in degrees"""
+    if not rotation:
+        return
+    try:
+        rotation_radians = float(rotation) * (3.14159265359 / 180.0)
+        axis = DB.Line.CreateBound(point, point.Add(DB.XYZ(0, 0, 1)))
+
+        if hasattr(instance.Location, "Rotate"):
+            success = instance.Location.Rotate(axis, rotation_radians)
+            if success:
+                logger.info("Element rotated by {} degrees".format(rotation))
+            else:
+                logger.warning("Rotation failed - element may not support rotation")
+    except Exception as rotate_err:
+        logger.warning("Could not rotate element: {}".format(str(rotate_err)))
+
+
+def set_instance_properties(instance, properties):
+    """
+    Set instance parameters by name
+
+    Returns:
+        tuple: (names set, descriptions of names that failed)
+    """
+    properties_set = []
+    properties_failed = []
+
+    for param_name, param_value in (properties or {}).items():
+        try:
+            param = instance.LookupParameter(param_name)
+            if param and not param.IsReadOnly:
+                # Set parameter based on its storage type
+                if param.StorageType == DB.StorageType.String:
+                    param.Set(str(param_value))
+                    properties_set.append(param_name)
+                elif param.StorageType == DB.StorageType.Integer:
+                    param.Set(int(param_value))
+                    properties_set.append(param_name)
+                elif param.StorageType == DB.StorageType.Double:
+                    param.Set(float(param_value))
+                    properties_set.append(param_name)
+                else:
+                    properties_failed.append("{} (unsupported type)".format(param_name))
+            else:
+                if param:
+                    properties_failed.append("{} (read-only)".format(param_name))
+                else:
+                    properties_failed.append("{} (not found)".format(param_name))
+        except Exception as param_error:
+            properties_failed.append(
+                "{} (error: {})".format(param_name, str(param_error))
+            )
+
+    return properties_set, properties_failed
+
+
+def _prepare_placements(doc, placements):
+    """
+    Resolve symbols, levels and points for a list of placements
+
+    Each distinct (family, type) and level is looked up once. Returns the
+    per-item result dicts (pre-filled with errors for invalid items) and
+    the list of (result, symbol, level, point, placement) to create.
+    """
+    symbol_index = get_family_symbol_index(doc)
+    levels = None
+    symbols = {}
+
+    results = []
+    pending = []
+    for index, placement in enumerate(placements):
+        placement = placement or {}
+        family_name = placement.get("family_name")
+        type_name = placement.get("type_name")
+        level_name = placement.get("level_name")
+        result = {
+            "index": index,
+            "family_name": family_name,
+            "type_name": type_name,
+            "level": level_name,
+        }
+        results.append(result)
+
+        if not family_name:
+            result.update(status="error", error="No family_name provided")
+            continue
+
+        key = (family_name, type_name)
+        if key not in symbols:
+            symbol_id = symbol_index.find_id(family_name, type_name)
+            symbols[key] = (
+                doc.GetElement(DB.ElementId(symbol_id))
+                if symbol_id is not None
+                else None
+            )
+        symbol = symbols[key]
+        if symbol is None:
+            result.update(
+                status="error",
+                error="Family type not found: {} - {}".format(
+                    family_name, type_name or "Any"
+                ),
+                suggestions=symbol_index.suggest(family_name, type_name, limit=5),
+            )
+            continue
+
+        level = None
+        if level_name:
+            if levels is None:
+                levels = levels_by_name(doc)
+            level = levels.get(level_name)
+            if level is None:
+                result.update(
+                    status="error", error="Level not found: {}".format(level_name)
+                )
+                continue
+
+        try:
+            point = parse_point(placement.get("location"))
+        except (ValueError, TypeError) as coord_error:
+            result.update(
+                status="error", error="Invalid location: {}".format(coord_error)
+            )
+            continue
+
+        result["location"] = {"x": point.X, "y": point.Y, "z": point.Z}
+        pending.append((result, symbol, level, point, placement))
+
+    return results, pending
+
+
+def _rotation_degrees(placement):
+    """Requested rotation in degrees, raising ValueError if it is not a number"""
+    try:
+        return float(placement.get("rotation") or 0.0)
+    except TypeError:
+        raise ValueError("rotation must be a number")
+
+
+def _is_batchable(placement):
+    """
+    Placements without properties can use batch creation
+
+    Rotation is applied through FamilyInstanceCreationData, so only
+    placements that set parameters (or carry an unusable rotation) need
+    the per-instance path.
+    """
+    if placement.get("properties"):
+        return False
+    try:
+        _rotation_degrees(placement)
+    except ValueError:
+        return False
+    return True
+
+
+def _creation_runs(chunk):
+    """
+    Split a chunk into consecutive runs that can share one creation call
+
+    Yields (batchable, items). Batchable runs share symbol and level; every
+    other placement is yielded as a run of its own.
+    """
+
+    def run_key(entry):
+        position, (result, symbol, level, point, placement) = entry
+        if not _is_batchable(placement):
+            return ("single", position)
+        return (
+            "batch",
+            symbol.Id.IntegerValue,
+            level.Id.IntegerValue if level else None,
+        )
+
+    for key, entries in itertools.groupby(enumerate(chunk), run_key):
+        yield key[0] == "batch", [item for _, item in entries]
+
+
+def _create_single(doc, item):
+    """Create one instance with NewFamilyInstance, applying rotation and properties"""
+    result, symbol, level, point, placement = item
+    try:
+        new_instance = create_family_instance(doc, point, symbol, level)
+        rotation = placement.get("rotation", 0.0)
+        rotate_instance(new_instance, point, rotation)
+        properties_set, properties_failed = set_instance_properties(
+            new_instance, placement.get("properties")
+        )
+        result.update(
+            status="success",
+            element_id=new_instance.Id.IntegerValue,
+            creation_path="single",
+            rotation_degrees=rotation,
+            properties_set=properties_set,
+            properties_failed=properties_failed,
+        )
+    except Exception as item_error:
+        result.update(status="error", error=str(item_error))
+
+
+# Distance in feet within which a created instance matches a requested point
+POINT_MATCH_TOLERANCE = 1e-4
+
+
+def _point_cell(x, y):
+    """Grid cell of a plan point, POINT_MATCH_TOLERANCE wide"""
+    return (
+        int(math.floor(x / POINT_MATCH_TOLERANCE)),
+        int(math.floor(y / POINT_MATCH_TOLERANCE)),
+    )
+
+
+def _angle_difference(a, b):
+    difference = (a - b) % (2 * math.pi)
+    return min(difference, 2 * math.pi - difference)
+
+
+def _match_created_instances(doc, created, run):
+    """
+    Pair the ids returned by NewFamilyInstances2 with the placements of a run
+
+    The order of the returned ids is not documented, so each instance is
+    matched by reading back its Location.Point (in plan, the level may
+    shift Z) and, among placements at the same point, by rotation.
+
+    Returns:
+        tuple: (list of (element_id, item) pairs, element ids left unmatched)
+    """
+    cells = {}
+    for item in run:
+        point = item[3]
+        cells.setdefault(_point_cell(point.X, point.Y), []).append(item)
+
+    pairs = []
+    unmatched = []
+    for element_id in created:
+        try:
+            location = doc.GetElement(element_id).Location
+            actual = location.Point
+            actual_rotation = getattr(location, "Rotation", 0.0)
+        except Exception:
+            unmatched.append(element_id)
+            continue
+
+        cell_x, cell_y = _point_cell(actual.X, actual.Y)
+        best = None
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for item in cells.get((cell_x + dx, cell_y + dy), ()):
+                    point = item[3]
+                    if (
+                        abs(point.X - actual.X) > POINT_MATCH_TOLERANCE
+                        or abs(point.Y - actual.Y) > POINT_MATCH_TOLERANCE
+                    ):
+                        continue
+                    score = (
+                        _angle_difference(
+                            math.radians(_rotation_degrees(item[4])), actual_rotation
+                        ),
+                        abs(point.Z - actual.Z),
+                    )
+                    if best is None or score < best[0]:
+                        best = (score, dx, dy, item)
+
+        if best is None:
+            unmatched.append(element_id)
+            continue
+        _, dx, dy, item = best
+        cells[(cell_x + dx, cell_y + dy)].remove(item)
+        pairs.append((element_id, item))
+
+    return pairs, unmatched
+
+
+def _create_run_batched(doc, run):
+    """
+    Create a run of instances with one NewFamilyInstances2 call
+
+    Returns None (having created nothing) when the batch call fails or
+    returns the wrong number of ids, so the caller can fall back to
+    per-instance creation. Otherwise returns the created ids that could
+    not be matched to a placement; those placements are reported with
+    status "unmatched" and no element_id.
+    """
+    creation_data = List[FamilyInstanceCreationData]()
+    for result, symbol, level, point, placement in run:
+        if level:
+            data = FamilyInstanceCreationData(
+                point, symbol, level, DB.Structure.StructuralType.NonStructural
+            )
+        else:
+            data = FamilyInstanceCreationData(
+                point, symbol, DB.Structure.StructuralType.NonStructural
+            )
+        rotation = _rotation_degrees(placement)
+        if rotation:
+            data.Axis = DB.Line.CreateBound(point, point.Add(DB.XYZ(0, 0, 1)))
+            data.RotateAngle = math.radians(rotation)
+        creation_data.Add(data)
+
+    try:
+        created = list(doc.Create.NewFamilyInstances2(creation_data))
+    except Exception as batch_error:
+        logger.warning(
+            "Batch creation failed, falling back to single: {}".format(
+                str(batch_error)
+            )
+        )
+        return None
+
+    if len(created) != len(run):
+        logger.warning(
+            "Batch creation returned {} ids for {} placements, falling back".format(
+                len(created), len(run)
+            )
+        )
+        if created:
+            doc.Delete(List[DB.ElementId](created))
+        return None
+
+    pairs, unmatched = _match_created_instances(doc, created, run)
+    for result, symbol, level, point, placement in run:
+        result.update(
+            status="unmatched",
+            error="Instance created but not matched to this placement; see "
+            "unassigned_element_ids",
+            creation_path="batch",
+            rotation_degrees=_rotation_degrees(placement),
+        )
+    for element_id, item in pairs:
+        item[0].pop("error")
+        item[0].update(
+            status="success",
+            element_id=element_id.IntegerValue,
+            properties_set=[],
+            properties_failed=[],
+        )
+    if unmatched:
+        logger.warning(
+            "Could not match {} batch-created instances to their placements".format(
+                len(unmatched)
+            )
+        )
+    return unmatched
+
+
+def place_family_instances(doc, placements, chunk_size=0):
+    """
+    Create many family instances with as few transactions as possible
+
+    Args:
+        doc: Revit document
+        placements (list): Placement dicts as accepted by /place_family/
+        chunk_size (int): Instances per transaction, 0 for a single transaction
+
+    Returns:
+        dict: Summary with one result per placement, in request order.
+            Results with status "success" always carry an element_id.
+            Batch-created instances that could not be matched to their
+            placement are listed in unassigned_element_ids, and those
+            placements have status "unmatched" (counted in "unmatched").
+    """
+    results, pending = _prepare_placements(doc, placements)
+
+    if chunk_size <= 0:
+        chunk_size = max(1, len(pending))
+    chunks = [
+        pending[start : start + chunk_size]
+        for start in range(0, len(pending), chunk_size)
+    ]
+
+    transactions = 0
+    unassigned_ids = []
+    for chunk_number, chunk in enumerate(chunks):
+        t = DB.Transaction(
+            doc,
+            "Place Family Instances via MCP ({}/{})".format(
+                chunk_number + 1, len(chunks)
+            ),
+        )
+        t.Start()
+        try:
+            # Activate each symbol once, with a single regenerate for the chunk
+            activated = False
+            for symbol in set(item[1] for item in chunk):
+                if not symbol.IsActive:
+                    symbol.Activate()
+                    activated = True
+            if activated:
+                doc.Regenerate()
+
+            chunk_unassigned = []
+            for batchable, run in _creation_runs(chunk):
+                if batchable and len(run) >= MIN_BATCH_RUN:
+                    unmatched = _create_run_batched(doc, run)
+                    if unmatched is not None:
+                        chunk_unassigned.extend(unmatched)
+                        continue
+                for item in run:
+                    _create_single(doc, item)
+
+            t.Commit()
+            transactions += 1
+            unassigned_ids.extend(element_id.IntegerValue for element_id in chunk_unassigned)
+
+        except Exception as tx_error:
+            if t.HasStarted() and not t.HasEnded():
+                t.RollBack()
+                logger.error("Placement chunk rolled back due to error")
+            for item in chunk:
+                item[0].pop("element_id", None)
+                item[0].pop("creation_path", None)
+                item[0].update(
+                    status="error",
+                    error="Transaction rolled back: {}".format(str(tx_error)),
+                )
+
+    placed = sum(1 for result in results if result.get("status") == "success")
+    unmatched = sum(1 for result in results if result.get("status") == "unmatched")
+    creation_paths = {"batch": 0, "single": 0}
+    for result in results:
+        if result.get("status") == "success":
+            creation_paths[result["creation_path"]] += 1
+
+    return {
+        "status": "success",
+        "message": "Placed {} of {} family instances".format(placed, len(results)),
+        "placed": placed,
+        "unmatched": unmatched,
+        "failed": len(results) - placed - unmatched,
+        "transactions": transactions,
+        "creation_paths": creation_paths,
+        "unassigned_element_ids": unassigned_ids,
+        "results": results,
+    }
+
+
+def point_in_polygon(x, y, polygon):
+    """Ray-casting test; points exactly on an edge may fall either way"""
+    inside = False
+    count = len(polygon)
+    j = count - 1
+    for i in range(count):
+        xi, yi = polygon[i]
+        xj, yj = polygon[j]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def array_points(origin, counts, spacing, rotation=0.0, boundary=None):
+    """
+    Generate the (x, y, z) points of a rectangular array
+
+    Args:
+        origin (tuple): (x, y, z) of the first point
+        counts (tuple): (columns, rows), optionally (columns, rows, layers)
+        spacing (tuple): Distances matching counts, in feet
+        rotation (float): Array rotation about the origin, in degrees
+        boundary (list): Optional [(x, y), ...] polygon; points outside are skipped
+
+    Returns:
+        list: Points in row-major order
+    """
+    ox, oy, oz = origin
+    counts = list(counts) + [1] * (3 - len(counts))
+    spacing = list(spacing) + [0.0] * (3 - len(spacing))
+    angle = math.radians(rotation or 0.0)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+
+    points = []
+    for layer in range(counts[2]):
+        z = oz + layer * spacing[2]
+        for row in range(counts[1]):
+            for column in range(counts[0]):
+                dx = column * spacing[0]
+                dy = row * spacing[1]
+                x = ox + dx * cos_a - dy * sin_a
+                y = oy + dx * sin_a + dy * cos_a
+                if boundary and not point_in_polygon(x, y, boundary):
+                    continue
+                points.append((x, y, z))
+    return points
+
+
+def _parse_array_request(data):
+    """
+    Validate a /place_family_array/ payload
+
+    Returns:
+        tuple: (array_points args dict, error message or None)
+    """
+    try:
+        origin = data.get("origin") or {"x": 0.0, "y": 0.0, "z": 0.0}
+        origin = (
+            float(origin.get("x", 0.0)),
+            float(origin.get("y", 0.0)),
+            float(origin.get("z", 0.0)),
+        )
+
+        counts = data.get("counts") or {}
+        counts = (
+            int(counts.get("x", 1)),
+            int(counts.get("y", 1)),
+            int(counts.get("z", 1)),
+        )
+        spacing = data.get("spacing") or {}
+        spacing = (
+            float(spacing.get("x", 0.0)),
+            float(spacing.get("y", 0.0)),
+            float(spacing.get("z", 0.0)),
+        )
+        rotation = float(data.get("rotation") or 0.0)
+
+        boundary = data.get("boundary")
+        if boundary:
+            boundary = [
+                (float(p["x"]), float(p["y"]))
+                if isinstance(p, dict)
+                else (float(p[0]), float(p[1]))
+                for p in boundary
+            ]
+            if len(boundary) < 3:
+                return None, "boundary needs at least 3 points"
+    except (ValueError, TypeError, KeyError, IndexError, AttributeError) as e:
+        return None, "Invalid array definition: {}".format(str(e))
+
+    if min(counts) < 1:
+        return None, "counts must be at least 1"
+    total = counts[0] * counts[1] * counts[2]
+    if total > MAX_BULK_PLACEMENTS:
+        return None, "Array too large: {} instances (max {})".format(
+            total, MAX_BULK_PLACEMENTS
+        )
+
+    return {
+        "origin": origin,
+        "counts": counts,
+        "spacing": spacing,
+        "rotation": rotation,
+        "boundary": boundary or None,
+    }, None
+
+
+def _iter_family_rows(doc, contains=None):
+    """Yield one summary dict per indexed family symbol matching contains"""
+    for entry in get_family_symbol_index(doc).search(contains):
+        yield {
+            "family_name": entry["family_name"],
+            "type_name": entry["type_name"],
+            "category": entry["category"],
+            "is_active": entry["is_active"],
+        }
+
+
 def register_placement_routes(api):
     """Register all placement-related routes with the API"""
 
@@ -100,24 +711,11 @@ def register_placement_routes(api):
             target_symbol = find_family_symbol_safely(doc, family_name, type_name)
 
             if not target_symbol:
-                # Get list of available families for better error message
-                available_families = []
+                # Suggest close matches from the symbol index for a better error message
                 try:
-                    symbols = (
-                        DB.FilteredElementCollector(doc)
-                        .OfClass(DB.FamilySymbol)
-                        .ToElements()
+                    available_families = get_family_symbol_index(doc).suggest(
+                        family_name, type_name, limit=20
                     )
-                    family_names = set()
-                    for symbol in symbols[
-                        :50
-                    ]:  # Limit to prevent overwhelming response
-                        try:
-                            family_name_safe = get_element_name(symbol)
-                            family_names.add(family_name_safe)
-                        except:
-                            continue
-                    available_families = sorted(list(family_names))
                 except:
                     available_families = ["Could not retrieve family list"]
 
@@ -134,21 +732,7 @@ def register_placement_routes(api):
             # Find level if specified
             target_level = None
             if level_name:
-                levels = (
-                    DB.FilteredElementCollector(doc)
-                    .OfCategory(DB.BuiltInCategory.OST_Levels)
-                    .WhereElementIsNotElementType()
-                    .ToElements()
-                )
-
-                for level in levels:
-                    try:
-                        level_name_safe = get_element_name(level)
-                        if level_name_safe == level_name:
-                            target_level = level
-                            break
-                    except:
-                        continue
+                target_level = levels_by_name(doc).get(level_name)
 
                 if not target_level:
                     return routes.make_response(
@@ -158,9 +742,7 @@ def register_placement_routes(api):
 
             # Create the location point
             try:
-                point = DB.XYZ(
-                    float(location["x"]), float(location["y"]), float(location["z"])
-                )
+                point = parse_point(location)
             except (ValueError, TypeError) as coord_error:
                 return routes.make_response(
                     data={"error": "Invalid coordinates: {}".format(str(coord_error))},
@@ -179,19 +761,9 @@ def register_placement_routes(api):
                     doc.Regenerate()  # Ensure activation takes effect
 
                 # Create the instance
-                if target_level:
-                    # Place on specific level
-                    new_instance = doc.Create.NewFamilyInstance(
-                        point,
-                        target_symbol,
-                        target_level,
-                        DB.Structure.StructuralType.NonStructural,
-                    )
-                else:
-                    # Place without level specification
-                    new_instance = doc.Create.NewFamilyInstance(
-                        point, target_symbol, DB.Structure.StructuralType.NonStructural
-                    )
+                new_instance = create_family_instance(
+                    doc, point, target_symbol, target_level
+                )
 
                 logger.info(
                     "Family instance created with ID: {}".format(
@@ -200,63 +772,12 @@ def register_placement_routes(api):
                 )
 
                 # Apply rotation if specified
-                if rotation != 0:
-                    try:
-                        rotation_radians = float(rotation) * (3.14159265359 / 180.0)
-                        axis = DB.Line.CreateBound(point, point.Add(DB.XYZ(0, 0, 1)))
-
-                        if hasattr(new_instance.Location, "Rotate"):
-                            success = new_instance.Location.Rotate(
-                                axis, rotation_radians
-                            )
-                            if success:
-                                logger.info(
-                                    "Element rotated by {} degrees".format(rotation)
-                                )
-                            else:
-                                logger.warning(
-                                    "Rotation failed - element may not support rotation"
-                                )
-                    except Exception as rotate_err:
-                        logger.warning(
-                            "Could not rotate element: {}".format(str(rotate_err))
-                        )
+                rotate_instance(new_instance, point, rotation)
 
                 # Set custom properties
-                properties_set = []
-                properties_failed = []
-
-                for param_name, param_value in properties.items():
-                    try:
-                        param = new_instance.LookupParameter(param_name)
-                        if param and not param.IsReadOnly:
-                            # Set parameter based on its storage type
-                            if param.StorageType == DB.StorageType.String:
-                                param.Set(str(param_value))
-                                properties_set.append(param_name)
-                            elif param.StorageType == DB.StorageType.Integer:
-                                param.Set(int(param_value))
-                                properties_set.append(param_name)
-                            elif param.StorageType == DB.StorageType.Double:
-                                param.Set(float(param_value))
-                                properties_set.append(param_name)
-                            else:
-                                properties_failed.append(
-                                    "{} (unsupported type)".format(param_name)
-                                )
-                        else:
-                            if param:
-                                properties_failed.append(
-                                    "{} (read-only)".format(param_name)
-                                )
-                            else:
-                                properties_failed.append(
-                                    "{} (not found)".format(param_name)
-                                )
-                    except Exception as param_error:
-                        properties_failed.append(
-                            "{} (error: {})".format(param_name, str(param_error))
-                        )
+                properties_set, properties_failed = set_instance_properties(
+                    new_instance, properties
+                )
 
                 t.Commit()
                 logger.info("Transaction committed successfully")
@@ -302,10 +823,171 @@ def register_placement_routes(api):
                 data={"error": str(e), "traceback": error_trace}, status=500
             )
 
+    @api.route("/place_families/", methods=["POST"])
+    def place_families(doc, request):
+        """
+        Place many family instances in one request.
+
+        Symbols and levels are resolved once for the whole request, each
+        symbol is activated once, and instances are created in a single
+        transaction, or in transactions of chunk_size instances when given.
+        Consecutive placements sharing a symbol and level, without rotation
+        or properties, are created together through NewFamilyInstances2.
+
+        Expected request data:
+        {
+            "placements": [
+                {
+                    "family_name": "Desk",
+                    "type_name": "1525 x 762mm",
+                    "location": {"x": 0.0, "y": 0.0, "z": 0.0},
+                    "rotation": 0.0,
+                    "level_name": "Level 1",
+                    "properties": {"Mark": "D1"}
+                }
+            ],
+            "chunk_size": 0  // instances per transaction, 0 = one transaction
+        }
+        """
+        try:
+            if not doc:
+                return routes.make_response(
+                    data={"error": "No active Revit document"}, status=503
+                )
+
+            data = (
+                json.loads(request.data)
+                if isinstance(request.data, str)
+                else request.data
+            ) or {}
+
+            placements = data.get("placements")
+            if not isinstance(placements, list) or not placements:
+                return routes.make_response(
+                    data={"error": "placements must be a non-empty list"}, status=400
+                )
+            if len(placements) > MAX_BULK_PLACEMENTS:
+                return routes.make_response(
+                    data={
+                        "error": "Too many placements: {} (max {})".format(
+                            len(placements), MAX_BULK_PLACEMENTS
+                        )
+                    },
+                    status=400,
+                )
+
+            try:
+                chunk_size = int(data.get("chunk_size") or 0)
+            except (ValueError, TypeError):
+                return routes.make_response(
+                    data={"error": "chunk_size must be an integer"}, status=400
+                )
+
+            logger.info("Placing {} family instances".format(len(placements)))
+
+            result = place_family_instances(doc, placements, chunk_size)
+            return routes.make_response(data=result)
+
+        except Exception as e:
+            logger.error("Failed to place families: {}".format(str(e)))
+            return routes.make_response(
+                data={"error": str(e), "traceback": traceback.format_exc()},
+                status=500,
+            )
+
+    @api.route("/place_family_array/", methods=["POST"])
+    def place_family_array(doc, request):
+        """
+        Place a family in a regular grid generated inside Revit
+
+        Expected request data:
+        {
+            "family_name": "Desk",
+            "type_name": "1525 x 762mm",
+            "level_name": "Level 1",
+            "origin": {"x": 0.0, "y": 0.0, "z": 0.0},
+            "counts": {"x": 10, "y": 4},        // columns, rows (and "z" layers)
+            "spacing": {"x": 6.0, "y": 8.0},     // feet between instances
+            "rotation": 0.0,                      // degrees, rotates array and instances
+            "boundary": [{"x": 0, "y": 0}, ...], // optional polygon to clip to
+            "properties": {"Comments": "Open office"},
+            "chunk_size": 0
+        }
+        """
+        try:
+            if not doc:
+                return routes.make_response(
+                    data={"error": "No active Revit document"}, status=503
+                )
+
+            data = (
+                json.loads(request.data)
+                if isinstance(request.data, str)
+                else request.data
+            ) or {}
+
+            if not data.get("family_name"):
+                return routes.make_response(
+                    data={"error": "No family_name provided"}, status=400
+                )
+
+            array, error = _parse_array_request(data)
+            if error:
+                return routes.make_response(data={"error": error}, status=400)
+
+            points = array_points(**array)
+            if not points:
+                return routes.make_response(
+                    data={"error": "No array points fall inside the boundary"},
+                    status=400,
+                )
+
+            placements = [
+                {
+                    "family_name": data.get("family_name"),
+                    "type_name": data.get("type_name"),
+                    "level_name": data.get("level_name"),
+                    "location": {"x": x, "y": y, "z": z},
+                    "rotation": array["rotation"],
+                    "properties": data.get("properties"),
+                }
+                for x, y, z in points
+            ]
+
+            try:
+                chunk_size = int(data.get("chunk_size") or 0)
+            except (ValueError, TypeError):
+                return routes.make_response(
+                    data={"error": "chunk_size must be an integer"}, status=400
+                )
+
+            logger.info(
+                "Placing family array of {} instances".format(len(placements))
+            )
+
+            result = place_family_instances(doc, placements, chunk_size)
+            counts = array["counts"]
+            result["array"] = {
+                "grid_size": counts[0] * counts[1] * counts[2],
+                "clipped": counts[0] * counts[1] * counts[2] - len(points),
+            }
+            return routes.make_response(data=result)
+
+        except Exception as e:
+            logger.error("Failed to place family array: {}".format(str(e)))
+            return routes.make_response(
+                data={"error": str(e), "traceback": traceback.format_exc()},
+                status=500,
+            )
+
     @api.route("/list_families/", methods=["GET"])
     def list_families(doc, request):
         """
         Simplified: Get a flat list of up to 50 family names and their types in the current Revit model.
+        ?contains= filters on family or type name (any case) and ?limit=
+        changes the maximum. With ?format=ndjson the matching types are
+        returned one JSON object per line, one page at a time (?offset=,
+        ?limit=; see utils.ndjson_paging).
         Returns:
             list: [{ 'family_name': str, 'type_name': str, 'category': str, 'is_active': bool }]
         """
@@ -315,35 +997,52 @@ def register_placement_routes(api):
                     data={"error": "No active Revit document"}, status=503
                 )
 
-            symbols = (
-                DB.FilteredElementCollector(doc).OfClass(DB.FamilySymbol).ToElements()
-            )
-            families = []
-            for symbol in symbols:
-                if len(families) >= 50:
-                    break
+            params = get_request_params(request)
+            contains = params.get("contains")
+            limit = params.get("limit")
+            try:
+                limit = int(limit) if limit not in (None, "") else None
+            except (TypeError, ValueError):
+                limit = 0
+            # 0 would mean "no limit" to islice but 50 to `or`; reject it in both modes
+            if limit is not None and limit <= 0:
+                return routes.make_response(
+                    data={"error": "limit must be a positive integer"}, status=400
+                )
+
+            if wants_ndjson(request):
                 try:
-                    family_name = get_element_name(symbol)
-                    type_name = get_element_name(symbol)
-                    category = symbol.Category.Name if symbol.Category else "Unknown"
-                    is_active = symbol.IsActive
-                    families.append(
-                        {
-                            "family_name": family_name,
-                            "type_name": type_name,
-                            "category": category,
-                            "is_active": is_active,
-                        }
+                    offset, page_size = ndjson_paging(params)
+                except (TypeError, ValueError) as param_error:
+                    return routes.make_response(
+                        data={"error": "Invalid paging parameter: {}".format(param_error)},
+                        status=400,
                     )
-                except Exception:
-                    continue
-            return routes.make_response(
-                data={
-                    "families": families,
-                    "truncated_total": len(families),
-                    "status": "success",
-                }
+                # Every row matching contains is cached once and served page by page
+                cache_args = {"contains": contains, "format": "ndjson"}
+                rows = result_cache.get(doc, "/list_families/", cache_args)
+                if rows is None:
+                    rows = list(_iter_family_rows(doc, contains))
+                    result_cache.put(doc, "/list_families/", rows, cache_args)
+                return ndjson_page(rows, offset, page_size)
+
+            cached = result_cache.get(doc, "/list_families/", params)
+            if cached is not None:
+                return routes.make_response(data=cached)
+
+            families = list(
+                itertools.islice(
+                    _iter_family_rows(doc, contains), 50 if limit is None else limit
+                )
             )
+            result = {
+                "families": families,
+                "truncated_total": len(families),
+                "status": "success",
+            }
+            result_cache.put(doc, "/list_families/", result, params)
+
+            return routes.make_response(data=result)
         except Exception as e:
             logger.error("Failed to list families: {}".format(str(e)))
             return routes.make_response(
@@ -364,6 +1063,10 @@ def register_placement_routes(api):
                     data={"error": "No active Revit document"}, status=503
                 )
 
+            cached = result_cache.get(doc, "/list_family_categories/")
+            if cached is not None:
+                return routes.make_response(data=cached)
+
             logger.info("Listing all family categories")
 
             # Get all family symbols
@@ -395,13 +1098,14 @@ def register_placement_routes(api):
             # Sort by name
             sorted_categories = dict(sorted(categories.items()))
 
-            return routes.make_response(
-                data={
-                    "categories": sorted_categories,
-                    "total_categories": len(sorted_categories),
-                    "status": "success",
-                }
-            )
+            result = {
+                "categories": sorted_categories,
+                "total_categories": len(sorted_categories),
+                "status": "success",
+            }
+            result_cache.put(doc, "/list_family_categories/", result)
+
+            return routes.make_response(data=result)
 
         except Exception as e:
             logger.error("Failed to list family categories: {}".format(str(e)))
@@ -424,6 +1128,10 @@ def register_placement_routes(api):
                     data={"error": "No active Revit document"}, status=503
                 )
 
+            cached = result_cache.get(doc, "/list_levels/")
+            if cached is not None:
+                return routes.make_response(data=cached)
+
             logger.info("Listing all available levels")
 
             # Get all levels
@@ -456,13 +1164,14 @@ def register_placement_routes(api):
             # Sort by elevation
             levels_info.sort(key=lambda x: x["elevation"])
 
-            return routes.make_response(
-                data={
-                    "levels": levels_info,
-                    "total_levels": len(levels_info),
-                    "status": "success",
-                }
-            )
+            result = {
+                "levels": levels_info,
+                "total_levels": len(levels_info),
+                "status": "success",
+            }
+            result_cache.put(doc, "/list_levels/", result)
+
+            return routes.make_response(data=result)
 
         except Exception as e:
             logger.error("Failed to list levels: {}".format(str(e)))
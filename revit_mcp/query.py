@@ -0,0 +1,670 @@
+# -*- coding: UTF-8 -*-
+"""
+Query Module for Revit MCP
+Declarative element queries evaluated with native Revit filters
+
+A /query/ payload describes categories, classes, level, view, bounding box
+and parameter predicates. Each part is compiled into an ElementFilter
+(ElementMulticategoryFilter, ElementLevelFilter, BoundingBoxIntersectsFilter,
+ElementParameterFilter, ...) and applied by the FilteredElementCollector,
+so no Python loop visits elements. Parameter predicates are resolved
+from the candidate element types (one native lookup per family at most).
+Only the requested page of results is expanded into the projected fields.
+"""
+
+from pyrevit import routes, DB
+from System import Type
+from System.Collections.Generic import List
+from collections import OrderedDict
+import clr
+import json
+import logging
+
+from utils import get_element_name, resolve_category_id
+from cache import result_cache
+from placement import levels_by_name, parse_point
+from views import find_view_by_name
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_LIMIT = 100
+MAX_QUERY_LIMIT = 2000
+
+# Fields returned when the query does not name any
+DEFAULT_FIELDS = ("id", "name", "category")
+
+# Tolerance for equality rules on double parameters (internal units)
+DOUBLE_EPSILON = 1e-6
+
+# Predicate operators and the ParameterFilterRuleFactory methods behind them
+RULE_FACTORIES = {
+    "equals": "CreateEqualsRule",
+    "not_equals": "CreateNotEqualsRule",
+    "greater": "CreateGreaterRule",
+    "greater_or_equal": "CreateGreaterOrEqualRule",
+    "less": "CreateLessRule",
+    "less_or_equal": "CreateLessOrEqualRule",
+    "contains": "CreateContainsRule",
+    "not_contains": "CreateNotContainsRule",
+    "begins_with": "CreateBeginsWithRule",
+    "ends_with": "CreateEndsWithRule",
+    "has_value": "CreateHasValueParameterRule",
+    "has_no_value": "CreateHasNoValueParameterRule",
+}
+
+OPERATOR_ALIASES = {
+    "=": "equals",
+    "==": "equals",
+    "!=": "not_equals",
+    ">": "greater",
+    ">=": "greater_or_equal",
+    "<": "less",
+    "<=": "less_or_equal",
+}
+
+# Operators that only apply to string parameters
+STRING_OPERATORS = ("contains", "not_contains", "begins_with", "ends_with")
+
+# Type class of common instance classes, to narrow parameter resolution
+TYPE_CLASSES = {
+    "FamilyInstance": "FamilySymbol",
+    "Wall": "WallType",
+    "Floor": "FloorType",
+    "Ceiling": "CeilingType",
+    "RoofBase": "RoofType",
+    "FootPrintRoof": "RoofType",
+    "ExtrusionRoof": "RoofType",
+}
+
+# Most ELEM_TYPE_PARAM rules ORed into one filter; queries needing more are rejected
+MAX_TYPE_RULES = 500
+
+# Most families (or system type groups) a named parameter is resolved against
+MAX_PARAMETER_GROUPS = 500
+
+
+class QueryError(Exception):
+    """A query that cannot be compiled; reported to the caller as a 4xx"""
+
+    def __init__(self, message, status=400):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _and_filters(filters):
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    return DB.LogicalAndFilter(List[DB.ElementFilter](filters))
+
+
+def _category_filter(doc, names):
+    category_ids = []
+    missing = []
+    for name in names:
+        category_id = resolve_category_id(doc, name)
+        if category_id is None:
+            missing.append(name)
+        else:
+            category_ids.append(category_id)
+    if missing:
+        raise QueryError("Category not found: {}".format(", ".join(missing)), 404)
+    return DB.ElementMulticategoryFilter(List[DB.ElementId](category_ids))
+
+
+def _class_filter(names):
+    types = []
+    for name in names:
+        cls = getattr(DB, str(name), None)
+        if cls is None or not isinstance(cls, type) or not issubclass(cls, DB.Element):
+            raise QueryError("Unknown element class: {}".format(name))
+        types.append(cls)
+    if len(types) == 1:
+        return DB.ElementClassFilter(types[0])
+    return DB.ElementMulticlassFilter(
+        List[Type]([clr.GetClrType(cls) for cls in types])
+    )
+
+
+def _level_filter(doc, level_name):
+    level = levels_by_name(doc).get(level_name)
+    if level is None:
+        raise QueryError("Level not found: {}".format(level_name), 404)
+    return DB.ElementLevelFilter(level.Id)
+
+
+def _bounding_box_filter(box):
+    try:
+        outline = DB.Outline(parse_point(box.get("min")), parse_point(box.get("max")))
+    except (AttributeError, ValueError, TypeError) as e:
+        raise QueryError("bounding_box needs min and max points: {}".format(e))
+    if box.get("inside"):
+        return DB.BoundingBoxIsInsideFilter(outline)
+    return DB.BoundingBoxIntersectsFilter(outline)
+
+
+def _builtin_parameter(name):
+    """BuiltInParameter given by name, e.g. "FIRE_RATING", or None"""
+    name = str(name)
+    if name.startswith("BuiltInParameter."):
+        name = name[len("BuiltInParameter.") :]
+    if not name.isupper():
+        return None
+    return getattr(DB.BuiltInParameter, name, None)
+
+
+def _get_parameter(element, name, builtin):
+    if builtin is not None:
+        return element.get_Parameter(builtin)
+    return element.LookupParameter(name)
+
+
+def _find_parameter(element, name):
+    """
+    Return (parameter, is_type_parameter) for a parameter name
+
+    The name may be a BuiltInParameter name. The element's own parameter
+    wins; otherwise its type's is used. (None, False) when neither has it.
+    """
+    builtin = _builtin_parameter(name)
+    param = _get_parameter(element, name, builtin)
+    if param is not None:
+        return param, False
+    try:
+        element_type = element.Document.GetElement(element.GetTypeId())
+        if element_type is not None:
+            param = _get_parameter(element_type, name, builtin)
+            if param is not None:
+                return param, True
+    except Exception:
+        pass
+    return None, False
+
+
+def _string_rule(method, param_id, value):
+    # The case-sensitivity argument was dropped from these factories in Revit 2023
+    try:
+        return method(param_id, value)
+    except TypeError:
+        return method(param_id, value, False)
+
+
+def _rule_value(storage_type, value, parameter_name):
+    """Convert a JSON predicate value to what the rule factory expects"""
+    try:
+        if storage_type == DB.StorageType.Double:
+            return float(value)
+        if storage_type == DB.StorageType.Integer:
+            if isinstance(value, bool) or str(value).lower() in ("true", "false"):
+                return 1 if str(value).lower() == "true" else 0
+            return int(value)
+        if storage_type == DB.StorageType.ElementId:
+            return DB.ElementId(int(value))
+        return "" if value is None else str(value)
+    except (TypeError, ValueError):
+        raise QueryError(
+            "Value {!r} does not match the storage type of '{}' ({})".format(
+                value, parameter_name, storage_type
+            )
+        )
+
+
+def _parameter_rule(param_id, storage_type, operator, value, parameter_name):
+    factory = getattr(DB.ParameterFilterRuleFactory, RULE_FACTORIES[operator], None)
+    if factory is None:
+        raise QueryError(
+            "Operator '{}' is not supported by this Revit version".format(operator)
+        )
+    if operator in ("has_value", "has_no_value"):
+        return factory(param_id)
+
+    if operator in STRING_OPERATORS and storage_type != DB.StorageType.String:
+        raise QueryError(
+            "Operator '{}' needs a text parameter; '{}' is {}".format(
+                operator, parameter_name, storage_type
+            )
+        )
+    value = _rule_value(storage_type, value, parameter_name)
+    if storage_type == DB.StorageType.String:
+        return _string_rule(factory, param_id, value)
+    if storage_type == DB.StorageType.Double:
+        return factory(param_id, value, DOUBLE_EPSILON)
+    return factory(param_id, value)
+
+
+def _types_collector(doc, type_filters):
+    types = DB.FilteredElementCollector(doc).WhereElementIsElementType()
+    for type_filter in type_filters:
+        types = types.WherePasses(type_filter)
+    return types
+
+
+def _type_id_filter(type_ids):
+    """Match instances of any of the given types by ELEM_TYPE_PARAM"""
+    type_param_id = DB.ElementId(DB.BuiltInParameter.ELEM_TYPE_PARAM)
+    filters = [
+        DB.ElementParameterFilter(
+            DB.ParameterFilterRuleFactory.CreateEqualsRule(type_param_id, type_id)
+        )
+        for type_id in type_ids
+    ]
+    if len(filters) == 1:
+        return filters[0]
+    return DB.LogicalOrFilter(List[DB.ElementFilter](filters))
+
+
+def _type_parameter_filter(doc, type_filters, rule):
+    """
+    Match instances whose type passes a type-parameter rule
+
+    Revit evaluates ElementParameterFilter against the element itself, so the
+    rule is applied to the element types first and instances are then matched
+    by their type id, both natively. More than MAX_TYPE_RULES matching types
+    is rejected rather than compiled into a huge filter.
+    """
+    rule_filter = DB.ElementParameterFilter(rule)
+    type_ids = list(_types_collector(doc, type_filters).WherePasses(rule_filter).ToElementIds())
+    if not type_ids:
+        return None
+    if len(type_ids) > MAX_TYPE_RULES:
+        raise QueryError(
+            "{} element types match a type parameter predicate (max {}); "
+            "narrow the query with categories".format(len(type_ids), MAX_TYPE_RULES)
+        )
+    return _type_id_filter(type_ids)
+
+
+def _type_groups(doc, type_filters):
+    """
+    Element types grouped by the parameter set their instances share
+
+    Loadable family types are grouped by family; system types (WallType,
+    FloorType, ...) by category and class. Rejects more than
+    MAX_PARAMETER_GROUPS groups.
+    """
+    groups = OrderedDict()
+    for element_type in _types_collector(doc, type_filters):
+        family = getattr(element_type, "Family", None)
+        if family is not None:
+            key = ("family", family.Id.IntegerValue)
+        else:
+            category = element_type.Category
+            key = (
+                "system",
+                category.Id.IntegerValue if category else None,
+                element_type.GetType().Name,
+            )
+        groups.setdefault(key, []).append(element_type)
+    if len(groups) > MAX_PARAMETER_GROUPS:
+        raise QueryError(
+            "Parameter predicates would be resolved against {} families (max {}); "
+            "narrow the query with categories".format(len(groups), MAX_PARAMETER_GROUPS)
+        )
+    return groups
+
+
+def _instance_sample(collector_factory, key, types):
+    """One candidate instance of a type group, found natively"""
+    if key[0] == "system" and key[1] is not None:
+        group_filter = DB.ElementCategoryFilter(DB.ElementId(key[1]))
+    else:
+        group_filter = _type_id_filter([t.Id for t in types[:MAX_TYPE_RULES]])
+    return collector_factory([group_filter]).FirstElement()
+
+
+def _builtin_definitions(doc, builtin, type_filters, element_types):
+    """Definitions of a BuiltInParameter, without looking at any instance"""
+    param_id = DB.ElementId(builtin)
+    storage_type = doc.get_TypeOfStorage(builtin)
+    definitions = [(param_id, storage_type, False)]
+    if not element_types:
+        # Also match through the type when any candidate type carries it
+        for element_type in _types_collector(doc, type_filters):
+            if element_type.get_Parameter(builtin) is not None:
+                definitions.append((param_id, storage_type, True))
+                break
+    return definitions
+
+
+def _parameter_definitions(doc, name, resolver):
+    """
+    Distinct (parameter id, storage type, is_type) of a parameter name
+
+    BuiltInParameter names are resolved directly. Other names are looked up
+    on the first type of every family (or system type group) among the
+    candidate types, and on one instance of the group when the type does not
+    have it: non-shared family parameters get a different Id in every family,
+    and a parameter can be an instance parameter in one family and a type
+    parameter in another.
+
+    Raises QueryError when nothing has the parameter (404) or when the
+    definitions disagree on storage type (400), since one predicate value
+    cannot be compared against both.
+    """
+    builtin = _builtin_parameter(name)
+    if builtin is not None:
+        return _builtin_definitions(
+            doc, builtin, resolver["type_filters"], resolver["element_types"]
+        )
+
+    if resolver.get("groups") is None:
+        resolver["groups"] = _type_groups(doc, resolver["type_filters"])
+
+    definitions = []
+    seen = set()
+
+    def add(param, is_type):
+        key = (param.Id.IntegerValue, str(param.StorageType), is_type)
+        if key not in seen:
+            seen.add(key)
+            definitions.append((param.Id, param.StorageType, is_type))
+
+    for key, types in resolver["groups"].items():
+        param = types[0].LookupParameter(name)
+        if param is not None:
+            # When querying types the parameter is on the element itself
+            add(param, not resolver["element_types"])
+            continue
+        if resolver["element_types"]:
+            continue
+        instance = _instance_sample(resolver["collector"], key, types)
+        param = instance.LookupParameter(name) if instance is not None else None
+        if param is not None:
+            add(param, False)
+
+    if not definitions:
+        raise QueryError("Parameter not found: {}".format(name), 404)
+    storage_types = sorted(set(str(storage_type) for _, storage_type, _ in definitions))
+    if len(storage_types) > 1:
+        raise QueryError(
+            "Parameter '{}' has different storage types across the matched "
+            "families ({}); narrow the query with categories or classes".format(
+                name, ", ".join(storage_types)
+            )
+        )
+    return definitions
+
+
+def _parameter_filters(doc, predicates, collector_factory, type_filters, element_types):
+    """
+    Compile parameter predicates into native filters
+
+    Parameters are resolved from the candidate element types (see
+    _parameter_definitions) and one rule is ORed in per distinct
+    definition. Returns None when nothing can match.
+    """
+    resolver = {
+        "collector": collector_factory,
+        "type_filters": type_filters,
+        "element_types": element_types,
+        "groups": None,
+    }
+    filters = []
+    for predicate in predicates:
+        if not isinstance(predicate, dict) or not predicate.get("parameter"):
+            raise QueryError("Each predicate needs a 'parameter'")
+        name = predicate["parameter"]
+        operator = str(predicate.get("op", "equals")).lower()
+        operator = OPERATOR_ALIASES.get(operator, operator)
+        if operator not in RULE_FACTORIES:
+            raise QueryError(
+                "Unknown operator '{}'; use one of {}".format(
+                    operator, ", ".join(sorted(RULE_FACTORIES))
+                )
+            )
+
+        alternatives = []
+        for param_id, storage_type, is_type in _parameter_definitions(doc, name, resolver):
+            rule = _parameter_rule(
+                param_id, storage_type, operator, predicate.get("value"), name
+            )
+            if is_type:
+                type_filter = _type_parameter_filter(doc, type_filters, rule)
+                if type_filter is not None:
+                    alternatives.append(type_filter)
+            else:
+                alternatives.append(DB.ElementParameterFilter(rule))
+
+        if not alternatives:
+            return None
+        if len(alternatives) == 1:
+            filters.append(alternatives[0])
+        else:
+            filters.append(DB.LogicalOrFilter(List[DB.ElementFilter](alternatives)))
+    return filters
+
+
+def _parameter_value(doc, param):
+    """JSON value of a parameter: text, number, bool or element name"""
+    if param is None or not param.HasValue:
+        return None
+    storage_type = param.StorageType
+    if storage_type == DB.StorageType.String:
+        return param.AsString()
+    if storage_type == DB.StorageType.Integer:
+        return param.AsInteger()
+    if storage_type == DB.StorageType.Double:
+        return param.AsValueString() or param.AsDouble()
+    if storage_type == DB.StorageType.ElementId:
+        element_id = param.AsElementId()
+        if element_id == DB.ElementId.InvalidElementId:
+            return None
+        element = doc.GetElement(element_id)
+        return get_element_name(element) if element else element_id.IntegerValue
+    return param.AsValueString()
+
+
+def _location(element):
+    location = element.Location
+    if hasattr(location, "Point"):
+        pt = location.Point
+        return {"x": pt.X, "y": pt.Y, "z": pt.Z}
+    if hasattr(location, "Curve"):
+        start = location.Curve.GetEndPoint(0)
+        end = location.Curve.GetEndPoint(1)
+        return {
+            "start": {"x": start.X, "y": start.Y, "z": start.Z},
+            "end": {"x": end.X, "y": end.Y, "z": end.Z},
+        }
+    return None
+
+
+def _field_value(doc, element, field):
+    if field == "id":
+        return element.Id.IntegerValue
+    if field == "unique_id":
+        return element.UniqueId
+    if field == "name":
+        return get_element_name(element)
+    if field == "category":
+        return element.Category.Name if element.Category else None
+    if field == "class":
+        return element.GetType().Name
+    if field in ("type", "family"):
+        element_type = doc.GetElement(element.GetTypeId())
+        if element_type is None:
+            return None
+        if field == "type":
+            return get_element_name(element_type)
+        return getattr(element_type, "FamilyName", None)
+    if field == "level":
+        level = doc.GetElement(element.LevelId)
+        return get_element_name(level) if level else None
+    if field == "location":
+        return _location(element)
+
+    param, _ = _find_parameter(element, field)
+    return _parameter_value(doc, param)
+
+
+def project_element(doc, element, fields):
+    """Build the result row for an element from the requested fields"""
+    row = {}
+    for field in fields:
+        try:
+            row[field] = _field_value(doc, element, field)
+        except Exception as e:
+            logger.debug("Could not read field %s: %s", field, e)
+            row[field] = None
+    return row
+
+
+def run_query(doc, query):
+    """
+    Evaluate a declarative query and return one page of projected elements
+
+    Raises QueryError for queries that reference unknown categories, levels,
+    views, classes or parameters.
+    """
+    view_id = None
+    if query.get("view"):
+        view = find_view_by_name(doc, query["view"])
+        if view is None:
+            raise QueryError("View not found: {}".format(query["view"]), 404)
+        view_id = view.Id
+
+    filters = []
+    type_filters = []
+    categories = _as_list(query.get("categories") or query.get("category"))
+    if categories:
+        category_filter = _category_filter(doc, categories)
+        filters.append(category_filter)
+        type_filters.append(category_filter)
+    element_types = bool(query.get("element_types", False))
+    classes = _as_list(query.get("classes") or query.get("class"))
+    if classes:
+        class_filter = _class_filter(classes)
+        filters.append(class_filter)
+        if element_types:
+            type_filters.append(class_filter)
+        elif all(str(name) in TYPE_CLASSES for name in classes):
+            type_filters.append(
+                _class_filter(sorted(set(TYPE_CLASSES[str(name)] for name in classes)))
+            )
+    if query.get("level"):
+        filters.append(_level_filter(doc, query["level"]))
+    if query.get("bounding_box"):
+        filters.append(_bounding_box_filter(query["bounding_box"]))
+
+    def collector(extra=None):
+        if view_id is not None:
+            result = DB.FilteredElementCollector(doc, view_id)
+        else:
+            result = DB.FilteredElementCollector(doc)
+        if element_types:
+            result = result.WhereElementIsElementType()
+        else:
+            result = result.WhereElementIsNotElementType()
+        combined = _and_filters(filters + (extra or []))
+        if combined is not None:
+            result = result.WherePasses(combined)
+        return result
+
+    predicates = _as_list(query.get("where"))
+    if predicates:
+        parameter_filters = _parameter_filters(
+            doc, predicates, collector, type_filters, element_types
+        )
+        element_ids = (
+            [] if parameter_filters is None else collector(parameter_filters).ToElementIds()
+        )
+    else:
+        element_ids = collector().ToElementIds()
+
+    try:
+        offset = max(0, int(query.get("offset") or 0))
+        limit = int(query.get("limit") or DEFAULT_QUERY_LIMIT)
+    except (TypeError, ValueError):
+        raise QueryError("limit and offset must be integers")
+    limit = max(1, min(limit, MAX_QUERY_LIMIT))
+    fields = _as_list(query.get("fields")) or list(DEFAULT_FIELDS)
+
+    # Page over sorted ids so only the requested elements are expanded
+    sorted_ids = sorted(element_id.IntegerValue for element_id in element_ids)
+    page_ids = sorted_ids[offset : offset + limit]
+    elements = []
+    for element_id in page_ids:
+        element = doc.GetElement(DB.ElementId(element_id))
+        if element is not None:
+            elements.append(project_element(doc, element, fields))
+
+    next_offset = offset + len(page_ids)
+    return {
+        "status": "success",
+        "total": len(sorted_ids),
+        "count": len(elements),
+        "offset": offset,
+        "limit": limit,
+        "next_offset": next_offset if next_offset < len(sorted_ids) else None,
+        "fields": fields,
+        "elements": elements,
+    }
+
+
+def register_query_routes(api):
+    """Register element query routes with the API"""
+
+    @api.route("/query/", methods=["POST"])
+    def query_elements(doc, request):
+        """
+        Find elements with native filters and return selected fields
+
+        Expected JSON payload (every key optional):
+        {
+            "categories": ["Doors"],          // names, OST_* names or English names
+            "classes": ["FamilyInstance"],    // Revit API class names
+            "level": "Level 2",
+            "view": "Level 2",                // only elements visible in this view
+            "bounding_box": {"min": {"x":, "y":, "z":}, "max": {...},
+                             "inside": false}  // intersecting, or fully inside
+            "where": [{"parameter": "Fire Rating", "op": "equals", "value": "60"}],
+            "element_types": false,           // query types instead of instances
+            "fields": ["id", "name", "type", "level", "Fire Rating"],
+            "limit": 100,
+            "offset": 0
+        }
+
+        Predicate operators: equals, not_equals, greater, greater_or_equal,
+        less, less_or_equal, contains, not_contains, begins_with, ends_with,
+        has_value, has_no_value (or =, !=, >, >=, <, <=). Parameters are
+        given by name (instance or type) or BuiltInParameter name; numbers
+        are compared in Revit internal units (feet for lengths).
+        """
+        try:
+            if not doc:
+                return routes.make_response(
+                    data={"error": "No active Revit document"}, status=503
+                )
+
+            query = (
+                json.loads(request.data)
+                if isinstance(request.data, str)
+                else request.data
+            ) or {}
+
+            cached = result_cache.get(doc, "/query/", query)
+            if cached is not None:
+                return routes.make_response(data=cached)
+
+            result = run_query(doc, query)
+            result_cache.put(doc, "/query/", result, query)
+            return routes.make_response(data=result)
+
+        except QueryError as e:
+            return routes.make_response(data={"error": str(e)}, status=e.status)
+        except Exception as e:
+            logger.error("Element query failed: {}".format(str(e)))
+            return routes.make_response(
+                data={"error": "Element query failed: {}".format(str(e))}, status=500
+            )
+
+    logger.info("Query routes registered successfully")
@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
-from pyrevit import DB
+from pyrevit import routes, DB
+import difflib
+import itertools
+import json
+import re
 import traceback
 import logging
+import System
+
+from cache import result_cache
 
 logger = logging.getLogger(__name__)
 
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# Rows per ?format=ndjson response, by default and at most. pyRevit writes
+# whole responses, so the page size is what bounds one response's memory.
+NDJSON_PAGE_SIZE = 1000
+NDJSON_MAX_PAGE_SIZE = 5000
+
 
 def normalize_string(text):
     """Safely normalize string values"""
@@ -24,18 +38,315 @@ def get_element_name(element):
         return DB.Element.Name.__get__(element)
 
 
+class FamilySymbolIndex(object):
+    """
+    Index of the family symbols in a document
+
+    Maps (family_name, type_name) to symbol ids and supports substring,
+    prefix and fuzzy search for listings and "did you mean" suggestions.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.symbol_ids = set()
+        self._by_pair = {}
+        self._first_by_family = {}
+        for entry in entries:
+            symbol_id = entry["symbol_id"]
+            self.symbol_ids.add(symbol_id)
+            self._by_pair.setdefault((entry["family_name"], entry["type_name"]), symbol_id)
+            self._first_by_family.setdefault(entry["family_name"], symbol_id)
+
+    @classmethod
+    def build(cls, doc):
+        entries = []
+        for symbol in DB.FilteredElementCollector(doc).OfClass(DB.FamilySymbol):
+            try:
+                entries.append(
+                    {
+                        "family_name": symbol.Family.Name,
+                        "type_name": get_element_name(symbol),
+                        "category": symbol.Category.Name if symbol.Category else "Unknown",
+                        "is_active": symbol.IsActive,
+                        "symbol_id": symbol.Id.IntegerValue,
+                    }
+                )
+            except Exception as e:
+                logger.debug("Skipping family symbol in index: %s", e)
+        return cls(entries)
+
+    def find_id(self, family_name, type_name=None):
+        """Symbol id for a family (and optionally type) name, or None"""
+        if type_name:
+            return self._by_pair.get((family_name, type_name))
+        return self._first_by_family.get(family_name)
+
+    def search(self, contains=None):
+        """Entries whose family or type name contains the text (any case)"""
+        if not contains:
+            return list(self.entries)
+        needle = contains.lower()
+        return [
+            entry
+            for entry in self.entries
+            if needle in entry["family_name"].lower()
+            or needle in entry["type_name"].lower()
+        ]
+
+    def suggest(self, family_name, type_name=None, limit=10):
+        """
+        Suggest "Family - Type" names close to a failed lookup
+
+        Types of an exactly matching family come first, then families that
+        start with the requested name, then fuzzy matches.
+        """
+        suggestions = []
+        if family_name in self._first_by_family:
+            suggestions.extend(
+                "{} - {}".format(entry["family_name"], entry["type_name"])
+                for entry in self.entries
+                if entry["family_name"] == family_name
+            )
+
+        families = sorted(self._first_by_family)
+        lowered = dict((name.lower(), name) for name in families)
+        query = (family_name or "").lower()
+        candidates = [name for name in families if name.lower().startswith(query)]
+        candidates.extend(
+            lowered[match]
+            for match in difflib.get_close_matches(query, list(lowered), n=limit)
+        )
+
+        for candidate in candidates:
+            if candidate == family_name:
+                continue
+            label = candidate
+            if type_name and (candidate, type_name) in self._by_pair:
+                label = "{} - {}".format(candidate, type_name)
+            if label not in suggestions:
+                suggestions.append(label)
+        return suggestions[:limit]
+
+
+def _family_elements_filter():
+    """Native filter for the element classes the family symbol index reads"""
+    return DB.LogicalOrFilter(
+        DB.ElementClassFilter(DB.FamilySymbol), DB.ElementClassFilter(DB.Family)
+    )
+
+
+def _family_index_affected(change, index):
+    """
+    True when a DocumentChanged event touches family symbols
+
+    Deleted and modified ids are checked against the indexed symbol ids;
+    added symbols and renamed families are found by class filter, so no
+    element is fetched with doc.GetElement.
+    """
+    for element_ids in (change.GetDeletedElementIds(), change.GetModifiedElementIds()):
+        for element_id in element_ids:
+            if element_id.IntegerValue in index.symbol_ids:
+                return True
+    if change.GetAddedElementIds(_family_elements_filter()).Count > 0:
+        return True
+    # A family rename changes family_name without modifying its symbols
+    return change.GetModifiedElementIds(DB.ElementClassFilter(DB.Family)).Count > 0
+
+
+result_cache.set_change_filter("family_symbol_index", _family_index_affected)
+
+
+def get_family_symbol_index(doc):
+    """
+    Get the family symbol index for a document
+
+    Built lazily and only rebuilt after families or symbols are loaded,
+    removed or modified, so bulk placement does not rescan symbols.
+    """
+    index = result_cache.get(doc, "family_symbol_index")
+    if index is None:
+        index = FamilySymbolIndex.build(doc)
+        result_cache.put(doc, "family_symbol_index", index)
+    return index
+
+
 def find_family_symbol_safely(doc, target_family_name, target_type_name=None):
     """
     Safely find a family symbol by name
     """
     try:
-        collector = DB.FilteredElementCollector(doc).OfClass(DB.FamilySymbol)
-
-        for symbol in collector:
-            if symbol.Family.Name == target_family_name:
-                if not target_type_name or symbol.Name == target_type_name:
-                    return symbol
-        return None
+        symbol_id = get_family_symbol_index(doc).find_id(
+            target_family_name, target_type_name
+        )
+        if symbol_id is None:
+            return None
+        return doc.GetElement(DB.ElementId(symbol_id))
     except Exception as e:
         logger.error("Error finding family symbol: %s", str(e))
         return None
+
+
+def _builtin_category_name(category):
+    """OST_* name of a built-in category, or None for user-defined ones"""
+    try:
+        bic = category.BuiltInCategory
+    except AttributeError:
+        # Category.BuiltInCategory only exists in newer Revit versions
+        bic = System.Enum.ToObject(DB.BuiltInCategory, category.Id.IntegerValue)
+    name = str(bic)
+    return name if name.startswith("OST_") else None
+
+
+def _build_category_index(doc):
+    """
+    Map category names and aliases to integer category ids
+
+    Aliases are added in priority order so an exact name always wins over a
+    looser alias: exact name, lower-cased name, OST_* name, then the English
+    name derived from OST_* (e.g. "Structural Framing"), which lets English
+    names resolve in localized Revit.
+    """
+    categories = []
+    for category in doc.Settings.Categories:
+        try:
+            categories.append(
+                (category.Name, _builtin_category_name(category), category.Id.IntegerValue)
+            )
+        except Exception as e:
+            logger.debug("Skipping category in index: %s", e)
+
+    index = {}
+    for name, _, category_id in categories:
+        index.setdefault(name, category_id)
+    for name, _, category_id in categories:
+        index.setdefault(name.lower(), category_id)
+    for _, bic_name, category_id in categories:
+        if bic_name:
+            index.setdefault(bic_name, category_id)
+            index.setdefault(bic_name.lower(), category_id)
+    for _, bic_name, category_id in categories:
+        if bic_name:
+            english_name = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", bic_name[4:])
+            index.setdefault(english_name.lower(), category_id)
+            index.setdefault(bic_name[4:].lower(), category_id)
+    return index
+
+
+def resolve_category_id(doc, category_name):
+    """
+    Resolve a category name to its ElementId in O(1)
+
+    Accepts the display name (any case), the BuiltInCategory name such as
+    "OST_Walls", or the English name on localized Revit. The name index is
+    built once per document and dropped when the document changes.
+
+    Returns:
+        DB.ElementId or None if no category matches
+    """
+    if not category_name:
+        return None
+    index = result_cache.get(doc, "category_index")
+    if index is None:
+        index = _build_category_index(doc)
+        result_cache.put(doc, "category_index", index)
+
+    name = normalize_string(category_name)
+    category_id = index.get(name)
+    if category_id is None:
+        category_id = index.get(name.lower())
+    return DB.ElementId(category_id) if category_id is not None else None
+
+
+def unpack_response(response):
+    """
+    Split a route handler return value into (status, data)
+
+    Handlers normally return routes.make_response(...), but plain dicts are
+    accepted too so the result can be reused outside the HTTP layer.
+    """
+    if isinstance(response, dict):
+        return 200, response
+    status = getattr(response, "status", 200) or 200
+    data = getattr(response, "data", response)
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            pass
+    return int(status), data
+
+
+def get_request_params(request):
+    """Return the query parameters of a route request as a plain dict"""
+    params = getattr(request, "params", None) if request else None
+    return dict(params) if params else {}
+
+
+def wants_ndjson(request):
+    """True when the caller asked for ?format=ndjson"""
+    return str(get_request_params(request).get("format", "")).lower() == "ndjson"
+
+
+def wants_binary(request):
+    """
+    True when the caller asked for raw image bytes
+
+    Either ?transport=binary or an Accept header that prefers image/* over
+    JSON; anything else keeps the base64 JSON transport.
+    """
+    if str(get_request_params(request).get("transport", "")).lower() == "binary":
+        return True
+    accept = str(request_header(request, "Accept") or "").lower()
+    return accept.startswith("image/")
+
+
+def request_header(request, name):
+    """Return a request header value (case-insensitive), or None"""
+    headers = getattr(request, "headers", None) if request else None
+    if not headers:
+        return None
+    try:
+        for key in headers.keys():
+            if str(key).lower() == name.lower():
+                return headers[key]
+    except Exception:
+        return None
+    return None
+
+
+def ndjson_paging(params):
+    """
+    (offset, limit) of an NDJSON page from ?offset= and ?limit=
+
+    limit defaults to NDJSON_PAGE_SIZE and is capped at NDJSON_MAX_PAGE_SIZE.
+    Raises ValueError for a negative offset or a limit below 1.
+    """
+    offset = int(params.get("offset") or 0)
+    limit = params.get("limit")
+    limit = int(limit) if limit not in (None, "") else NDJSON_PAGE_SIZE
+    if offset < 0 or limit < 1:
+        raise ValueError("offset must be >= 0 and limit >= 1")
+    return offset, min(limit, NDJSON_MAX_PAGE_SIZE)
+
+
+def ndjson_response(rows, next_offset=None):
+    """
+    Build a newline-delimited JSON response, one object per line
+
+    The whole body is built before pyRevit sends it, so callers pass one
+    page of rows (see ndjson_page). next_offset, when given, is sent as the
+    X-Next-Offset header for the client to request the following page.
+    """
+    lines = [json.dumps(row) for row in rows]
+    lines.append("")
+    headers = {"Content-Type": NDJSON_CONTENT_TYPE}
+    if next_offset is not None:
+        headers["X-Next-Offset"] = str(next_offset)
+    return routes.make_response(data="\n".join(lines), headers=headers)
+
+
+def ndjson_page(rows, offset, limit):
+    """NDJSON response for rows[offset:offset + limit] of an iterable"""
+    page = list(itertools.islice(rows, offset, offset + limit + 1))
+    next_offset = offset + limit if len(page) > limit else None
+    return ndjson_response(page[:limit], next_offset)
@@ -5,163 +5,573 @@ Handles view export and image generation functionality
 """
 
 from pyrevit import routes, revit, DB
+import json
 import tempfile
 import os
+import shutil
+import time
 import base64
+import bisect
 import logging
 from System.Collections.Generic import List
-
-from utils import normalize_string, get_element_name
+from System.IO import MemoryStream
+import clr
+
+clr.AddReference("System.Drawing")
+from System import Drawing
+from System.Drawing.Imaging import ImageFormat
+
+try:
+    from urllib import quote
+except ImportError:
+    from urllib.parse import quote
+
+from utils import (
+    normalize_string,
+    get_element_name,
+    get_request_params,
+    wants_ndjson,
+    wants_binary,
+    request_header,
+    ndjson_paging,
+    ndjson_page,
+    ndjson_response,
+    NDJSON_PAGE_SIZE,
+    NDJSON_MAX_PAGE_SIZE,
+    resolve_category_id,
+)
+from cache import result_cache, document_key
+from image_cache import image_cache
+from jobs import job_manager, run_or_submit, report_progress
 
 logger = logging.getLogger(__name__)
 
 
-def register_views_routes(api):
-    """Register all view-related routes with the API"""
+# Keys used to group views in /list_views/
+VIEW_TYPE_KEYS = {
+    DB.ViewType.FloorPlan: "floor_plans",
+    DB.ViewType.CeilingPlan: "ceiling_plans",
+    DB.ViewType.Elevation: "elevations",
+    DB.ViewType.Section: "sections",
+    DB.ViewType.ThreeD: "3d_views",
+    DB.ViewType.DraftingView: "drafting_views",
+    DB.ViewType.Schedule: "schedules",
+}
 
-    @api.route("/get_view/<view_name>", methods=["GET"])
-    def get_view(doc, view_name):
-        """
-        Export a named Revit view as a PNG image and return the image data
 
-        Args:
-            doc: Revit document (provided by MCP context)
-            view_name: Name of the view to export
-
-        Returns:
-            dict: Contains base64 encoded image data and content type, or error message
-        """
+def _iter_exportable_views(doc):
+    """Yield (view_type_key, view_name) for every exportable view"""
+    for view in DB.FilteredElementCollector(doc).OfClass(DB.View):
         try:
-            if not doc:
-                return routes.make_response(
-                    data={"error": "No active Revit document"}, status=503
-                )
+            # Skip templates and internal views
+            if hasattr(view, "IsTemplate") and view.IsTemplate:
+                continue
+
+            if (
+                view.ViewType == DB.ViewType.Internal
+                or view.ViewType == DB.ViewType.ProjectBrowser
+            ):
+                continue
 
-            # Normalize the view name
-            view_name = normalize_string(view_name)
-            logger.info("Exporting view: {}".format(view_name))
+            yield VIEW_TYPE_KEYS.get(view.ViewType, "other"), get_element_name(view)
 
-            # Define output folder in temp directory
-            output_folder = os.path.join(tempfile.gettempdir(), "RevitMCPExports")
+        except Exception as e:
+            logger.warning("Could not process view: {}".format(str(e)))
+            continue
+
+
+def _list_exportable_views(doc):
+    """Exportable view names grouped by type and sorted, as /list_views/ returns them"""
+    views_by_type = {
+        "floor_plans": [],
+        "ceiling_plans": [],
+        "elevations": [],
+        "sections": [],
+        "3d_views": [],
+        "drafting_views": [],
+        "schedules": [],
+        "other": [],
+    }
+
+    for view_type, view_name in _iter_exportable_views(doc):
+        views_by_type[view_type].append(view_name)
+
+    # Sort all lists alphabetically
+    for view_list in views_by_type.values():
+        view_list.sort()
+
+    # Count total exportable views
+    total_views = sum(len(view_list) for view_list in views_by_type.values())
+
+    return {
+        "views_by_type": views_by_type,
+        "total_exportable_views": total_views,
+        "status": "success",
+    }
+
+
+def _resolve_category_ids(doc, category_names):
+    """Map category names to ElementIds, returning (ids, missing_names)"""
+    category_ids = []
+    missing = []
+    for name in category_names:
+        category_id = resolve_category_id(doc, name)
+        if category_id is not None:
+            category_ids.append(category_id)
+        else:
+            missing.append(name)
+    return category_ids, missing
+
+
+def _category_filter(category_ids):
+    """Native filter matching any of the given category ids"""
+    if len(category_ids) == 1:
+        return DB.ElementCategoryFilter(category_ids[0])
+    filters = List[DB.ElementFilter]()
+    for category_id in category_ids:
+        filters.Add(DB.ElementCategoryFilter(category_id))
+    return DB.LogicalOrFilter(filters)
+
+
+def _element_info(doc, elem):
+    """Build the element summary returned by /current_view_elements/"""
+    try:
+        element_info = {
+            "element_id": elem.Id.IntegerValue,
+            "name": get_element_name(elem),
+            "element_type": elem.GetType().Name,
+        }
+
+        # Add category information
+        if elem.Category:
+            element_info["category"] = elem.Category.Name
+            element_info["category_id"] = elem.Category.Id.IntegerValue
+        else:
+            element_info["category"] = "Unknown"
+            element_info["category_id"] = None
+
+        # Add level information if available
+        try:
+            level_param = elem.get_Parameter(DB.BuiltInParameter.FAMILY_LEVEL_PARAM)
+            if level_param:
+                level_id = level_param.AsElementId()
+                if level_id != DB.ElementId.InvalidElementId:
+                    level_elem = doc.GetElement(level_id)
+                    element_info["level"] = get_element_name(level_elem)
+                    element_info["level_id"] = level_id.IntegerValue
+                else:
+                    element_info["level"] = None
+                    element_info["level_id"] = None
+            else:
+                element_info["level"] = None
+                element_info["level_id"] = None
+        except Exception:
+            element_info["level"] = None
+            element_info["level_id"] = None
+
+        # Add location information if available
+        try:
+            location = elem.Location
+            if hasattr(location, "Point"):
+                pt = location.Point
+                element_info["location"] = {
+                    "type": "point",
+                    "x": pt.X,
+                    "y": pt.Y,
+                    "z": pt.Z,
+                }
+            elif hasattr(location, "Curve"):
+                curve = location.Curve
+                start = curve.GetEndPoint(0)
+                end = curve.GetEndPoint(1)
+                element_info["location"] = {
+                    "type": "curve",
+                    "start": {"x": start.X, "y": start.Y, "z": start.Z},
+                    "end": {"x": end.X, "y": end.Y, "z": end.Z},
+                }
+            else:
+                element_info["location"] = {"type": "unknown"}
+        except Exception:
+            element_info["location"] = {"type": "unknown"}
+
+        return element_info
+
+    except Exception as elem_error:
+        # Skip elements that cause errors but log the issue
+        logger.warning(
+            "Could not process element {}: {}".format(
+                elem.Id.IntegerValue if elem else "Unknown", str(elem_error)
+            )
+        )
+        return None
+
+
+# Image export settings accepted by /get_view/, with their Revit equivalents
+EXPORT_FORMATS = {
+    "png": (DB.ImageFileType.PNG, ".png", "image/png"),
+    "jpeg": (DB.ImageFileType.JPEGMedium, ".jpg", "image/jpeg"),
+    "jpg": (DB.ImageFileType.JPEGMedium, ".jpg", "image/jpeg"),
+    "bmp": (DB.ImageFileType.BMP, ".bmp", "image/bmp"),
+}
+EXPORT_RESOLUTIONS = {
+    72: DB.ImageResolution.DPI_72,
+    150: DB.ImageResolution.DPI_150,
+    300: DB.ImageResolution.DPI_300,
+    600: DB.ImageResolution.DPI_600,
+}
+DRAWING_FORMATS = {
+    "png": ImageFormat.Png,
+    "jpeg": ImageFormat.Jpeg,
+    "bmp": ImageFormat.Bmp,
+}
+MIN_PIXEL_SIZE = 64
+MAX_PIXEL_SIZE = 8192
+DEFAULT_EXPORT_OPTIONS = {
+    "pixel_size": 1024,
+    "format": "png",
+    "resolution": 150,
+    "zoom_type": "fit",
+    "zoom": 100,
+    "region": None,
+}
+
+
+def parse_export_options(params):
+    """
+    Validate image export options from query parameters
+
+    Args:
+        params (dict): pixel_size, format (png/jpeg/bmp), resolution (72, 150,
+            300 or 600 DPI), zoom_type (fit or zoom), zoom (percent, used with
+            zoom_type=zoom) and region ("x0,y0,x1,y1" as fractions of the image)
+
+    Returns:
+        tuple: (options dict, error message or None)
+    """
+    options = dict(DEFAULT_EXPORT_OPTIONS)
+    try:
+        if params.get("pixel_size"):
+            options["pixel_size"] = int(params["pixel_size"])
+        if params.get("resolution"):
+            options["resolution"] = int(params["resolution"])
+        if params.get("zoom"):
+            options["zoom"] = int(params["zoom"])
+        if params.get("region"):
+            region = params["region"]
+            if not isinstance(region, (list, tuple)):
+                region = str(region).split(",")
+            options["region"] = [float(value) for value in region]
+    except (ValueError, TypeError) as e:
+        return None, "Invalid export option: {}".format(str(e))
+
+    options["format"] = str(params.get("format") or options["format"]).lower()
+    options["zoom_type"] = str(params.get("zoom_type") or options["zoom_type"]).lower()
+
+    if options["format"] not in EXPORT_FORMATS:
+        return None, "format must be one of png, jpeg, bmp"
+    if options["format"] == "jpg":
+        options["format"] = "jpeg"
+    if options["resolution"] not in EXPORT_RESOLUTIONS:
+        return None, "resolution must be one of {}".format(
+            ", ".join(str(dpi) for dpi in sorted(EXPORT_RESOLUTIONS))
+        )
+    if not MIN_PIXEL_SIZE <= options["pixel_size"] <= MAX_PIXEL_SIZE:
+        return None, "pixel_size must be between {} and {}".format(
+            MIN_PIXEL_SIZE, MAX_PIXEL_SIZE
+        )
+    if options["zoom_type"] not in ("fit", "zoom"):
+        return None, "zoom_type must be fit or zoom"
+    if not 1 <= options["zoom"] <= 100:
+        return None, "zoom must be between 1 and 100 percent"
+
+    region = options["region"]
+    if region is not None:
+        if len(region) != 4:
+            return None, "region must have 4 values: x0,y0,x1,y1"
+        x0, y0, x1, y1 = region
+        if not (0.0 <= x0 < x1 <= 1.0 and 0.0 <= y0 < y1 <= 1.0):
+            return None, "region must satisfy 0 <= x0 < x1 <= 1 and 0 <= y0 < y1 <= 1"
+
+    return options, None
+
+
+def apply_export_options(ieo, options):
+    """Copy validated options onto a DB.ImageExportOptions"""
+    file_type = EXPORT_FORMATS[options["format"]][0]
+    ieo.HLRandWFViewsFileType = file_type
+    ieo.ShadowViewsFileType = file_type
+    ieo.ImageResolution = EXPORT_RESOLUTIONS[options["resolution"]]
+    if options["zoom_type"] == "zoom":
+        ieo.ZoomType = DB.ZoomFitType.Zoom
+        ieo.Zoom = options["zoom"]
+    else:
+        ieo.ZoomType = DB.ZoomFitType.FitToPage
+        ieo.PixelSize = options["pixel_size"]
+
+
+def read_image(path, options):
+    """
+    Read an exported image, cropping it to the requested region
+
+    Returns:
+        tuple: (image bytes, width, height) of the returned image
+    """
+    bitmap = Drawing.Bitmap(path)
+    try:
+        region = options.get("region")
+        if not region:
+            width, height = bitmap.Width, bitmap.Height
+            bitmap.Dispose()
+            bitmap = None
+            with open(path, "rb") as img_file:
+                return img_file.read(), width, height
+
+        x0, y0, x1, y1 = region
+        left = int(round(x0 * bitmap.Width))
+        top = int(round(y0 * bitmap.Height))
+        width = max(1, int(round(x1 * bitmap.Width)) - left)
+        height = max(1, int(round(y1 * bitmap.Height)) - top)
+        cropped = bitmap.Clone(
+            Drawing.Rectangle(left, top, width, height), bitmap.PixelFormat
+        )
+        try:
+            stream = MemoryStream()
+            cropped.Save(stream, DRAWING_FORMATS[options["format"]])
+            return bytes(bytearray(stream.ToArray())), width, height
+        finally:
+            cropped.Dispose()
+    finally:
+        if bitmap is not None:
+            bitmap.Dispose()
+
+
+def find_view_by_name(doc, view_name):
+    """Return the view with the given name, or None"""
+    for view in DB.FilteredElementCollector(doc).OfClass(DB.View):
+        try:
+            if get_element_name(view) == view_name:
+                return view
+        except Exception as e:
+            logger.warning("Could not get name for view: {}".format(str(e)))
+    return None
+
+
+def view_image_key(doc, view, options):
+    """
+    Image cache key (and ETag) for exporting a view with the given options
+
+    None when document events are not bound, since edits could then go
+    unnoticed and stale images would be served.
+    """
+    if not result_cache.bound:
+        return None
+    return image_cache.key(
+        document_key(doc),
+        view.Id.IntegerValue,
+        options,
+        result_cache.document_version(doc),
+    )
+
+
+def cached_view_image(doc, view_name, options, binary=False, if_none_match=None):
+    """
+    Answer a /get_view/ request from the image cache, or return None
+
+    Returns 304 when the caller's If-None-Match already names the current
+    image, so nothing is transferred at all.
+    """
+    if not doc:
+        return None
+    view = find_view_by_name(doc, normalize_string(view_name))
+    if view is None:
+        return None
+    cache_key = view_image_key(doc, view, options)
+    if not cache_key:
+        return None
+    if if_none_match and if_none_match.strip('"') == cache_key:
+        return routes.make_response(data="", status=304, headers={"ETag": cache_key})
+
+    cached = image_cache.get(cache_key)
+    if not cached:
+        return None
+    img_data, entry = cached
+    return image_response(
+        img_data, entry["content_type"], entry["metadata"], binary=binary, etag=cache_key
+    )
+
+
+def image_metadata(view_name, options, width, height):
+    """
+    Metadata stored with a cached image and returned with it
+
+    Shared by /get_view/ and /get_views/, which fill the same cache entries,
+    so a hit looks the same whichever route exported the image.
+    """
+    return {
+        "view_name": view_name,
+        "export_success": True,
+        "format": options["format"],
+        "resolution": options["resolution"],
+        "zoom_type": options["zoom_type"],
+        "pixel_size": options["pixel_size"],
+        "region": ",".join(str(v) for v in options["region"])
+        if options["region"]
+        else None,
+        "width": width,
+        "height": height,
+    }
+
+
+def image_response(img_data, content_type, metadata, binary=False, etag=None):
+    """
+    Build an image response in either transport
+
+    JSON mode returns the image base64 encoded in "image_data" alongside the
+    metadata. Binary mode returns the raw bytes with the metadata in
+    X-Image-* headers, avoiding the base64 overhead and the decode copy.
+    A cached image's key is sent as its ETag.
+    """
+    if binary:
+        headers = {
+            "Content-Type": content_type,
+            "X-Image-Size-Bytes": str(len(img_data)),
+        }
+        if etag:
+            headers["ETag"] = etag
+        for key, value in metadata.items():
+            if value is None:
+                continue
+            header = "X-Image-" + "-".join(
+                part.capitalize() for part in key.split("_")
+            )
+            headers[header] = quote(u"{}".format(value).encode("utf-8"))
+        return routes.make_response(data=img_data, headers=headers)
+
+    data = dict(metadata)
+    data.update(
+        {
+            "image_data": base64.b64encode(img_data).decode("utf-8"),
+            "content_type": content_type,
+            "file_size_bytes": len(img_data),
+            "etag": etag,
+        }
+    )
+    return routes.make_response(
+        data=data, headers={"ETag": etag} if etag else None
+    )
+
+
+def export_view_image(doc, view_name, binary=False, options=None, extra_metadata=None):
+    """
+    Export a named Revit view as an image and return the image data
+
+    Args:
+        doc: Revit document
+        view_name: Name of the view to export
+        binary (bool): Return raw image bytes instead of base64 JSON
+        options (dict): Validated export options, see parse_export_options
+        extra_metadata (dict): Added to the response but not to the cache entry
+
+    Returns:
+        Image response (see image_response), or an error
+    """
+    options = options or dict(DEFAULT_EXPORT_OPTIONS)
+    try:
+        if not doc:
+            return routes.make_response(
+                data={"error": "No active Revit document"}, status=503
+            )
 
-            # Create output folder if it doesn't exist
-            if not os.path.exists(output_folder):
-                os.makedirs(output_folder)
+        # Normalize the view name
+        view_name = normalize_string(view_name)
+        logger.info("Exporting view: {}".format(view_name))
 
-            # Create filename prefix
-            file_path_prefix = os.path.join(output_folder, "export")
+        # Find the view by name
+        target_view = find_view_by_name(doc, view_name)
 
-            # Find the view by name
-            target_view = None
+        if not target_view:
+            # Get list of available views for better error message
+            available_views = []
             all_views = DB.FilteredElementCollector(doc).OfClass(DB.View).ToElements()
-
             for view in all_views:
                 try:
-                    # Use safe name access
-                    current_view_name = get_element_name(view)
-                    if current_view_name == view_name:
-                        target_view = view
-                        break
-                except Exception as e:
-                    logger.warning("Could not get name for view: {}".format(str(e)))
+                    view_name_safe = get_element_name(view)
+                    # Filter out system views and templates
+                    if (
+                        hasattr(view, "IsTemplate")
+                        and not view.IsTemplate
+                        and view.ViewType != DB.ViewType.Internal
+                        and view.ViewType != DB.ViewType.ProjectBrowser
+                    ):
+                        available_views.append(view_name_safe)
+                except:
                     continue
 
-            if not target_view:
-                # Get list of available views for better error message
-                available_views = []
-                for view in all_views:
-                    try:
-                        view_name_safe = get_element_name(view)
-                        # Filter out system views and templates
-                        if (
-                            hasattr(view, "IsTemplate")
-                            and not view.IsTemplate
-                            and view.ViewType != DB.ViewType.Internal
-                            and view.ViewType != DB.ViewType.ProjectBrowser
-                        ):
-                            available_views.append(view_name_safe)
-                    except:
-                        continue
+            return routes.make_response(
+                data={
+                    "error": "View '{}' not found".format(view_name),
+                    "available_views": available_views[
+                        :20
+                    ],  # Limit to first 20 for readability
+                },
+                status=404,
+            )
 
+        # Check if view can be exported
+        try:
+            if hasattr(target_view, "IsTemplate") and target_view.IsTemplate:
                 return routes.make_response(
-                    data={
-                        "error": "View '{}' not found".format(view_name),
-                        "available_views": available_views[
-                            :20
-                        ],  # Limit to first 20 for readability
-                    },
-                    status=404,
+                    data={"error": "Cannot export view templates"}, status=400
                 )
 
-            # Check if view can be exported
-            try:
-                if hasattr(target_view, "IsTemplate") and target_view.IsTemplate:
-                    return routes.make_response(
-                        data={"error": "Cannot export view templates"}, status=400
-                    )
-
-                if target_view.ViewType == DB.ViewType.Internal:
-                    return routes.make_response(
-                        data={"error": "Cannot export internal views"}, status=400
-                    )
-            except Exception as e:
-                logger.warning("Could not check view properties: {}".format(str(e)))
-
-            # Set up export options
-            ieo = DB.ImageExportOptions()
-            ieo.ExportRange = DB.ExportRange.SetOfViews
-
-            # Create list of view IDs to export
-            viewIds = List[DB.ElementId]()
-            viewIds.Add(target_view.Id)
-            ieo.SetViewsAndSheets(viewIds)
+            if target_view.ViewType == DB.ViewType.Internal:
+                return routes.make_response(
+                    data={"error": "Cannot export internal views"}, status=400
+                )
+        except Exception as e:
+            logger.warning("Could not check view properties: {}".format(str(e)))
+
+        # Serve an identical earlier export of the unchanged view from disk
+        cache_key = view_image_key(doc, target_view, options)
+        cached = image_cache.get(cache_key) if cache_key else None
+        if cached:
+            img_data, entry = cached
+            logger.info("Serving cached image for view: {}".format(view_name))
+            return image_response(
+                img_data,
+                entry["content_type"],
+                dict(entry["metadata"], **(extra_metadata or {})),
+                binary=binary,
+                etag=cache_key,
+            )
 
-            ieo.FilePath = file_path_prefix
-            ieo.HLRandWFViewsFileType = DB.ImageFileType.PNG
-            ieo.ShadowViewsFileType = DB.ImageFileType.PNG
-            ieo.ImageResolution = DB.ImageResolution.DPI_150
-            ieo.ZoomType = DB.ZoomFitType.FitToPage
-            ieo.PixelSize = 1024  # Set a reasonable default size
+        content_type = EXPORT_FORMATS[options["format"]][2]
 
-            # Export the image
+        # Export into a directory of our own and pick the file by its expected name
+        output_dir = new_export_dir()
+        try:
             logger.info("Starting image export for view: {}".format(view_name))
-            doc.ExportImage(ieo)
-
-            # Find the exported file (most recent PNG in folder)
-            matching_files = []
-            try:
-                matching_files = [
-                    os.path.join(output_folder, f)
-                    for f in os.listdir(output_folder)
-                    if f.endswith(".png")
-                ]
-                matching_files.sort(key=lambda x: os.path.getctime(x), reverse=True)
-            except Exception as e:
-                logger.error("Could not list exported files: {}".format(str(e)))
-                return routes.make_response(
-                    data={"error": "Could not access export folder"}, status=500
-                )
+            report_progress(0.1, "Exporting view")
+            exported_file = export_views(doc, [target_view], options, output_dir).get(
+                target_view.Id.IntegerValue
+            )
+            report_progress(0.8, "Reading image")
 
-            if not matching_files:
+            if not exported_file:
                 return routes.make_response(
                     data={"error": "Export failed - no image file was created"},
                     status=500,
                 )
-
-            exported_file = matching_files[0]
             logger.info("Image exported successfully: {}".format(exported_file))
 
-            # Read and encode the image
+            # Read the image, cropped to the region of interest if one was given
             try:
-                with open(exported_file, "rb") as img_file:
-                    img_data = img_file.read()
-
-                encoded_data = base64.b64encode(img_data).decode("utf-8")
+                img_data, width, height = read_image(exported_file, options)
 
-                # Get file size for logging
-                file_size = len(img_data)
                 logger.info(
-                    "Image encoded successfully. Size: {} bytes".format(file_size)
+                    "Image read successfully. {}x{} px, {} bytes".format(
+                        width, height, len(img_data)
+                    )
                 )
 
             except Exception as e:
@@ -169,38 +579,505 @@ def register_views_routes(api):
                 return routes.make_response(
                     data={"error": "Could not read exported image file"}, status=500
                 )
-            finally:
-                # Clean up the file
+        finally:
+            # Clean up the export directory
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        metadata = image_metadata(view_name, options, width, height)
+        if cache_key:
+            image_cache.put(
+                cache_key, img_data, {"content_type": content_type, "metadata": metadata}
+            )
+
+        return image_response(
+            img_data,
+            content_type,
+            dict(metadata, **(extra_metadata or {})),
+            binary=binary,
+            etag=cache_key,
+        )
+
+    except Exception as e:
+        logger.error("Failed to export view '{}': {}".format(view_name, str(e)))
+        return routes.make_response(
+            data={"error": "Failed to export view: {}".format(str(e))}, status=500
+        )
+
+
+# Per-request export directories live here, next to the image cache
+EXPORT_ROOT = os.path.join(tempfile.gettempdir(), "RevitMCPExports")
+# Leftovers older than this cannot belong to an export still in progress
+STALE_EXPORT_SECONDS = 3600
+MAX_EXPORT_ROOT_BYTES = 512 * 1024 * 1024
+
+
+def _entry_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for folder, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(folder, name))
+            except OSError:
+                continue
+    return total
+
+
+def _remove_entry(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning("Could not remove export leftover {}: {}".format(path, e))
+
+
+def prune_exports(max_age=STALE_EXPORT_SECONDS, max_bytes=MAX_EXPORT_ROOT_BYTES):
+    """
+    Remove leftover export files and directories from EXPORT_ROOT
+
+    Entries older than max_age seconds are removed, then the oldest of the
+    rest until they fit in max_bytes. The image cache bounds itself and is
+    left alone.
+
+    Returns:
+        int: Number of entries removed
+    """
+    if not os.path.isdir(EXPORT_ROOT):
+        return 0
+    cache_dir = os.path.abspath(image_cache.directory)
+    now = time.time()
+    removed = 0
+    entries = []
+    for name in os.listdir(EXPORT_ROOT):
+        path = os.path.join(EXPORT_ROOT, name)
+        if os.path.abspath(path) == cache_dir:
+            continue
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            continue
+        if now - mtime >= max_age:
+            _remove_entry(path)
+            removed += 1
+        else:
+            entries.append((mtime, path, _entry_size(path)))
+
+    total = sum(size for _, _, size in entries)
+    for _, path, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove_entry(path)
+        total -= size
+        removed += 1
+    return removed
+
+
+def cleanup_exports():
+    """Remove every export leftover; run at startup, before any export begins"""
+    removed = prune_exports(max_age=0)
+    if removed:
+        logger.info("Removed {} orphaned export files".format(removed))
+    return removed
+
+
+def new_export_dir():
+    """Create a unique directory for one export request"""
+    if not os.path.exists(EXPORT_ROOT):
+        os.makedirs(EXPORT_ROOT)
+    prune_exports()
+    return tempfile.mkdtemp(prefix="export_", dir=EXPORT_ROOT)
+
+
+# Upper bound on views per /get_views/ request
+MAX_MULTI_EXPORT = 50
+
+
+def export_error(view):
+    """Why a view cannot be exported as an image, or None"""
+    try:
+        if getattr(view, "IsTemplate", False):
+            return "Cannot export view templates"
+        if view.ViewType in (DB.ViewType.Internal, DB.ViewType.ProjectBrowser):
+            return "Cannot export internal views"
+        if isinstance(view, DB.ViewSheet) and view.IsPlaceholder:
+            return "Cannot export placeholder sheets"
+    except Exception as e:
+        logger.warning("Could not check view properties: {}".format(str(e)))
+    return None
+
+
+def export_views(doc, views, options, output_dir):
+    """
+    Export several views with one ExportImage call
+
+    Output files are matched to views by the name Revit reports for each
+    view (ImageExportOptions.GetFileName), so output_dir should be a fresh
+    directory used by this export only.
+
+    Returns:
+        dict: View id (int) -> exported file path, for the files found
+    """
+    view_ids = List[DB.ElementId]()
+    for view in views:
+        view_ids.Add(view.Id)
+
+    ieo = DB.ImageExportOptions()
+    ieo.ExportRange = DB.ExportRange.SetOfViews
+    ieo.SetViewsAndSheets(view_ids)
+    ieo.FilePath = os.path.join(output_dir, "export")
+    apply_export_options(ieo, options)
+    doc.ExportImage(ieo)
+
+    extension = EXPORT_FORMATS[options["format"]][1]
+    exported = dict(
+        (os.path.splitext(name)[0].lower(), os.path.join(output_dir, name))
+        for name in os.listdir(output_dir)
+        if name.lower().endswith(extension)
+    )
+
+    files = {}
+    for view in views:
+        expected = DB.ImageExportOptions.GetFileName(doc, view.Id)
+        expected = os.path.splitext(os.path.basename(expected))[0].lower()
+        path = exported.get(expected)
+        if path is None:
+            # Revit prefixes names with FilePath; match on the reported suffix
+            for stem, candidate in exported.items():
+                if stem.endswith(expected):
+                    path = candidate
+                    break
+        if path is not None:
+            files[view.Id.IntegerValue] = path
+
+    # A lone view in its own directory is unambiguous even if the names differ
+    if not files and len(views) == 1 and len(exported) == 1:
+        files[views[0].Id.IntegerValue] = list(exported.values())[0]
+    return files
+
+
+def export_view_images(doc, views, options):
+    """
+    Export views as images, serving unchanged ones from the image cache
+
+    Returns:
+        tuple: (list of image dicts with base64 "image_data", list of errors)
+    """
+    images = {}
+    to_export = []
+    for view in views:
+        cache_key = view_image_key(doc, view, options)
+        cached = image_cache.get(cache_key) if cache_key else None
+        if cached:
+            images[view.Id.IntegerValue] = (cached[0], cached[1], cache_key)
+        else:
+            to_export.append((view, cache_key))
+
+    errors = []
+    if to_export:
+        output_dir = new_export_dir()
+        try:
+            report_progress(0.1, "Exporting {} views".format(len(to_export)))
+            files = export_views(doc, [view for view, _ in to_export], options, output_dir)
+            report_progress(0.8, "Reading images")
+
+            content_type = EXPORT_FORMATS[options["format"]][2]
+            for view, cache_key in to_export:
+                path = files.get(view.Id.IntegerValue)
+                if path is None:
+                    errors.append(
+                        {
+                            "view_id": view.Id.IntegerValue,
+                            "view_name": get_element_name(view),
+                            "error": "No image file was created",
+                        }
+                    )
+                    continue
+                img_data, width, height = read_image(path, options)
+                entry = {
+                    "content_type": content_type,
+                    "metadata": image_metadata(
+                        get_element_name(view), options, width, height
+                    ),
+                }
+                if cache_key:
+                    image_cache.put(cache_key, img_data, entry)
+                images[view.Id.IntegerValue] = (img_data, entry, cache_key)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    results = []
+    for view in views:
+        if view.Id.IntegerValue not in images:
+            continue
+        img_data, entry, cache_key = images[view.Id.IntegerValue]
+        image = dict(entry["metadata"])
+        image.update(
+            {
+                "view_id": view.Id.IntegerValue,
+                "content_type": entry["content_type"],
+                "image_data": base64.b64encode(img_data).decode("utf-8"),
+                "file_size_bytes": len(img_data),
+                "etag": cache_key,
+            }
+        )
+        results.append(image)
+    return results, errors
+
+
+# Settings for ?preview=true: a small, cheap export returned right away
+PREVIEW_OPTIONS = {
+    "pixel_size": 256,
+    "format": "jpeg",
+    "resolution": 72,
+    "zoom_type": "fit",
+}
+
+# Full-resolution exports queued by previews, by image cache key
+_full_exports = {}
+
+
+def preview_view_image(doc, view_name, options, binary=False):
+    """
+    Export a low-resolution preview now and queue the full export as a job
+
+    The full export fills the image cache, so asking for the view again
+    without preview (or polling the job) returns the full image. Only one
+    full export is queued per view, options and document version.
+    """
+    full_job = None
+    view = find_view_by_name(doc, normalize_string(view_name)) if doc else None
+    if view is not None and not export_error(view) and job_manager.is_attached:
+        cache_key = view_image_key(doc, view, options)
+        full_job = _full_exports.get(cache_key)
+        if full_job is None or full_job.done:
+            full_job = job_manager.submit(
+                "get_view",
+                lambda: export_view_image(doc, view_name, binary=binary, options=options),
+            )
+            if cache_key:
+                for key in [k for k, job in _full_exports.items() if job.done]:
+                    del _full_exports[key]
+                _full_exports[cache_key] = full_job
+
+    if full_job is not None:
+        note = (
+            "Low-resolution preview. The full image is being exported; request "
+            "the view again without preview, or poll /jobs/{}".format(full_job.job_id)
+        )
+    else:
+        note = "Low-resolution preview. Request the view without preview for the full image"
+
+    preview_options = dict(options, **PREVIEW_OPTIONS)
+    preview_options["pixel_size"] = min(
+        options["pixel_size"], PREVIEW_OPTIONS["pixel_size"]
+    )
+    return export_view_image(
+        doc,
+        view_name,
+        binary=binary,
+        options=preview_options,
+        extra_metadata={
+            "preview": True,
+            "full_job_id": full_job.job_id if full_job else None,
+            "note": note,
+        },
+    )
+
+
+def register_views_routes(api):
+    """Register all view-related routes with the API"""
+
+    @api.route("/get_view/<view_name>", methods=["GET"])
+    def get_view(doc, view_name, request):
+        """
+        Export a named Revit view as a PNG image and return the image data
+
+        Query parameters (all optional):
+            pixel_size: Image width in pixels for zoom_type=fit (default 1024)
+            format: png, jpeg or bmp (default png)
+            resolution: 72, 150, 300 or 600 DPI (default 150)
+            zoom_type: fit (use pixel_size) or zoom (use zoom percent)
+            zoom: Zoom percent for zoom_type=zoom (default 100)
+            region: x0,y0,x1,y1 fractions of the image to crop to
+            preview: true to get a small preview immediately while the full
+                export runs as a job and fills the image cache
+
+        Returns base64 JSON by default; ?transport=binary (or an Accept header
+        asking for an image) returns the raw image with metadata in headers.
+        Exports are cached on disk until the document changes; the ETag can
+        be sent back as If-None-Match to get a bodiless 304.
+        Pass ?async=1 to queue the export as a job and poll /jobs/<job_id>.
+        """
+        params = get_request_params(request)
+        options, error = parse_export_options(params)
+        if error:
+            return routes.make_response(data={"error": error}, status=400)
+
+        binary = wants_binary(request)
+
+        # Cache hits and unchanged images are answered without queueing a job
+        cached = cached_view_image(
+            doc, view_name, options, binary, request_header(request, "If-None-Match")
+        )
+        if cached is not None:
+            return cached
+
+        if str(params.get("preview", "")).lower() in ("1", "true", "yes"):
+            return preview_view_image(doc, view_name, options, binary)
+
+        return run_or_submit(
+            request,
+            "get_view",
+            lambda: export_view_image(doc, view_name, binary=binary, options=options),
+        )
+
+    @api.route("/get_views/", methods=["POST"])
+    def get_views(doc, request):
+        """
+        Export several views, or every sheet, in one ExportImage call
+
+        Expected payload:
+        {
+            "view_names": ["Level 1", "Level 2"],  // or
+            "all_sheets": true, "offset": 0, "limit": 50,
+            "pixel_size": 1024, "format": "png", "resolution": 150,
+            "zoom_type": "fit", "zoom": 100, "region": [0, 0, 1, 1]
+        }
+
+        Images are returned base64 encoded, in request order. all_sheets
+        exports one page of sheets (sorted by number, at most
+        MAX_MULTI_EXPORT); next_offset is the offset of the next page, or
+        null after the last one. Pass ?async=1 to queue the export as a job
+        and poll /jobs/<job_id>.
+        """
+        try:
+            if not doc:
+                return routes.make_response(
+                    data={"error": "No active Revit document"}, status=503
+                )
+
+            data = (
+                json.loads(request.data)
+                if isinstance(request.data, str)
+                else request.data
+            ) or {}
+
+            options, error = parse_export_options(data)
+            if error:
+                return routes.make_response(data={"error": error}, status=400)
+
+            errors = []
+            paging = {}
+            if data.get("all_sheets"):
                 try:
-                    if os.path.exists(exported_file):
-                        os.remove(exported_file)
-                        logger.info("Temporary export file cleaned up")
-                except Exception as e:
-                    logger.warning(
-                        "Could not clean up temporary file: {}".format(str(e))
+                    offset = int(data.get("offset") or 0)
+                    limit = int(data.get("limit") or MAX_MULTI_EXPORT)
+                except (TypeError, ValueError):
+                    return routes.make_response(
+                        data={"error": "offset and limit must be integers"},
+                        status=400,
+                    )
+                if offset < 0 or not 0 < limit <= MAX_MULTI_EXPORT:
+                    return routes.make_response(
+                        data={
+                            "error": "offset must be >= 0 and limit between 1 "
+                            "and {}".format(MAX_MULTI_EXPORT)
+                        },
+                        status=400,
+                    )
+                sheets = [
+                    sheet
+                    for sheet in DB.FilteredElementCollector(doc).OfClass(
+                        DB.ViewSheet
+                    )
+                    if not sheet.IsPlaceholder
+                ]
+                sheets.sort(key=lambda sheet: sheet.SheetNumber)
+                views = sheets[offset : offset + limit]
+                next_offset = offset + limit
+                paging = {
+                    "total": len(sheets),
+                    "offset": offset,
+                    "limit": limit,
+                    "next_offset": next_offset if next_offset < len(sheets) else None,
+                }
+            else:
+                view_names = data.get("view_names") or []
+                if not view_names:
+                    return routes.make_response(
+                        data={"error": "Provide view_names or all_sheets"},
+                        status=400,
                     )
+                by_name = {}
+                for view in DB.FilteredElementCollector(doc).OfClass(DB.View):
+                    by_name.setdefault(get_element_name(view), view)
+                views = []
+                for name in view_names:
+                    view = by_name.get(normalize_string(name))
+                    if view is None:
+                        errors.append(
+                            {"view_name": name, "error": "View not found"}
+                        )
+                    else:
+                        views.append(view)
+
+            exportable = []
+            for view in views:
+                reason = export_error(view)
+                if reason:
+                    errors.append(
+                        {"view_name": get_element_name(view), "error": reason}
+                    )
+                else:
+                    exportable.append(view)
 
-            return routes.make_response(
-                data={
-                    "image_data": encoded_data,
-                    "content_type": "image/png",
-                    "view_name": view_name,
-                    "file_size_bytes": len(img_data),
-                    "export_success": True,
+            if not exportable:
+                return routes.make_response(
+                    data={"error": "No exportable views", "errors": errors},
+                    status=404,
+                )
+            if len(exportable) > MAX_MULTI_EXPORT:
+                return routes.make_response(
+                    data={
+                        "error": "Too many views: {} (max {})".format(
+                            len(exportable), MAX_MULTI_EXPORT
+                        )
+                    },
+                    status=400,
+                )
+
+            def export():
+                images, export_errors = export_view_images(doc, exportable, options)
+                result = {
+                    "status": "success",
+                    "images": images,
+                    "count": len(images),
+                    "errors": errors + export_errors,
                 }
-            )
+                result.update(paging)
+                return routes.make_response(data=result)
+
+            return run_or_submit(request, "get_views", export)
 
         except Exception as e:
-            logger.error("Failed to export view '{}': {}".format(view_name, str(e)))
+            logger.error("Failed to export views: {}".format(str(e)))
             return routes.make_response(
-                data={"error": "Failed to export view: {}".format(str(e))}, status=500
+                data={"error": "Failed to export views: {}".format(str(e))},
+                status=500,
             )
 
     @api.route("/list_views/", methods=["GET"])
-    def list_views(doc):
+    def list_views(doc, request):
         """
         Get a list of all exportable views in the current Revit model
 
+        With ?format=ndjson the same (cached) listing is returned one JSON
+        object per line ({"name": ..., "view_type": ...}) instead, one page
+        at a time (?offset=, ?limit=; see utils.ndjson_paging).
+
         Returns:
             dict: List of view names organized by type
         """
@@ -212,71 +1089,31 @@ def register_views_routes(api):
 
             logger.info("Listing all exportable views")
 
-            # Get all views
-            all_views = DB.FilteredElementCollector(doc).OfClass(DB.View).ToElements()
-
-            views_by_type = {
-                "floor_plans": [],
-                "ceiling_plans": [],
-                "elevations": [],
-                "sections": [],
-                "3d_views": [],
-                "drafting_views": [],
-                "schedules": [],
-                "other": [],
-            }
+            result = result_cache.get(doc, "/list_views/")
+            if result is None:
+                result = _list_exportable_views(doc)
+                result_cache.put(doc, "/list_views/", result)
 
-            for view in all_views:
+            if wants_ndjson(request):
                 try:
-                    # Skip templates and internal views
-                    if hasattr(view, "IsTemplate") and view.IsTemplate:
-                        continue
-
-                    if (
-                        view.ViewType == DB.ViewType.Internal
-                        or view.ViewType == DB.ViewType.ProjectBrowser
-                    ):
-                        continue
-
-                    view_name = get_element_name(view)
-                    view_type = view.ViewType
-
-                    # Categorize views
-                    if view_type == DB.ViewType.FloorPlan:
-                        views_by_type["floor_plans"].append(view_name)
-                    elif view_type == DB.ViewType.CeilingPlan:
-                        views_by_type["ceiling_plans"].append(view_name)
-                    elif view_type == DB.ViewType.Elevation:
-                        views_by_type["elevations"].append(view_name)
-                    elif view_type == DB.ViewType.Section:
-                        views_by_type["sections"].append(view_name)
-                    elif view_type == DB.ViewType.ThreeD:
-                        views_by_type["3d_views"].append(view_name)
-                    elif view_type == DB.ViewType.DraftingView:
-                        views_by_type["drafting_views"].append(view_name)
-                    elif view_type == DB.ViewType.Schedule:
-                        views_by_type["schedules"].append(view_name)
-                    else:
-                        views_by_type["other"].append(view_name)
-
-                except Exception as e:
-                    logger.warning("Could not process view: {}".format(str(e)))
-                    continue
-
-            # Sort all lists alphabetically
-            for view_list in views_by_type.values():
-                view_list.sort()
-
-            # Count total exportable views
-            total_views = sum(len(view_list) for view_list in views_by_type.values())
+                    offset, limit = ndjson_paging(get_request_params(request))
+                except (TypeError, ValueError) as param_error:
+                    return routes.make_response(
+                        data={"error": "Invalid paging parameter: {}".format(param_error)},
+                        status=400,
+                    )
+                # Rows come from the cached listing, grouped by view type
+                return ndjson_page(
+                    (
+                        {"name": view_name, "view_type": view_type}
+                        for view_type, view_names in result["views_by_type"].items()
+                        for view_name in view_names
+                    ),
+                    offset,
+                    limit,
+                )
 
-            return routes.make_response(
-                data={
-                    "views_by_type": views_by_type,
-                    "total_exportable_views": total_views,
-                    "status": "success",
-                }
-            )
+            return routes.make_response(data=result)
 
         except Exception as e:
             logger.error("Failed to list views: {}".format(str(e)))
@@ -369,16 +1206,27 @@ def register_views_routes(api):
             )
 
     @api.route("/current_view_elements/", methods=["GET"])
-    def get_current_view_elements(doc, uidoc):
+    def get_current_view_elements(doc, uidoc, request):
         """
-        Get all elements visible in the current view.
+        Get elements visible in the current view, one page at a time.
+
+        Query parameters (all optional):
+            category: Category name, or comma-separated names, to filter by
+            limit: Maximum number of elements to return (default: all; with
+                format=ndjson NDJSON_PAGE_SIZE, at most NDJSON_MAX_PAGE_SIZE)
+            offset: Number of elements to skip, in element id order
+            cursor: next_cursor from a previous page; takes precedence over offset
+            include_summary: "false" to skip the per-category counts
+            format: "ndjson" to return one element per line instead, with
+                the offset of the next page in the X-Next-Offset header
 
         Args:
             doc: Revit document (provided by MCP context)
             uidoc: UIDocument (provided by MCP context)
+            request: Request carrying the query parameters
 
         Returns:
-            dict: List of elements with detailed information
+            dict: Page of elements with paging information and summary counts
         """
         try:
             if not doc or not uidoc:
@@ -392,88 +1240,95 @@ def register_views_routes(api):
                     data={"error": "No active view found"}, status=404
                 )
 
-            logger.info("Getting elements in current view")
+            params = get_request_params(request)
+            try:
+                offset = max(0, int(params.get("offset") or 0))
+                limit = params.get("limit")
+                limit = int(limit) if limit not in (None, "") else None
+                if limit is not None and limit < 1:
+                    raise ValueError("limit must be a positive integer")
+                cursor = params.get("cursor")
+                cursor = int(cursor) if cursor not in (None, "") else None
+            except (ValueError, TypeError) as param_error:
+                return routes.make_response(
+                    data={"error": "Invalid paging parameter: {}".format(param_error)},
+                    status=400,
+                )
+            include_summary = str(params.get("include_summary", "true")).lower() not in (
+                "false",
+                "0",
+                "no",
+            )
 
-            # Get all elements in the current view
-            collector = DB.FilteredElementCollector(doc, current_view.Id)
-            elements = collector.WhereElementIsNotElementType().ToElements()
+            category_filter = None
+            category_names = [
+                name.strip()
+                for name in (params.get("category") or "").split(",")
+                if name.strip()
+            ]
+            if category_names:
+                category_ids, missing = _resolve_category_ids(doc, category_names)
+                if missing:
+                    return routes.make_response(
+                        data={
+                            "error": "Category not found: {}".format(
+                                ", ".join(missing)
+                            )
+                        },
+                        status=404,
+                    )
+                category_filter = _category_filter(category_ids)
 
-            # Process elements to get basic information
-            elements_info = []
-            for elem in elements:
-                try:
-                    element_info = {
-                        "element_id": elem.Id.IntegerValue,
-                        "name": get_element_name(elem),
-                        "element_type": elem.GetType().Name,
-                    }
-
-                    # Add category information
-                    if elem.Category:
-                        element_info["category"] = elem.Category.Name
-                        element_info["category_id"] = elem.Category.Id.IntegerValue
-                    else:
-                        element_info["category"] = "Unknown"
-                        element_info["category_id"] = None
+            logger.info("Getting elements in current view")
 
-                    # Add level information if available
-                    try:
-                        level_param = elem.get_Parameter(
-                            DB.BuiltInParameter.FAMILY_LEVEL_PARAM
+            def view_collector():
+                collector = DB.FilteredElementCollector(
+                    doc, current_view.Id
+                ).WhereElementIsNotElementType()
+                if category_filter is not None:
+                    collector = collector.WherePasses(category_filter)
+                return collector
+
+            # Page over sorted ids so only the requested elements are expanded
+            element_ids = sorted(
+                element_id.IntegerValue
+                for element_id in view_collector().ToElementIds()
+            )
+            total_elements = len(element_ids)
+
+            if cursor is not None:
+                start = bisect.bisect_right(element_ids, cursor)
+            else:
+                start = min(offset, total_elements)
+            if wants_ndjson(request):
+                # The NDJSON body is built whole, so it is always paged
+                limit = min(limit or NDJSON_PAGE_SIZE, NDJSON_MAX_PAGE_SIZE)
+            stop = total_elements if limit is None else min(start + limit, total_elements)
+            page_ids = element_ids[start:stop]
+
+            if wants_ndjson(request):
+                return ndjson_response(
+                    (
+                        element_info
+                        for element_info in (
+                            _element_info(doc, doc.GetElement(DB.ElementId(element_id)))
+                            for element_id in page_ids
                         )
-                        if level_param:
-                            level_id = level_param.AsElementId()
-                            if level_id != DB.ElementId.InvalidElementId:
-                                level_elem = doc.GetElement(level_id)
-                                element_info["level"] = get_element_name(level_elem)
-                                element_info["level_id"] = level_id.IntegerValue
-                            else:
-                                element_info["level"] = None
-                                element_info["level_id"] = None
-                        else:
-                            element_info["level"] = None
-                            element_info["level_id"] = None
-                    except Exception:
-                        element_info["level"] = None
-                        element_info["level_id"] = None
-
-                    # Add location information if available
-                    try:
-                        location = elem.Location
-                        if hasattr(location, "Point"):
-                            pt = location.Point
-                            element_info["location"] = {
-                                "type": "point",
-                                "x": pt.X,
-                                "y": pt.Y,
-                                "z": pt.Z,
-                            }
-                        elif hasattr(location, "Curve"):
-                            curve = location.Curve
-                            start = curve.GetEndPoint(0)
-                            end = curve.GetEndPoint(1)
-                            element_info["location"] = {
-                                "type": "curve",
-                                "start": {"x": start.X, "y": start.Y, "z": start.Z},
-                                "end": {"x": end.X, "y": end.Y, "z": end.Z},
-                            }
-                        else:
-                            element_info["location"] = {"type": "unknown"}
-                    except Exception:
-                        element_info["location"] = {"type": "unknown"}
-
-                    elements_info.append(element_info)
+                        if element_info is not None
+                    ),
+                    next_offset=stop if stop < total_elements else None,
+                )
 
-                except Exception as elem_error:
-                    # Skip elements that cause errors but log the issue
-                    logger.warning(
-                        "Could not process element {}: {}".format(
-                            elem.Id.IntegerValue if elem else "Unknown", str(elem_error)
-                        )
-                    )
+            elements_info = []
+            for element_id in page_ids:
+                elem = doc.GetElement(DB.ElementId(element_id))
+                if elem is None:
                     continue
+                element_info = _element_info(doc, elem)
+                if element_info is not None:
+                    elements_info.append(element_info)
 
-            # Group elements by category for easier analysis
+            # Group the page by category for easier analysis
             elements_by_category = {}
             for elem_info in elements_info:
                 category = elem_info["category"]
@@ -481,22 +1336,30 @@ def register_views_routes(api):
                     elements_by_category[category] = []
                 elements_by_category[category].append(elem_info)
 
-            # Create summary statistics
-            category_counts = {
-                category: len(elements)
-                for category, elements in elements_by_category.items()
-            }
-
+            has_more = stop < total_elements
             result = {
                 "status": "success",
                 "view_name": get_element_name(current_view),
                 "view_id": current_view.Id.IntegerValue,
-                "total_elements": len(elements_info),
+                "total_elements": total_elements,
+                "returned_elements": len(elements_info),
+                "offset": start,
+                "limit": limit,
+                "has_more": has_more,
+                "next_offset": stop if has_more else None,
+                "next_cursor": str(page_ids[-1]) if has_more and page_ids else None,
                 "elements": elements_info,
                 "elements_by_category": elements_by_category,
-                "category_counts": category_counts,
             }
 
+            # Summary statistics cover every matching element, not just this page
+            if include_summary:
+                category_counts = {}
+                for elem in view_collector():
+                    category = elem.Category.Name if elem.Category else "Unknown"
+                    category_counts[category] = category_counts.get(category, 0) + 1
+                result["category_counts"] = category_counts
+
             return routes.make_response(data=result)
 
         except Exception as e:
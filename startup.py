@@ -9,8 +9,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Initialize the main API
-api = routes.API("revit_mcp")
+from revit_mcp.batch import RouteRegistry
+
+# Initialize the main API; the registry records handlers for the /batch/ route
+api = RouteRegistry(routes.API("revit_mcp"))
 
 
 def register_routes():
@@ -41,6 +43,18 @@ def register_routes():
 
         register_code_execution_routes(api)
 
+        from revit_mcp.query import register_query_routes
+
+        register_query_routes(api)
+
+        from revit_mcp.jobs import register_job_routes
+
+        register_job_routes(api)
+
+        from revit_mcp.batch import register_batch_routes
+
+        register_batch_routes(api)
+
         logger.info("All MCP routes registered successfully")
 
     except Exception as e:
@@ -48,5 +62,42 @@ def register_routes():
         raise
 
 
+def bind_document_events():
+    """Clear cached route results whenever a document changes or closes"""
+    try:
+        from pyrevit import HOST_APP
+        from revit_mcp.cache import result_cache
+
+        result_cache.bind(HOST_APP.app)
+    except Exception as e:
+        logger.warning("Could not bind document events, caching disabled: %s", str(e))
+        from revit_mcp.cache import result_cache
+
+        result_cache.disable_all()
+
+
+def cleanup_export_files():
+    """Remove image export leftovers from earlier sessions"""
+    try:
+        from revit_mcp.views import cleanup_exports
+
+        cleanup_exports()
+    except Exception as e:
+        logger.warning("Could not clean up export files: %s", str(e))
+
+
+def attach_job_events():
+    """Create the ExternalEvent that runs ?async=1 jobs"""
+    try:
+        from revit_mcp.jobs import job_manager
+
+        job_manager.attach()
+    except Exception as e:
+        logger.warning("Could not attach job events, ?async=1 runs inline: %s", str(e))
+
+
 # Register all routes when the extension loads
 register_routes()
+bind_document_events()
+attach_job_events()
+cleanup_export_files()
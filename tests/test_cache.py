@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Invalidation tests for revit_mcp/cache.py driven by a fake event source
+
+cache.py has no Revit imports, so it runs on plain CPython. FakeApplication
+stands in for the Revit Application: handlers are attached with += like
+.NET events and raise_changed/raise_closing fire them with argument
+objects that expose GetDocument() as DocumentChanged/DocumentClosing do.
+
+    python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "revit_mcp")
+)
+
+from cache import ResultCache  # noqa: E402
+
+
+class FakeEvent(object):
+    """Minimal .NET-style event supporting += and -="""
+
+    def __init__(self):
+        self.handlers = []
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        self.handlers.remove(handler)
+        return self
+
+    def fire(self, sender, args):
+        for handler in list(self.handlers):
+            handler(sender, args)
+
+
+class FakeDocument(object):
+    def __init__(self, hash_code):
+        self.hash_code = hash_code
+
+    def GetHashCode(self):
+        return self.hash_code
+
+
+class FakeEventArgs(object):
+    def __init__(self, doc, modified=()):
+        self.doc = doc
+        self.modified = list(modified)
+
+    def GetDocument(self):
+        return self.doc
+
+
+class FakeApplication(object):
+    def __init__(self):
+        self.DocumentChanged = FakeEvent()
+        self.DocumentClosing = FakeEvent()
+
+    def raise_changed(self, doc, modified=()):
+        self.DocumentChanged.fire(self, FakeEventArgs(doc, modified))
+
+    def raise_closing(self, doc):
+        self.DocumentClosing.fire(self, FakeEventArgs(doc))
+
+
+class ResultCacheInvalidationTest(unittest.TestCase):
+    def setUp(self):
+        self.app = FakeApplication()
+        self.cache = ResultCache(max_entries=4, routes=("/list_levels/", "/list_views/"))
+        self.cache.bind(self.app)
+        self.doc = FakeDocument(1)
+        self.other_doc = FakeDocument(2)
+
+    def test_document_changed_drops_only_that_document(self):
+        self.cache.put(self.doc, "/list_levels/", {"levels": 1})
+        self.cache.put(self.other_doc, "/list_levels/", {"levels": 2})
+
+        self.app.raise_changed(self.doc)
+
+        self.assertIsNone(self.cache.get(self.doc, "/list_levels/"))
+        self.assertEqual(self.cache.get(self.other_doc, "/list_levels/"), {"levels": 2})
+
+    def test_document_changed_bumps_version(self):
+        self.assertEqual(self.cache.document_version(self.doc), 0)
+        self.app.raise_changed(self.doc)
+        self.app.raise_changed(self.doc)
+        self.assertEqual(self.cache.document_version(self.doc), 2)
+        self.assertEqual(self.cache.document_version(self.other_doc), 0)
+
+    def test_document_closing_drops_entries_and_bumps_version(self):
+        self.cache.put(self.doc, "/list_views/", ["Level 1"])
+        self.app.raise_closing(self.doc)
+        self.assertIsNone(self.cache.get(self.doc, "/list_views/"))
+        self.assertEqual(self.cache.document_version(self.doc), 1)
+
+    def test_change_filter_keeps_unaffected_entries(self):
+        self.cache.set_change_filter(
+            "/list_levels/", lambda change, value: value["id"] in change.modified
+        )
+        self.cache.put(self.doc, "/list_levels/", {"id": 7})
+        self.cache.put(self.doc, "/list_views/", ["Level 1"])
+
+        self.app.raise_changed(self.doc, modified=[8])
+        self.assertEqual(self.cache.get(self.doc, "/list_levels/"), {"id": 7})
+        # Routes without a filter are dropped on every change
+        self.assertIsNone(self.cache.get(self.doc, "/list_views/"))
+
+        self.app.raise_changed(self.doc, modified=[7])
+        self.assertIsNone(self.cache.get(self.doc, "/list_levels/"))
+
+    def test_change_without_document_clears_everything(self):
+        self.cache.put(self.other_doc, "/list_levels/", {"levels": 2})
+        # Arguments that carry no document clear every entry
+        self.app.DocumentChanged.fire(self.app, object())
+        self.assertIsNone(self.cache.get(self.other_doc, "/list_levels/"))
+
+    def test_unbind_stops_invalidation(self):
+        self.cache.put(self.doc, "/list_levels/", {"levels": 1})
+        self.cache.unbind()
+        self.assertFalse(self.cache.bound)
+        self.assertEqual(self.app.DocumentChanged.handlers, [])
+
+        self.app.raise_changed(self.doc)
+        self.assertEqual(self.cache.get(self.doc, "/list_levels/"), {"levels": 1})
+
+    def test_route_arguments_are_part_of_the_key(self):
+        self.cache.put(self.doc, "/list_views/", ["a"], args={"contains": "a"})
+        self.assertIsNone(self.cache.get(self.doc, "/list_views/", {"contains": "b"}))
+        self.assertEqual(
+            self.cache.get(self.doc, "/list_views/", {"contains": "a"}), ["a"]
+        )
+
+    def test_routes_must_opt_in(self):
+        self.cache.put(self.doc, "/model_info/", {"x": 1})
+        self.assertIsNone(self.cache.get(self.doc, "/model_info/"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        for i in range(4):
+            self.cache.put(self.doc, "/list_views/", i, args={"i": i})
+        # Touch the oldest entry so the second one becomes least recently used
+        self.assertEqual(self.cache.get(self.doc, "/list_views/", {"i": 0}), 0)
+        self.cache.put(self.doc, "/list_views/", 4, args={"i": 4})
+
+        self.assertIsNone(self.cache.get(self.doc, "/list_views/", {"i": 1}))
+        self.assertEqual(self.cache.get(self.doc, "/list_views/", {"i": 0}), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,14 @@
 """Tool registration system for Revit MCP Server"""
 
 
-def register_tools(mcp_server, revit_get_func, revit_post_func, revit_image_func):
+def register_tools(
+    mcp_server,
+    revit_get_func,
+    revit_post_func,
+    revit_image_func,
+    revit_batch_func,
+    revit_stream_func,
+):
     """Register all tools with the MCP server"""
     # Import all tool modules
     from .status_tools import register_status_tools
@@ -11,13 +18,17 @@ def register_tools(mcp_server, revit_get_func, revit_post_func, revit_image_func
     from .model_tools import register_model_tools
     from .colors_tools import register_colors_tools
     from .code_execution_tools import register_code_execution_tools
+    from .query_tools import register_query_tools
 
     # Register tools from each module
-    register_status_tools(mcp_server, revit_get_func)
-    register_view_tools(mcp_server, revit_get_func, revit_post_func, revit_image_func)
-    register_family_tools(mcp_server, revit_get_func, revit_post_func)
+    register_status_tools(mcp_server, revit_get_func, revit_batch_func)
+    register_view_tools(
+        mcp_server, revit_get_func, revit_post_func, revit_image_func, revit_stream_func
+    )
+    register_family_tools(mcp_server, revit_get_func, revit_post_func, revit_stream_func)
     register_model_tools(mcp_server, revit_get_func)
     register_colors_tools(mcp_server, revit_get_func, revit_post_func)
     register_code_execution_tools(
         mcp_server, revit_get_func, revit_post_func, revit_image_func
     )
+    register_query_tools(mcp_server, revit_post_func)
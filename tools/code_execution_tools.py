@@ -12,7 +12,17 @@ def register_code_execution_tools(mcp, revit_get, revit_post, revit_image=None):
 
     @mcp.tool()
     async def execute_revit_code(
-        code: str, description: str = "Code execution", ctx: Context = None
+        code: str,
+        description: str = "Code execution",
+        session: str = None,
+        reset_session: bool = False,
+        transaction_mode: str = "always",
+        stream: bool = False,
+        max_output: int = None,
+        abort_on_output_limit: bool = False,
+        max_seconds: float = None,
+        max_iterations: int = None,
+        ctx: Context = None,
     ) -> str:
         """
         Execute IronPython code directly in Revit context.
@@ -23,12 +33,49 @@ def register_code_execution_tools(mcp, revit_get, revit_post, revit_image=None):
         - DB: Revit API Database namespace
         - revit: pyRevit module
         - print: Function to output text (returned in response)
+        - iterate(items): Yields items, counting them against the iteration budget
+        - check_budget(): Stops the script if it is over its time budget
 
         Use this when the existing MCP tools cannot accomplish what you need.
 
+        Pass a session name to keep imports, helper functions and variables
+        between calls: later calls with the same session can use them without
+        redefining them. Sessions expire after 30 idle minutes, and are
+        cleared after a run that leaves more than 500 names or roughly 64 MB
+        of Python data in them, so keep large results out of session variables.
+
+        By default the code runs inside a transaction that is committed when it
+        succeeds. Use transaction_mode "read_only" for pure queries (no
+        transaction; any model edit fails), or "auto" to keep the transaction
+        only if the code actually changed the model, so queries leave nothing
+        in the undo history.
+
+        Set stream=True for long-running scripts: printed output is relayed as
+        log messages while the code runs instead of only at the end. Printed
+        output beyond max_output characters (default 200000) is dropped and
+        the result is marked as truncated.
+
+        Each run has a budget: max_seconds of wall-clock time (default 300) and
+        max_iterations items taken through iterate() (default 1000000). With
+        abort_on_output_limit, exceeding max_output also counts as going over
+        budget. Revit cannot interrupt a script, so the budget is checked
+        whenever the script prints, iterates with iterate() or calls
+        check_budget(); loop over elements with iterate(collector) and call
+        check_budget() in long loops. A script over budget is stopped and its
+        changes are rolled back. The response reports elapsed time, iterations
+        and peak output size under "budget".
+
         Args:
             code: The IronPython code to execute (as a string)
             description: Optional description of what the code does
+            session: Optional session name whose namespace persists across calls
+            reset_session: Clear the named session before running the code
+            transaction_mode: "always" (default), "auto" or "read_only"
+            stream: Relay printed output while the code is running
+            max_output: Maximum characters of printed output to keep
+            abort_on_output_limit: Stop and roll back instead of truncating output
+            max_seconds: Wall-clock budget in seconds
+            max_iterations: Budget for items taken through iterate()
             ctx: MCP context for logging
 
         Returns:
@@ -50,12 +97,28 @@ def register_code_execution_tools(mcp, revit_get, revit_post, revit_image=None):
                     '''
         """
         try:
-            payload = {"code": code, "description": description}
+            payload = {
+                "code": code,
+                "description": description,
+                "transaction_mode": transaction_mode,
+                "stream": stream,
+            }
+            if max_output:
+                payload["max_output"] = max_output
+            if abort_on_output_limit:
+                payload["abort_on_output_limit"] = True
+            if max_seconds is not None:
+                payload["max_seconds"] = max_seconds
+            if max_iterations is not None:
+                payload["max_iterations"] = max_iterations
+            if session:
+                payload["session"] = session
+                payload["reset_session"] = reset_session
 
             if ctx:
                 ctx.info("Executing code: {}".format(description))
 
-            response = await revit_post("/execute_code/", payload, ctx)
+            response = await revit_post("/execute_code/", payload, ctx, background=True)
             return format_response(response)
 
         except (ConnectionError, ValueError, RuntimeError) as e:
@@ -15,6 +15,8 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
         parameter_name: str,
         use_gradient: bool = False,
         custom_colors: Optional[List[str]] = None,
+        apply_to: str = "same_view_type",
+        view_ids: Optional[List[int]] = None,
         ctx: Context = None,
     ) -> str:
         """
@@ -29,6 +31,9 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
             parameter_name: Name of the parameter to use for coloring (e.g., "Mark", "Type Name")
             use_gradient: Whether to use gradient coloring instead of distinct colors (default: False)
             custom_colors: Optional list of custom colors in hex format (e.g., ["#FF0000", "#00FF00"])
+            apply_to: Views to color: "active_view" or "same_view_type" (default, the active
+                view plus every other view of the same type)
+            view_ids: Explicit list of view ids to color; overrides apply_to
             ctx: MCP context for logging
 
         Returns:
@@ -43,13 +48,14 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
 
             if custom_colors:
                 data["custom_colors"] = custom_colors
+            data["apply_to"] = view_ids if view_ids else apply_to
 
             ctx.info(
                 "Color splashing {} elements by {}".format(
                     category_name, parameter_name
                 )
             )
-            response = await revit_post("/color_splash/", data, ctx)
+            response = await revit_post("/color_splash/", data, ctx, background=True)
             return format_response(response)
 
         except Exception as e:
@@ -58,7 +64,12 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
             return error_msg
 
     @mcp.tool()
-    async def clear_colors(category_name: str, ctx: Context = None) -> str:
+    async def clear_colors(
+        category_name: str,
+        apply_to: str = "same_view_type",
+        view_ids: Optional[List[int]] = None,
+        ctx: Context = None,
+    ) -> str:
         """
         Clear color overrides for elements in a category
 
@@ -67,16 +78,21 @@ def register_colors_tools(mcp, revit_get, revit_post, revit_image=None):
 
         Args:
             category_name: Name of the category to clear colors from (e.g., "Walls", "Doors")
+            apply_to: Views to clear: "active_view" or "same_view_type" (default)
+            view_ids: Explicit list of view ids to clear; overrides apply_to
             ctx: MCP context for logging
 
         Returns:
             Results of the clear operation including count of elements processed
         """
         try:
-            data = {"category_name": category_name}
+            data = {
+                "category_name": category_name,
+                "apply_to": view_ids if view_ids else apply_to,
+            }
 
             ctx.info("Clearing color overrides for {} elements".format(category_name))
-            response = await revit_post("/clear_colors/", data, ctx)
+            response = await revit_post("/clear_colors/", data, ctx, background=True)
             return format_response(response)
 
         except Exception as e:
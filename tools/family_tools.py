@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 """Family and placement tools"""
 
+import json
+from contextlib import aclosing
+
 from mcp.server.fastmcp import Context
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from .utils import format_response
 
 
-def register_family_tools(mcp, revit_get, revit_post):
+def register_family_tools(mcp, revit_get, revit_post, revit_stream):
     """Register family-related tools"""
 
     @mcp.tool()
@@ -33,19 +36,108 @@ def register_family_tools(mcp, revit_get, revit_post):
         response = await revit_post("/place_family/", data, ctx)
         return format_response(response)
 
+    @mcp.tool()
+    async def place_families(
+        placements: List[Dict[str, Any]],
+        chunk_size: int = 0,
+        ctx: Context = None,
+    ) -> str:
+        """
+        Place many family instances in one request
+
+        Each placement takes the same fields as place_family, with the
+        coordinates nested as "location": {"x": ..., "y": ..., "z": ...}.
+        Much faster than calling place_family repeatedly. chunk_size sets
+        how many instances share a transaction (0 = all in one). Keeping
+        placements of the same type and level together, without rotation or
+        properties, lets Revit create them in a single batch call.
+        """
+        data = {"placements": placements, "chunk_size": chunk_size}
+        response = await revit_post("/place_families/", data, ctx)
+        if isinstance(response, dict) and "results" in response:
+            return json.dumps(response, indent=2)
+        return format_response(response)
+
+    @mcp.tool()
+    async def place_family_array(
+        family_name: str,
+        columns: int,
+        rows: int = 1,
+        spacing_x: float = 0.0,
+        spacing_y: float = 0.0,
+        x: float = 0.0,
+        y: float = 0.0,
+        z: float = 0.0,
+        rotation: float = 0.0,
+        type_name: str = None,
+        level_name: str = None,
+        boundary: Optional[List[Dict[str, float]]] = None,
+        properties: Dict[str, Any] = None,
+        ctx: Context = None,
+    ) -> str:
+        """
+        Place a family in a rectangular grid (desks, parking stalls, columns)
+
+        The grid starts at (x, y, z) and runs columns along X and rows along
+        Y, spaced in feet, then is rotated by `rotation` degrees about the
+        origin. Pass a boundary polygon as [{"x": ..., "y": ...}, ...] to
+        keep only the points inside it. The points are generated in Revit,
+        so large grids cost a single small request.
+        """
+        data = {
+            "family_name": family_name,
+            "type_name": type_name,
+            "level_name": level_name,
+            "origin": {"x": x, "y": y, "z": z},
+            "counts": {"x": columns, "y": rows},
+            "spacing": {"x": spacing_x, "y": spacing_y},
+            "rotation": rotation,
+            "boundary": boundary,
+            "properties": properties or {},
+        }
+        response = await revit_post("/place_family_array/", data, ctx)
+        if not isinstance(response, dict) or "results" not in response:
+            return format_response(response)
+
+        # Summarise instead of echoing one entry per instance
+        results = response.pop("results")
+        response["element_ids"] = [
+            r["element_id"] for r in results if r.get("status") == "success"
+        ]
+        response["errors"] = [
+            {"index": r["index"], "error": r.get("error")}
+            for r in results
+            if r.get("status") != "success"
+        ]
+        return json.dumps(response, indent=2)
+
     @mcp.tool()
     async def list_families(
         contains: str = None, limit: int = 50, ctx: Context = None
     ) -> str:
         """Get a flat list of available family types in the current Revit model"""
-        params = {}
+        # Ask for one extra row so truncation can be reported
+        params = {"limit": str(limit + 1)}
         if contains:
             params["contains"] = contains
-        if limit != 50:
-            params["limit"] = str(limit)
 
-        result = await revit_get("/list_families/", ctx, params=params)
-        return format_response(result)
+        # Read the listing page by page and stop as soon as `limit` matches are in
+        families = []
+        truncated = False
+        try:
+            async with aclosing(revit_stream("/list_families/", ctx, params=params)) as rows:
+                async for family in rows:
+                    if len(families) >= limit:
+                        truncated = True
+                        break
+                    families.append(family)
+        except Exception as e:
+            return "Error listing families: {}".format(str(e))
+
+        return json.dumps(
+            {"families": families, "count": len(families), "truncated": truncated},
+            indent=2,
+        )
 
     @mcp.tool()
     async def list_family_categories(ctx: Context = None) -> str:
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Structured element query tools"""
+
+import json
+
+from mcp.server.fastmcp import Context
+from typing import Dict, Any, List
+from .utils import format_response
+
+
+def register_query_tools(mcp, revit_post):
+    """Register element query tools"""
+
+    @mcp.tool()
+    async def query_elements(
+        categories: List[str] = None,
+        classes: List[str] = None,
+        level: str = None,
+        view: str = None,
+        bounding_box: Dict[str, Any] = None,
+        where: List[Dict[str, Any]] = None,
+        fields: List[str] = None,
+        element_types: bool = False,
+        limit: int = 100,
+        offset: int = 0,
+        ctx: Context = None,
+    ) -> str:
+        """
+        Find elements with a declarative filter and return selected fields.
+
+        Filtering runs in Revit's native filter layer, so this is much faster
+        and safer than writing IronPython for the same question. For example,
+        all doors on Level 2 with Fire Rating 60:
+            categories=["Doors"], level="Level 2",
+            where=[{"parameter": "Fire Rating", "op": "equals", "value": "60"}],
+            fields=["id", "name", "type", "Fire Rating"]
+
+        Args:
+            categories: Category names (e.g. "Doors", "OST_Walls")
+            classes: Revit API class names (e.g. "Wall", "FamilyInstance")
+            level: Level name the elements belong to
+            view: Only return elements visible in this view
+            bounding_box: {"min": {"x","y","z"}, "max": {"x","y","z"}, "inside": false}
+                in feet; elements intersecting it, or fully inside with inside=true
+            where: Parameter predicates {"parameter", "op", "value"}; op is one of
+                equals, not_equals, greater, greater_or_equal, less, less_or_equal,
+                contains, not_contains, begins_with, ends_with, has_value,
+                has_no_value. Parameters are found on the element or its type, by
+                name or BuiltInParameter name. Numbers use Revit internal units.
+            fields: Fields to return: id, unique_id, name, category, class, type,
+                family, level, location, or any parameter name (default id, name,
+                category)
+            element_types: Query element types instead of instances
+            limit: Maximum number of elements to return (max 2000)
+            offset: Number of matching elements to skip, in element id order
+            ctx: MCP context for logging
+
+        Returns:
+            JSON with the total match count, paging information and the elements
+        """
+        data = {
+            "categories": categories,
+            "classes": classes,
+            "level": level,
+            "view": view,
+            "bounding_box": bounding_box,
+            "where": where,
+            "fields": fields,
+            "element_types": element_types,
+            "limit": limit,
+            "offset": offset,
+        }
+        data = {key: value for key, value in data.items() if value not in (None, [])}
+
+        response = await revit_post("/query/", data, ctx)
+        if not isinstance(response, dict) or "elements" not in response:
+            return format_response(response)
+        return json.dumps(response, indent=2)
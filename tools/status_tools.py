@@ -1,11 +1,21 @@
 # -*- coding: utf-8 -*-
 """Status and model information tools"""
 
+import json
+
 from mcp.server.fastmcp import Context
 from .utils import format_response
 
+# Read-only checks an agent typically runs when it first connects
+OVERVIEW_REQUESTS = [
+    {"endpoint": "/status/", "method": "GET"},
+    {"endpoint": "/model_info/", "method": "GET"},
+    {"endpoint": "/list_levels/", "method": "GET"},
+    {"endpoint": "/list_views/", "method": "GET"},
+]
+
 
-def register_status_tools(mcp, revit_get):
+def register_status_tools(mcp, revit_get, revit_batch):
     """Register status-related tools"""
 
     @mcp.tool()
@@ -19,3 +29,24 @@ def register_status_tools(mcp, revit_get):
         """Get comprehensive information about the current Revit model"""
         response = await revit_get("/model_info/", ctx)
         return format_response(response)
+
+    @mcp.tool()
+    async def get_revit_overview(ctx: Context) -> str:
+        """
+        Get status, model info, levels and views in a single Revit round-trip
+
+        Use this instead of calling get_revit_status, get_revit_model_info,
+        list_levels and list_revit_views one after another.
+        """
+        response = await revit_batch(OVERVIEW_REQUESTS, ctx)
+        if not isinstance(response, dict) or "results" not in response:
+            return format_response(response)
+
+        sections = []
+        for result in response["results"]:
+            sections.append("=== {} ===".format(result["endpoint"]))
+            if result["status"] < 400:
+                sections.append(json.dumps(result["data"], indent=2))
+            else:
+                sections.append(format_response(result["data"]))
+        return "\n".join(sections)
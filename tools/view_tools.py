@@ -1,25 +1,183 @@
 # -*- coding: utf-8 -*-
 """View-related tools for capturing and listing Revit views"""
 
-from mcp.server.fastmcp import Context
+import base64
+import json
+from contextlib import aclosing
+
+from mcp.server.fastmcp import Context, Image
+from typing import List, Optional, Union
 from .utils import format_response
 
 
-def register_view_tools(mcp, revit_get, revit_post, revit_image):
+def register_view_tools(mcp, revit_get, revit_post, revit_image, revit_stream):
     """Register view-related tools"""
 
     @mcp.tool()
-    async def get_revit_view(view_name: str, ctx: Context = None) -> str:
-        """Export a specific Revit view as an image"""
-        response = await revit_image(f"/get_view/{view_name}", ctx)
-        # Note: revit_image already returns a formatted response (Image object or error string)
-        return str(response) if not isinstance(response, str) else response
+    async def get_revit_view(
+        view_name: str,
+        pixel_size: int = 1024,
+        image_format: str = "png",
+        resolution: int = 150,
+        zoom_type: str = "fit",
+        zoom: int = 100,
+        region: Optional[List[float]] = None,
+        preview: bool = False,
+        ctx: Context = None,
+    ) -> Union[Image, str, List[Union[Image, str]]]:
+        """
+        Export a specific Revit view as an image
+
+        Smaller images export and transfer faster: a 512 px JPEG is usually
+        enough to inspect a view, while QA checks may need a 4096 px PNG.
+
+        Args:
+            view_name: Name of the view to export
+            pixel_size: Image width in pixels, 64-8192 (used with zoom_type "fit")
+            image_format: "png", "jpeg" or "bmp"
+            resolution: 72, 150, 300 or 600 DPI
+            zoom_type: "fit" to size the image by pixel_size, or "zoom" to use zoom
+            zoom: Zoom percentage, 1-100 (used with zoom_type "zoom")
+            region: Optional [x0, y0, x1, y1] crop, as fractions (0-1) of the image
+            preview: Return a small preview right away while the full image is
+                exported in the background; call again without preview to get it
+            ctx: MCP context for logging
+        """
+        params = {
+            "pixel_size": pixel_size,
+            "format": image_format,
+            "resolution": resolution,
+            "zoom_type": zoom_type,
+            "zoom": zoom,
+        }
+        if region:
+            params["region"] = ",".join(str(value) for value in region)
+        if preview:
+            params["preview"] = "true"
+
+        # revit_image returns an Image, or an error string; previews are
+        # answered immediately so they skip the background job
+        info = {}
+        image = await revit_image(
+            f"/get_view/{view_name}",
+            ctx,
+            background=not preview,
+            params=params,
+            info=info,
+        )
+        if info.get("note"):
+            return [image, info["note"]]
+        return image
 
     @mcp.tool()
-    async def list_revit_views(ctx: Context = None) -> str:
-        """Get a list of all exportable views in the current Revit model"""
-        response = await revit_get("/list_views/", ctx)
-        return format_response(response)
+    async def get_revit_views(
+        view_names: Optional[List[str]] = None,
+        all_sheets: bool = False,
+        offset: int = 0,
+        pixel_size: int = 1024,
+        image_format: str = "png",
+        resolution: int = 150,
+        ctx: Context = None,
+    ) -> List[Union[Image, str]]:
+        """
+        Export several Revit views, or every sheet, as images in one call
+
+        Much faster than calling get_revit_view once per view: Revit exports
+        them all in a single pass. Returns a caption followed by the image
+        for each view.
+
+        Args:
+            view_names: Names of the views to export
+            all_sheets: Export every sheet instead of view_names, 50 per call
+            offset: With all_sheets, index of the first sheet to export; pass
+                the offset reported at the end of the previous call
+            pixel_size: Image width in pixels, 64-8192
+            image_format: "png", "jpeg" or "bmp"
+            resolution: 72, 150, 300 or 600 DPI
+            ctx: MCP context for logging
+        """
+        data = {
+            "view_names": view_names or [],
+            "all_sheets": all_sheets,
+            "offset": offset,
+            "pixel_size": pixel_size,
+            "format": image_format,
+            "resolution": resolution,
+        }
+        response = await revit_post("/get_views/", data, ctx, background=True)
+        if not isinstance(response, dict) or "images" not in response:
+            return [format_response(response)]
+
+        content = []
+        for image in response["images"]:
+            content.append(
+                "{} ({}x{})".format(image["view_name"], image["width"], image["height"])
+            )
+            content.append(
+                Image(
+                    data=base64.b64decode(image["image_data"]),
+                    format=image["content_type"][6:],
+                )
+            )
+        for error in response.get("errors", []):
+            content.append(
+                "Could not export {}: {}".format(
+                    error.get("view_name") or error.get("view_id"), error["error"]
+                )
+            )
+        if response.get("next_offset") is not None:
+            content.append(
+                "Exported sheets {}-{} of {}; call again with offset={} for the rest".format(
+                    response["offset"] + 1,
+                    response["offset"] + response["limit"],
+                    response["total"],
+                    response["next_offset"],
+                )
+            )
+        return content
+
+    @mcp.tool()
+    async def list_revit_views(
+        view_type: str = None, limit: int = 200, ctx: Context = None
+    ) -> str:
+        """
+        Get a list of all exportable views in the current Revit model
+
+        Views are read from Revit page by page and summarized as they
+        arrive, so only the first `limit` names are kept, plus per-type counts.
+
+        Args:
+            view_type: Only list this type: floor_plans, ceiling_plans, elevations,
+                sections, 3d_views, drafting_views, schedules or other
+            limit: Maximum number of view names to list (default: 200)
+            ctx: MCP context for logging
+        """
+        views_by_type = {}
+        counts_by_type = {}
+        listed = 0
+        try:
+            async with aclosing(revit_stream("/list_views/", ctx)) as views:
+                async for view in views:
+                    if view_type and view["view_type"] != view_type:
+                        continue
+                    counts_by_type[view["view_type"]] = (
+                        counts_by_type.get(view["view_type"], 0) + 1
+                    )
+                    if listed < limit:
+                        views_by_type.setdefault(view["view_type"], []).append(
+                            view["name"]
+                        )
+                        listed += 1
+        except Exception as e:
+            return "Error listing views: {}".format(str(e))
+
+        total = sum(counts_by_type.values())
+        lines = ["=== EXPORTABLE VIEWS ({} of {} listed) ===".format(listed, total)]
+        for type_key in sorted(counts_by_type):
+            lines.append("{} ({}):".format(type_key, counts_by_type[type_key]))
+            for name in sorted(views_by_type.get(type_key, [])):
+                lines.append("  - {}".format(name))
+        return "\n".join(lines)
 
     @mcp.tool()
     async def get_current_view_info(ctx: Context = None) -> str:
@@ -40,21 +198,53 @@ def register_view_tools(mcp, revit_get, revit_post, revit_image):
         return format_response(response)
 
     @mcp.tool()
-    async def get_current_view_elements(ctx: Context = None) -> str:
+    async def get_current_view_elements(
+        category: str = None,
+        limit: int = 200,
+        offset: int = 0,
+        cursor: str = None,
+        include_summary: bool = True,
+        ctx: Context = None,
+    ) -> str:
         """
-        Get all elements visible in the currently active view in Revit.
+        Get elements visible in the currently active view in Revit, one page at a time.
 
         Returns detailed information about each element including:
         - Element ID, name, and type
         - Category and category ID
         - Level information (if applicable)
         - Location information (point or curve)
-        - Summary statistics grouped by category
+        - Summary statistics grouped by category (covering all matching elements)
+
+        Large views can contain tens of thousands of elements, so results are
+        paged. Pass the returned next_cursor back as cursor to get the next page.
+
+        Args:
+            category: Only return elements of this category, or comma-separated
+                categories (e.g., "Walls" or "Walls,Doors")
+            limit: Maximum number of elements to return (default: 200)
+            offset: Number of elements to skip (ignored when cursor is given)
+            cursor: next_cursor value from the previous page
+            include_summary: Include per-category counts for the whole view
+            ctx: MCP context for logging
 
         This is useful for understanding what elements are currently visible
         and analyzing the content of the active view.
         """
+        params = {"limit": str(limit)}
+        if category:
+            params["category"] = category
+        if cursor:
+            params["cursor"] = cursor
+        elif offset:
+            params["offset"] = str(offset)
+        if not include_summary:
+            params["include_summary"] = "false"
+
         if ctx:
             ctx.info("Getting elements in current view...")
-        response = await revit_get("/current_view_elements/", ctx)
+        response = await revit_get("/current_view_elements/", ctx, params=params)
+        if isinstance(response, dict) and response.get("status") == "success":
+            # format_response would drop the elements and paging fields
+            return json.dumps(response, indent=2)
         return format_response(response)